@@ -17,7 +17,13 @@ setup(
     packages=find_packages(where="src"),
     zip_safe=False,
     include_package_data=True,
-    install_requires=["click>=7.0", "requests>=2.23.0", "python-frontmatter>=0.5.0", "regex==2021.3.17"],
+    install_requires=["click>=7.0", "requests>=2.23.0", "python-frontmatter>=0.5.0"],
+    extras_require={
+        "http2": ["httpx[http2]>=0.18.0"],
+        "async": ["httpx>=0.18.0"],
+        "watch": ["watchdog>=2.0.0"],
+        "images": ["Pillow>=7.0.0"],
+    },
     entry_points={"console_scripts": ["markdown_to_devto = markdown_to_devto.cli:cli"]},
     classifiers=[
         "Programming Language :: Python",
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+r"""The dev.to accounts we publish to. The articles are read (and their images uploaded) once, then published to every
+account at the same time. Each account has its own `HTTPClient`, rate limit (dev.to rate limits each API key
+separately), articles on dev.to, publish manifest and journal.
+
+When publishing to more than one account, each account is named using a short hash of its API key (so the API key is
+never logged). The first account keeps the original paths of its publish manifest and journal (so adding an account
+doesn't change them), the paths of the other accounts include their name, i.e. `.devto_manifest.1a2b3c4d.db`.
+
+Example:
+    ::
+
+        $ accounts = [Account(api_key, name=get_account_name(api_key)) for api_key in ["AKEY", "BKEY"]]
+        $ manifest_path = get_account_path(".devto_manifest.db", accounts[1].name)
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import hashlib
+import os
+
+from .rate_limiter import TokenBucket
+from .retry import RetryPolicy
+
+
+class Account:
+    def __init__(self, api_key, name=None, max_retries=3):
+        self.api_key = api_key
+        self.name = name
+        self.rate_limiter = TokenBucket(capacity=10, period=30)
+        self.retry_policy = RetryPolicy(max_retries=max_retries)
+        self.http_client = None
+        self.manifest = None
+        self.journal = None
+        self.fingerprints = {}
+        self.devto_articles = None
+        self.remote_articles = None
+        self.articles_to_upload = {}
+
+    def __repr__(self):
+        return f"Account(name={self.name!r})"
+
+
+def get_account_name(api_key):
+    """Gets a name for an account, which doesn't reveal its API key.
+
+    Args:
+        api_key (str): The dev.to API key of the account.
+
+    Returns:
+        str: The name of the account, the same API key always has the same name.
+
+    """
+    return hashlib.blake2b(api_key.encode("utf-8"), digest_size=4).hexdigest()
+
+
+def get_account_path(path, name):
+    """Gets the path of a file which belongs to an account, i.e. its publish manifest.
+
+    Args:
+        path (str): The path of the file, if None the file isn't saved.
+        name (str): The name of the account, if None (i.e. we are only publishing to one account) the path is
+            unchanged.
+
+    Returns:
+        str: The path with the name of the account added before the extension.
+
+    """
+    if not path or not name:
+        return path
+
+    root, extension = os.path.splitext(path)
+    return f"{root}.{name}{extension}"
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+r"""An asyncio counterpart to the `HTTPClient`, it can be used to get current articles, update and create articles and
+upload images to Imgur without blocking the event loop. It uses `httpx` (`pip install markdown-to-devto[async]`).
+
+It shares the same rate limiter (`TokenBucket`) and retry policy (`RetryPolicy`) as the `HTTPClient`.
+
+Example:
+    ::
+
+        $ devto = AsyncHTTPClient(devto_api_key=12345678)
+        $ articles = await devto.get_articles()
+        $ await devto.close()
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import asyncio
+import logging
+import os
+
+from .http_client import DEVTO_URL
+from .http_client import IDEMPOTENT_METHODS
+from .http_client import IMGUR_URL
+from .http_client import HTTPClient
+from .remote import RemoteArticle
+from .remote import add_checksum
+from .retry import RetryPolicy
+from .utils import exceptions
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncHTTPClient:
+    def __init__(
+        self,
+        devto_api_key=None,
+        imgur_client_id=None,
+        rate_limiter=None,
+        pool_size=10,
+        retry_policy=None,
+        client=None,
+        devto_url=DEVTO_URL,
+        imgur_url=IMGUR_URL,
+    ):
+        import httpx
+
+        self.httpx = httpx
+        self.devto_api_key = devto_api_key
+        self.devto_url = devto_url.rstrip("/")
+        self.imgur_url = imgur_url.rstrip("/")
+        self.imgur_client_id = imgur_client_id
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        self.client = client or httpx.AsyncClient(limits=limits)
+
+    async def get_articles(self):
+        """Gets all the articles published on dev.to under your account, see `iter_articles`.
+
+        Returns:
+            dict: Where the key is the article title and values are the `RemoteArticle`, without its markdown.
+
+        """
+        return {article.title: article async for article in self.iter_articles()}
+
+    async def iter_articles(self):
+        """Gets the articles published on dev.to under your account, a page at a time.
+        The API uses pagination, so we keep querying the API and incrementing the page number until we
+        get an empty page.
+
+        Yields:
+            RemoteArticle: Each article on dev.to, without its markdown.
+
+        """
+        page = 1
+        url = f"{self.devto_url}/articles/me/all"
+        while True:
+            current_articles = await self._make_http_request(
+                method="get", url=url, params={"page": page, "per_page": 200}, headers={"api-key": self.devto_api_key}
+            )
+            if not current_articles:
+                break
+
+            page += 1
+            for article in current_articles:
+                yield RemoteArticle.from_api(article)
+
+    async def update_article(self, article_id, article_data):
+        """Update an already existing article on dev.to.
+
+        Args:
+            article_id (int): The article id on dev.to we are trying to update.
+            article_data (dict): The "new" article data we are updating on dev.to, such as content.
+
+        """
+        body_markdown = add_checksum(article_data["content"], article_data.get("checksum"))
+        data = {"article": {"title": article_data.get("title"), "body_markdown": body_markdown}}
+        url = f"{self.devto_url}/articles/{article_id}"
+        headers = {"api-key": self.devto_api_key}
+        await self._wait_for_rate_limit()
+        response = await self._make_http_request(method="put", url=url, json=data, headers=headers)
+        return response
+
+    async def create_article(self, article_data):
+        """Create a new article on dev.to.
+
+        Args:
+            article_data (dict): The article data we are creating on dev.to, such as content.
+
+        """
+        body_markdown = add_checksum(article_data["content"], article_data.get("checksum"))
+        data = {"article": {"title": article_data.get("title"), "body_markdown": body_markdown}}
+        url = f"{self.devto_url}/articles"
+        headers = {"api-key": self.devto_api_key}
+        await self._wait_for_rate_limit()
+        response = await self._make_http_request(method="post", url=url, json=data, headers=headers)
+        return response
+
+    async def upload_image(self, local_path):
+        """Uploads an image to Imgur (as an anonymouse image).
+
+        Args:
+            local_path (str): The path to the image you want to upload..
+
+        Returns:
+            str: URL on imgur where the image was uploaded.
+
+        """
+        url = f"{self.imgur_url}/3/upload"
+        headers = {"Authorization": f"Client-ID {self.imgur_client_id}"}
+        image_path = os.path.join(os.getcwd(), local_path)
+        with open(image_path, "rb") as image:
+            response = await self._make_http_request(method="post", url=url, headers=headers, files={"image": image})
+        link = response["data"]["link"]
+        return link
+
+    async def close(self):
+        """Closes the connection pools used by the client."""
+        await self.client.aclose()
+
+    async def _wait_for_rate_limit(self):
+        """Waits until the rate limiter allows us to publish another article."""
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async()
+
+    async def _make_http_request(self, method, url, idempotent=None, **kwargs):
+        """Make a HTTP request to dev.to (or Imgur), retrying it if it fails and it's safe to send again.
+
+        Args:
+            method (str): The HTTP method/verb to use i.e. "post", "get".
+            url (str): The URL/endpoint to send the HTTP request to.
+            idempotent (bool): If the request is safe to send more than once, defaults to True for GET/PUT/DELETE.
+            **kwargs: Extra parameters to use with "httpx" such as `params` or `json`.
+
+        Raises:
+            HTTPConnextionException: When there are connection issues or the request times out.
+
+        """
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            HTTPClient._rewind_files(kwargs.get("files"))
+            try:
+                response = await self.client.request(method.upper(), url, timeout=30, **kwargs)
+            except (self.httpx.TimeoutException, self.httpx.TransportError) as e:
+                if not self.retry_policy.should_retry(attempt, idempotent):
+                    raise exceptions.HTTPConnectionException(msg=e)
+
+                retry_after = None
+            else:
+                if not self.retry_policy.should_retry(attempt, idempotent, status_code=response.status_code):
+                    break
+
+                retry_after = response.headers.get("Retry-After")
+
+            delay = self.retry_policy.get_delay(attempt, retry_after)
+            self.retry_policy.count_retry(delay)
+            await asyncio.sleep(delay)
+            logger.warning(f"Retried {method.upper()} request to {url} after waiting {delay:.1f} seconds.")
+            attempt += 1
+
+        data = response.json()
+        HTTPClient._handle_response(status_code=response.status_code, response_json=data)
+        return data
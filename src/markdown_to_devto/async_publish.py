@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+r"""An asyncio driver for publishing articles, for when the tool is used inside an asyncio service. It does the same
+thing as the `cli`, but every article (and every image) is uploaded on one event loop, sharing the rate limit of the
+`AsyncHTTPClient`. It returns the same results as `publish_articles` in the `cli`.
+
+Example:
+    ::
+
+        $ http_client = AsyncHTTPClient(devto_api_key=12345678, rate_limiter=TokenBucket())
+        $ articles = get_local_articles(get_article_paths(None, "articles/", []))
+        $ devto_articles = await http_client.get_articles()
+        $ published = await publish_articles_async(articles, devto_articles, http_client, AsyncImageUploader(http_client))
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import asyncio
+import logging
+import os
+
+from .cli import check_if_article_requires_update
+from .cli import get_local_image_paths
+from .cli import log_upload_error
+from .cli import replace_image_links
+from .utils import exceptions
+from .utils.hashing import hash_file
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncImageUploader:
+    def __init__(self, http_client, max_workers=4, image_cache=None):
+        self.http_client = http_client
+        self.max_workers = max_workers
+        self.image_cache = image_cache
+        self._semaphore = None
+        self._uploads = {}
+
+    async def upload_images(self, image_paths):
+        """Uploads images to Imgur, every image is uploaded even if some of the others fail.
+
+        Args:
+            image_paths (list): The paths of the local images to upload.
+
+        Raises:
+            ImageUploadException: If any of the images failed to upload, after all of them have been attempted.
+
+        Returns:
+            dict: Where the key is the local path of the image and the value is the link on Imgur.
+
+        """
+        tasks = [self._submit(image_path) for image_path in image_paths]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        links, failed_images = {}, {}
+        for image_path, result in zip(image_paths, results):
+            if isinstance(result, (exceptions.HTTPException, OSError)):
+                logger.error(f"Failed to upload image at {image_path}, {result}.")
+                failed_images[image_path] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                links[image_path] = result
+
+        if failed_images:
+            raise exceptions.ImageUploadException(msg=failed_images)
+
+        return links
+
+    def _submit(self, image_path):
+        """Submits an image to be uploaded, if the image is already being (or has been) uploaded we reuse that
+        upload. Failed uploads are not reused so they can be retried.
+
+        Args:
+            image_path (str): The path of the local image to upload.
+
+        Returns:
+            asyncio.Task: Which will resolve to the link of the image on Imgur.
+
+        """
+        key = os.path.abspath(image_path)
+        task = self._uploads.get(key)
+        if task is None or (task.done() and task.exception()):
+            task = asyncio.ensure_future(self._upload_image(image_path))
+            self._uploads[key] = task
+
+        return task
+
+    async def _upload_image(self, image_path):
+        """Uploads an image to Imgur, unless an image with the same contents is already in the image cache. At most
+        `max_workers` images are uploaded at the same time.
+
+        Args:
+            image_path (str): The path of the local image to upload.
+
+        Returns:
+            str: The link of the image on Imgur.
+
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+
+        async with self._semaphore:
+            digest = None
+            if self.image_cache:
+                digest = await asyncio.get_event_loop().run_in_executor(None, hash_file, image_path)
+                link = self.image_cache.get(digest)
+                if link:
+                    logger.debug(f"Image at {image_path} has already been uploaded to {link}.")
+                    return link
+
+            logger.debug(f"Uploading image at {image_path}.")
+            link = await self.http_client.upload_image(image_path)
+            if digest:
+                self.image_cache.record(digest, link)
+            return link
+
+
+async def publish_articles_async(articles_to_upload, devto_articles, http_client, image_uploader=None):
+    """Uploads all the articles to dev.to at the same time, the HTTP client's rate limiter makes sure we don't
+    publish articles faster than dev.to allows. If an article fails to upload the error is logged and we carry
+    on uploading the other articles.
+
+    Args:
+        articles_to_upload (dict): key is the title of the article and value is details.
+        devto_articles (dict): Where the key is the article title and values are the `RemoteArticle` on dev.to.
+        http_client (AsyncHTTPClient): Used to make HTTP requests to dev.to API.
+        image_uploader (AsyncImageUploader): Used to upload local images to Imgur, if None images will not be uploaded.
+
+    Returns:
+        dict: Where the key is the title and the value is the dev.to id of each article that was uploaded successfully.
+
+    """
+    titles = list(articles_to_upload)
+    tasks = []
+    for article_title in titles:
+        logger.info(f"Uploading Article with title {article_title}.")
+        devto_article = devto_articles.get(article_title)
+        article_data = articles_to_upload[article_title]
+        tasks.append(upload_article_async(article_data, devto_article, http_client, image_uploader))
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    published = {}
+    for article_title, result in zip(titles, results):
+        if isinstance(result, (exceptions.HTTPException, exceptions.ImageUploadException, OSError)):
+            log_upload_error(result)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            published[article_title] = result
+
+    return published
+
+
+async def upload_article_async(article, devto_article, http_client, image_uploader=None):
+    """Uploads the article to dev.to, the same as `upload_article` in the `cli`. If the article exists we
+    will only update it if the checksums don't match, else we create the article.
+
+    Args:
+        article (frontmatter.Post): The article you want to upload.
+        devto_article (RemoteArticle): The existing dev.to article (matched using title), None if it doesn't exist.
+        http_client (AsyncHTTPClient): Used to make HTTP requests to dev.to API.
+        image_uploader (AsyncImageUploader): Used to upload local images to Imgur, if None images will not be uploaded.
+
+    Returns:
+        int: The id of the article on dev.to.
+
+    """
+    if devto_article:
+        logger.info("Article already exists on dev.to.")
+        checksum_matched = check_if_article_requires_update(
+            devto_checksum=devto_article.checksum, local_checksum=article["checksum"]
+        )
+
+        if not checksum_matched:
+            if image_uploader:
+                article["content"] = await upload_local_images_async(article, image_uploader)
+
+            logger.info("Checksum does not match, article needs to be updated on dev.to.")
+            response = await http_client.update_article(devto_article.id, article)
+            logger.info(f"Updating article on dev.to, at {response['url']}")
+
+        article_id = devto_article.id
+    else:
+        if image_uploader:
+            article["content"] = await upload_local_images_async(article, image_uploader)
+
+        response = await http_client.create_article(article)
+        logger.info(f"Creating article on dev.to, at {response['url']}")
+        article_id = response.get("id")
+
+    return article_id
+
+
+async def upload_local_images_async(article_data, image_uploader):
+    """Will upload all local images (and the cover image) to imgur. Then update the references within the markdown.
+
+    Args:
+        article_data (frontmatter): Article data.
+        image_uploader (AsyncImageUploader): Used to upload images to Imgur.
+
+    Returns:
+        str: The content with the local images replaced with links on Imgur.
+
+    """
+    logger.info("Uploading images to Imgur.")
+    content, cover_image = article_data["content"], article_data["cover_image"]
+    image_paths = get_local_image_paths(article_data)
+    cover_path = os.path.join(article_data["path"], cover_image)
+    has_local_cover = os.path.isfile(cover_path)
+
+    uploads = list(image_paths.values()) + ([cover_path] if has_local_cover else [])
+    if not uploads:
+        return content
+
+    uploaded_images = await image_uploader.upload_images(uploads)
+    links = {local_path: uploaded_images[image_path] for local_path, image_path in image_paths.items()}
+    content = replace_image_links(content, links)
+    if has_local_cover:
+        content = content.replace(f"cover_image: {cover_image}", f"cover_image: {uploaded_images[cover_path]}")
+    return content
@@ -8,8 +8,9 @@ It uses the title in the frontmatter to determine "uniqueness" of an article. Ev
 a checksum field. So in future it will only upload an article if the checksums are different i.e. the content has
 changed.
 
-The script will wait 3 seconds between publishing articles because the dev.to API rate limits us to only publish 10
-articles in 30 seconds. This way we can make sure we don't hit that limit.
+Articles are published concurrently by a pool of workers. The dev.to API rate limits us to only publish 10 articles
+in 30 seconds, so every create/update has to take a token from a shared token bucket. This way we can make sure we
+don't hit that limit.
 
 Example:
     ::
@@ -20,34 +21,73 @@ Example:
     http://google.github.io/styleguide/pyguide.html
 
 """
+import copy
+import functools
 import hashlib
-import io
 import logging
 import os
 import re
 import sys
-import time
-from pathlib import Path
 
 import click
-import frontmatter
-import regex
 
+from .account import Account
+from .account import get_account_name
+from .account import get_account_path
+from .fingerprint import get_article_dependencies
+from .fingerprint import get_changed_paths
+from .fingerprint import get_settings
+from .fingerprint import record_fingerprint
+from .http_client import DEVTO_URL
+from .http_client import IMGUR_URL
 from .http_client import HTTPClient
+from .image_cache import ImageCache
+from .image_optimizer import ImageOptimizer
+from .image_uploader import ImageUploader
+from .journal import Journal
+from .manifest import Manifest
+from .metrics import Metrics
+from .profiler import Profiler
+from .profiler import time_step
+from .remote import RemoteArticle
+from .transform import CODE_TITLE_IN_MARKDOWN
+from .transform import IMAGE
+from .transform import code_file_cache
+from .transform import tokenize
+from .transform import transform_content
+from .transport import HTTPXTransport
+from .transport import RequestsTransport
 from .utils import exceptions
+from .utils.hashing import hash_file
+from .walker import walk_articles
+from .watcher import FileWatcher
 
-logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 @click.command()
-@click.option("--devto-api-key", "-k", required=True, envvar="DEVTO_API_KEY", help="Your dev.to API Key.")
+@click.option(
+    "--devto-api-key",
+    "-k",
+    required=True,
+    multiple=True,
+    envvar="DEVTO_API_KEY",
+    help="Your dev.to API Key, pass it more than once (or separate the keys with spaces) to publish to several accounts.",
+)
 @click.option("--imgur-id", "-a", envvar="IMGUR_CLIENT_ID", help="If set will auto upload local images on imgur.")
+@click.option("--devto-url", default=DEVTO_URL, envvar="DEVTO_URL", help="The base URL of the dev.to API.")
+@click.option("--imgur-url", default=IMGUR_URL, envvar="IMGUR_URL", help="The base URL of the Imgur API.")
 @click.option("--file", "-m", type=click.Path(exists=True), help="The markdown file to publish.")
 @click.option("--folder", "-f", type=click.Path(exists=True), help="Path to folder to publish markdown files from.")
 @click.option(
     "--ignore", "-i", multiple=True, help="Folder to ignore and not publish markdown files from i.e. .history."
 )
+@click.option(
+    "--exclude",
+    "-e",
+    multiple=True,
+    help="gitignore-style pattern of folders/files to not publish i.e. drafts/, patterns are also read from .devtoignore.",
+)
 @click.option(
     "--output",
     "-o",
@@ -59,150 +99,1010 @@ logger = logging.getLogger(__name__)
     "-s",
     help="If you're are using the Gatsby plugin to allow local links between articles. For dev.to we will need to replace with the link to your blog.",
 )
+@click.option(
+    "--manifest",
+    "-d",
+    type=click.Path(dir_okay=False),
+    envvar="DEVTO_MANIFEST",
+    help="Path to the local publish manifest, if an article's checksum hasn't changed it will not be uploaded.",
+)
+@click.option(
+    "--journal",
+    type=click.Path(dir_okay=False),
+    envvar="DEVTO_JOURNAL",
+    help="Keep a journal of the articles and images uploaded during the run at this path, so a run which fails can be continued with --resume. It's removed if the run doesn't fail.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="With --journal, carry on from where the last run stopped, articles and images in the journal will not be uploaded again.",
+)
+@click.option(
+    "--verify-remote", is_flag=True, help="Rebuild the local publish manifest using the articles currently on dev.to."
+)
+@click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of processes to use to read and transform local articles.",
+)
+@click.option(
+    "--workers",
+    "-w",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Number of articles to upload at the same time, uploads are still rate limited to 10 every 30 seconds.",
+)
+@click.option(
+    "--image-workers",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Number of images to upload to imgur at the same time, shared across all articles.",
+)
+@click.option(
+    "--pool-size",
+    type=click.IntRange(min=1),
+    help="Number of connections to keep open to each host, defaults to the number of workers plus image workers.",
+)
+@click.option(
+    "--max-retries",
+    default=3,
+    type=click.IntRange(min=0),
+    help="How many times to retry a failed request, if it's safe to do so.",
+)
+@click.option("--http2", is_flag=True, help="Send requests over HTTP/2, requires `httpx[http2]` to be installed.")
+@click.option(
+    "--image-cache",
+    type=click.Path(dir_okay=False),
+    envvar="DEVTO_IMAGE_CACHE",
+    help="Path to the image cache, images with the same contents are only ever uploaded to imgur once.",
+)
+@click.option(
+    "--prune-image-cache",
+    type=click.IntRange(min=0),
+    help="Remove images from the image cache which haven't been used in this many days.",
+)
+@click.option(
+    "--invalidate-image",
+    multiple=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Remove an image from the image cache, so it will be uploaded to imgur again.",
+)
+@click.option(
+    "--optimize-images",
+    is_flag=True,
+    help="Resize and recompress images before uploading them to imgur, requires `Pillow` to be installed.",
+)
+@click.option(
+    "--max-image-width",
+    default=1000,
+    type=click.IntRange(min=1),
+    show_default=True,
+    help="With --optimize-images, images wider than this are resized.",
+)
+@click.option(
+    "--image-format",
+    type=click.Choice(["png", "jpeg", "webp"]),
+    help="With --optimize-images, convert images to this format, by default the format isn't changed.",
+)
+@click.option(
+    "--image-quality",
+    default=85,
+    type=click.IntRange(min=1, max=100),
+    show_default=True,
+    help="With --optimize-images, the quality to save JPEG and WebP images with.",
+)
+@click.option(
+    "--optimized-images",
+    default=".devto_optimized_images",
+    type=click.Path(file_okay=False),
+    envvar="DEVTO_OPTIMIZED_IMAGES",
+    show_default=True,
+    help="With --optimize-images, the folder to save the optimized images in, so they are only optimized once.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep running and publish articles again when they (or the code files and images they use) change.",
+)
+@click.option(
+    "--debounce",
+    default=1.0,
+    type=click.FloatRange(min=0),
+    help="With --watch, how many seconds to wait after a file changes for other changes, before publishing.",
+)
+@click.option(
+    "--poll", is_flag=True, help="With --watch, poll for changes rather than using watchdog (i.e. inotify)."
+)
+@click.option(
+    "--report", type=click.Path(dir_okay=False), help="Save a JSON report of the run, i.e. how long each phase took."
+)
+@click.option(
+    "--prometheus-textfile",
+    type=click.Path(dir_okay=False),
+    help="Save the metrics of the run in the Prometheus text format, for the node exporter's textfile collector.",
+)
+@click.option(
+    "--profile",
+    type=click.Path(file_okay=False),
+    help="Profile the run and save the profile (pstats and collapsed stacks for flame graphs), the peak memory of each phase and how long each step took to read each article in this folder.",
+)
 @click.option(
     "--log-level", "-l", default="INFO", type=click.Choice(["DEBUG", "INFO", "ERROR"]), help="Log level for the script."
 )
-def cli(devto_api_key, imgur_id, file, folder, ignore, output, site, log_level):
+def cli(
+    devto_api_key,
+    imgur_id,
+    devto_url,
+    imgur_url,
+    file,
+    folder,
+    ignore,
+    exclude,
+    output,
+    site,
+    manifest,
+    journal,
+    resume,
+    verify_remote,
+    jobs,
+    workers,
+    image_workers,
+    pool_size,
+    max_retries,
+    http2,
+    image_cache,
+    prune_image_cache,
+    invalidate_image,
+    optimize_images,
+    max_image_width,
+    image_format,
+    image_quality,
+    optimized_images,
+    watch,
+    debounce,
+    poll,
+    report,
+    prometheus_textfile,
+    profile,
+    log_level,
+):
     """A CLI tool for publish markdown articles to dev.to."""
+    logging.basicConfig(stream=sys.stdout, level=logging.INFO)
     logger.setLevel(log_level)
-    local_article_paths = get_article_paths(file, folder, ignore)
-    articles_to_upload = get_local_articles(local_article_paths, site)
-    http_client = HTTPClient(devto_api_key=devto_api_key, imgur_client_id=imgur_id)
+    metrics = Metrics()
+    accounts = get_accounts(devto_api_key, max_retries)
+    if report or prometheus_textfile:
+        click.get_current_context().call_on_close(
+            functools.partial(save_metrics, metrics, accounts, report, prometheus_textfile)
+        )
+    profiler = Profiler(profile)
+    if profiler.enabled:
+        profiler.start()
+        click.get_current_context().call_on_close(profiler.stop)
 
-    try:
-        devto_articles = http_client.get_articles()
-    except exceptions.HTTPException as error:
-        logger.error(f"Failed to get articles on dev.to, {error}.")
+    if resume and not journal:
+        logger.error("--resume needs the --journal of the run to resume.")
         sys.exit(1)
 
-    start = time.time()
-    articles_uploaded = 0
-    for article_title, article_data in articles_to_upload.items():
-        devto_article = devto_articles.get(article_title, {})
-        logger.info(f"Uploading Article with title {article_title}.")
+    uploaded_images = ImageCache(image_cache)
+    if prune_image_cache is not None or invalidate_image:
+        update_image_cache(uploaded_images, prune_image_cache, invalidate_image)
+        if not file and not folder:
+            uploaded_images.close()
+            return
+
+    for account in accounts:
+        # The first account keeps the original paths, so adding an account doesn't lose its publish manifest.
+        path_name = account.name if account is not accounts[0] else None
+        account.manifest = Manifest(get_account_path(manifest, path_name))
+        account.journal = Journal(get_account_path(journal, path_name), resume=resume)
+        click.get_current_context().call_on_close(account.journal.close)
+        resume_from_journal(account.journal, account.manifest, uploaded_images)
+
+    with metrics.phase("scan"), profiler.phase("scan"):
+        article_paths = list(get_article_paths(file, folder, ignore, exclude))
+        local_article_paths = get_accounts_changed_paths(
+            article_paths, accounts, get_settings(site), force=verify_remote or watch, metrics=metrics
+        )
+    if len(article_paths) > len(local_article_paths):
+        skipped = len(article_paths) - len(local_article_paths)
+        logger.info(f"Skipped reading {skipped} articles which haven't changed since they were last published.")
+
+    with metrics.phase("read"), profiler.phase("read"):
+        local_articles = get_local_articles(local_article_paths, jobs, metrics, profiler)
+        title_paths = get_title_holder_paths(local_articles, article_paths, local_article_paths, accounts)
+        if title_paths:
+            title_articles = get_local_articles(title_paths, jobs, metrics, profiler)
+            local_articles = merge_local_articles(article_paths, local_articles, title_articles)
+    pool_size = pool_size or workers * len(accounts) + image_workers
+    transport = HTTPXTransport(pool_size=pool_size) if http2 else RequestsTransport(pool_size=pool_size)
+    for account in accounts:
+        account.http_client = HTTPClient(
+            devto_api_key=account.api_key,
+            imgur_client_id=imgur_id,
+            rate_limiter=account.rate_limiter,
+            transport=transport,
+            retry_policy=account.retry_policy,
+            devto_url=devto_url,
+            imgur_url=imgur_url,
+            metrics=metrics,
+        )
+        if verify_remote:
+            with metrics.phase("get_articles"), profiler.phase("get_articles"):
+                account.devto_articles = get_devto_articles(account.http_client)
+            account.manifest.rebuild(account.devto_articles, local_articles)
+
+        account.articles_to_upload = get_changed_articles(local_articles, account.manifest)
+        for title, article in local_articles.items():
+            if title not in account.articles_to_upload:
+                metrics.record_article(article["source"], "unchanged", title=title, account=account.name)
+                record_fingerprint(
+                    account.manifest, article["source"], account.fingerprints.pop(article["source"], None)
+                )
+
+    if not any(account.articles_to_upload for account in accounts):
+        logger.info("No articles have changed since they were last published.")
+        if not watch:
+            for account in accounts:
+                account.journal.close(remove=True)
+                account.manifest.close()
+            uploaded_images.close()
+            transport.close()
+            return
+
+    for account in accounts:
+        if account.devto_articles is None and watch:
+            with metrics.phase("get_articles"), profiler.phase("get_articles"):
+                account.devto_articles = get_devto_articles(account.http_client)
+        elif account.devto_articles is None:
+            account.devto_articles, account.remote_articles = {}, account.http_client.iter_articles()
+
+    image_uploader = image_optimizer = None
+    if imgur_id and optimize_images:
+        image_optimizer = ImageOptimizer(
+            optimized_images, max_width=max_image_width, image_format=image_format, quality=image_quality
+        )
+    if imgur_id:
+        image_uploader = ImageUploader(
+            accounts[0].http_client,
+            max_workers=image_workers,
+            image_cache=uploaded_images,
+            journals=[account.journal for account in accounts],
+            image_optimizer=image_optimizer,
+        )
+
+    publish = functools.partial(
+        publish_to_accounts,
+        accounts,
+        functools.partial(
+            publish_and_record, image_uploader=image_uploader, workers=workers, output=output, metrics=metrics
+        ),
+    )
+    with metrics.phase("publish"), profiler.phase("publish"):
+        publish()
+
+    if watch:
+        file_watcher = FileWatcher(
+            debounce=debounce, polling=poll or None, ignore_folders=ignore, ignore_patterns=exclude
+        )
+        get_paths = functools.partial(get_article_paths, file, folder, ignore, exclude)
         try:
-            upload_article(article_data, devto_article, http_client)
-            if output:
-                save_article(output, article_data)
-            articles_uploaded += 1
-        except exceptions.HTTPException as error:
-            logger.error(f"Failed to upload, {error}.")
-        except FileNotFoundError as error:
-            logger.error(f"Failed to upload file, file doesn't exist, {error}.")
-        except OSError as error:
-            logger.error(f"Failed to upload file, cannot open file, {error}.")
+            watch_articles(file_watcher, get_paths, local_articles, publish, folders=[folder] if folder else [])
+        except KeyboardInterrupt:
+            logger.info("Stopped watching for changes.")
+        finally:
+            file_watcher.close()
+
+    retries = sum(account.retry_policy.retries for account in accounts)
+    if retries:
+        logger.info(f"Retried {retries} failed HTTP requests.")
+
+    if image_uploader:
+        image_uploader.close()
+    if image_optimizer:
+        image_optimizer.close()
+    for account in accounts:
+        failed = any(
+            article["outcome"] == "failed" and article.get("account") == account.name
+            for article in metrics.articles.values()
+        )
+        account.journal.close(remove=not failed)
+        account.manifest.close()
+    uploaded_images.close()
+    transport.close()
 
-        articled_uploaded, start = check_if_we_need_to_rate_limit(articles_uploaded, start)
 
+def get_accounts(api_keys, max_retries=3):
+    """Gets the dev.to accounts to publish to, each with its own rate limit and retry policy.
 
-def check_if_we_need_to_rate_limit(articles_uploaded, start):
-    """Dev.to only allows us to upload 10 articles every 30 seconds.
-    So we check if 10 articles have been uploaded then calculate
-    the time elapsed. If less than 30 seconds sleep until 30 seconds
-    have elapsed. If we do sleep/wait we can then reset the start time
-    and articles_uploaded number.
+    Args:
+        api_keys (tuple): The dev.to API key of each account, duplicate keys are ignored.
+        max_retries (int): How many times to retry a failed request, if it's safe to do so.
+
+    Returns:
+        list: The `Account`s, if there is only one account it isn't named.
+
+    """
+    api_keys = list(dict.fromkeys(api_keys))
+    if len(api_keys) == 1:
+        return [Account(api_keys[0], max_retries=max_retries)]
+
+    accounts = [Account(api_key, name=get_account_name(api_key), max_retries=max_retries) for api_key in api_keys]
+    logger.info(f"Publishing to {len(accounts)} dev.to accounts: {', '.join(account.name for account in accounts)}.")
+    return accounts
 
-    We stop for 35 seconds because various actions of the script before
-    we start uploading the very first article may taken a bit longer
-    than when we start timing.
+
+def get_accounts_changed_paths(article_paths, accounts, settings, force=False, metrics=None):
+    """Gets the paths of the articles which need to be read, because they have changed since they were last
+    published to at least one of the accounts (see `get_changed_paths`). Each account's fingerprints are kept, so
+    they can be recorded in its publish manifest once the article is published.
 
     Args:
-        articles_uploaded (int): Number of articles we have uploaded.
-        start (time.time): The time we started uploading articles at.
+        article_paths (list): The paths to all the local articles.
+        accounts (list): The `Account`s to publish to.
+        settings (dict): The settings which affect how articles are transformed, see `get_settings`.
+        force (bool): If True every article is read.
+        metrics (Metrics): Records the articles which haven't changed, if None nothing is recorded.
 
     Returns:
-        tuple: article we have uploaded and start time.
+        list: The paths of the articles to read, in the same order as `article_paths`.
 
     """
+    changed_paths = set()
+    for account in accounts:
+        account_paths, account.fingerprints = get_changed_paths(article_paths, account.manifest, settings, force=force)
+        account_paths = {str(path) for path in account_paths}
+        changed_paths.update(account_paths)
+        if metrics:
+            for path in account.fingerprints.keys() - account_paths:
+                metrics.record_article(path, "unchanged", account=account.name)
 
-    rate_limit_time = 35
-    if articles_uploaded == 10:
-        end = time.time()
-        time_elapsed = end - start
+    return [path for path in article_paths if str(path) in changed_paths]
 
-        if time_elapsed < rate_limit_time:
-            time.sleep(rate_limit_time - time_elapsed)
 
-        start = time.time()
-        articles_uploaded = 0
+def get_title_holder_paths(local_articles, article_paths, read_paths, accounts):
+    """Gets the paths of the articles which weren't read, but were last published with the title of an article which
+    was read. They have to be read too, so when more than one article has the same title the same article is always
+    published (the last one), rather than whichever one was read.
 
-    return articles_uploaded, start
+    Args:
+        local_articles (dict): key is the title of the article and value is details, of the articles which were read.
+        article_paths (list): The paths to all the local articles.
+        read_paths (list): The paths of the articles which were read.
+        accounts (list): The `Account`s to publish to.
 
+    Returns:
+        list: The paths of the articles to read, in the same order as `article_paths`.
+
+    """
+    read_paths = {str(path) for path in read_paths}
+    holder_paths = set()
+    for title in local_articles:
+        for account in accounts:
+            entry = account.manifest.get_by_title(title)
+            if entry and entry["path"] not in read_paths:
+                holder_paths.add(entry["path"])
+
+    return [path for path in article_paths if str(path) in holder_paths]
 
-def get_article_paths(file, folder, ignore_folders):
-    """Gets all the paths to the local markdown article. Either file or folder must be set. If the file is in the
-    ignore path it will not be uploaded.
+
+def merge_local_articles(article_paths, *articles):
+    """Merges articles read separately (see `get_local_articles`), if more than one article has the same title the
+    last one in `article_paths` is kept.
 
     Args:
-        file (str): Path to file.
-        folder (str): Path to folder.
-        ignore_folders (tuple): A list of folders to ignore markdown files in.
+        article_paths (list): The paths to all the local articles.
+        *articles (dict): key is the title of the article and value is details.
 
     Returns:
         dict: key is the title of the article and value is details.
 
     """
-    article_paths = []
-    if not file and not folder:
-        logger.error("File and folder cannot be both be empty.")
+    order = {str(path): index for index, path in enumerate(article_paths)}
+    merged_articles = [article for articles_data in articles for article in articles_data.values()]
+    merged_articles.sort(key=lambda article: order[article["source"]])
+    return {article["title"]: article for article in merged_articles}
+
+
+def publish_to_accounts(accounts, publish, articles_to_upload=None):
+    """Publishes the articles to every account at the same time. When there is more than one account each account
+    gets its own copy of the articles, as publishing an article updates it (i.e. the links to its images).
+
+    Args:
+        accounts (list): The `Account`s to publish to.
+        publish (callable): Uploads the articles to an account, see `publish_and_record`.
+        articles_to_upload (dict): key is the title of the article and value is details, if None the
+            `articles_to_upload` of each account are published.
+
+    """
+    import concurrent.futures
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(accounts), thread_name_prefix="account") as executor:
+        futures = []
+        for account in accounts:
+            articles = account.articles_to_upload if articles_to_upload is None else articles_to_upload
+            if len(accounts) > 1:
+                articles = {title: copy_article(article) for title, article in articles.items()}
+            futures.append(
+                executor.submit(
+                    publish,
+                    articles,
+                    account,
+                    save_output=account is accounts[0],
+                    remote_articles=account.remote_articles,
+                )
+            )
+            account.remote_articles = None
+
+        for future in futures:
+            future.result()
+
+
+def copy_article(article):
+    """Copies an article so it can be published to another account. Only the metadata is copied, as that is all
+    publishing an article changes, the `Post` itself can't be deep copied on Python 3.6 (it holds compiled regexes).
+
+    Args:
+        article (frontmatter.Post): The article to copy.
+
+    Returns:
+        frontmatter.Post: A shallow copy of the article with its own metadata.
+
+    """
+    article = copy.copy(article)
+    article.metadata = dict(article.metadata)
+    return article
+
+
+def publish_and_record(
+    articles_to_upload,
+    account,
+    image_uploader=None,
+    workers=4,
+    output=None,
+    save_output=True,
+    remote_articles=None,
+    metrics=None,
+):
+    """Uploads the articles to an account on dev.to (see `publish_articles`), then records each article which was
+    uploaded successfully in the account's publish manifest, journal and dev.to articles.
+
+    Args:
+        articles_to_upload (dict): key is the title of the article and value is details.
+        account (Account): The account to publish to.
+        image_uploader (ImageUploader): Used to upload local images to Imgur, if None images will not be uploaded.
+        workers (int): Number of articles to upload at the same time.
+        output (str): Where to save the articles after they have been transformed, if None they are not saved.
+        save_output (bool): If False the articles are not saved in `output`, i.e. they were saved when publishing
+            to another account.
+        remote_articles (iterator): The articles on dev.to as they are fetched, see `publish_articles`.
+        metrics (Metrics): Records whether each article was published or failed, if None nothing is recorded.
+
+    """
+    if account.name and articles_to_upload:
+        logger.info(f"Publishing {len(articles_to_upload)} articles to dev.to account {account.name}.")
+
+    known_articles = get_known_articles(articles_to_upload, account.manifest)
+    published_titles = set()
+    try:
+        for article_title, article_id in publish_articles(
+            articles_to_upload,
+            account.devto_articles,
+            account.http_client,
+            image_uploader,
+            workers,
+            remote_articles,
+            known_articles,
+        ):
+            published_titles.add(article_title)
+            article_data = articles_to_upload[article_title]
+            source = article_data.get("source", article_data["path"])
+            account.manifest.record(
+                path=source, title=article_title, article_id=article_id, checksum=article_data.get("checksum")
+            )
+            if account.journal:
+                account.journal.record_article(source, article_title, article_id, article_data.get("checksum"))
+            if account.fingerprints:
+                record_fingerprint(account.manifest, source, account.fingerprints.pop(source, None))
+            account.devto_articles[article_title] = RemoteArticle(
+                id=article_id, title=article_title, checksum=article_data.get("checksum") or ""
+            )
+            if output and save_output:
+                save_article(output, article_data)
+    finally:
+        if metrics:
+            for title, article_data in articles_to_upload.items():
+                outcome = "published" if title in published_titles else "failed"
+                metrics.record_article(
+                    article_data.get("source", article_data["path"]), outcome, title=title, account=account.name
+                )
+
+
+def watch_articles(file_watcher, get_paths, local_articles, publish, folders=()):
+    """Keeps running until interrupted, publishing articles again when they change. The articles are kept in memory
+    and only the articles which have changed (or whose code files or images have changed) are read again.
+
+    Args:
+        file_watcher (FileWatcher): Used to wait for files to change.
+        get_paths (callable): Gets the paths to all the local articles, see `get_article_paths`.
+        local_articles (dict): key is the title of the article and value is details, of every local article.
+        publish (callable): Uploads the articles, see `publish_to_accounts`.
+        folders (list): The folders containing the articles, new articles in these folders are also published.
+
+    """
+    article_index = {os.path.realpath(article["source"]): article for article in local_articles.values()}
+    article_dependencies = {source: get_article_dependencies(source) for source in article_index}
+    while True:
+        dependencies = {}
+        for source, dependency_paths in article_dependencies.items():
+            for dependency_path in dependency_paths:
+                dependencies.setdefault(dependency_path, set()).add(source)
+
+        file_watcher.watch(folders=folders, files=list(article_index) + list(dependencies))
+        logger.info("Watching for changes.")
+        changed_paths = file_watcher.get_changes()
+
+        articles_to_upload = get_updated_articles(changed_paths, get_paths(), article_index, dependencies)
+        for article in articles_to_upload.values():
+            source = os.path.realpath(article["source"])
+            article_dependencies[source] = get_article_dependencies(source)
+        for source in article_dependencies.keys() - article_index.keys():
+            del article_dependencies[source]
+
+        if articles_to_upload:
+            publish(articles_to_upload)
+
+
+def get_updated_articles(changed_paths, article_paths, article_index, dependencies):
+    """Reads the articles affected by the changed files again, updating the index of articles.
+
+    Args:
+        changed_paths (set): The (real) paths of the files which have changed.
+        article_paths (iterable): The paths to all the local articles.
+        article_index (dict): Where the key is the (real) path of an article and the value is its details.
+        dependencies (dict): Where the key is the (real) path of a code file or image and the value is the
+            (real) paths of the articles which use it.
+
+    Returns:
+        dict: key is the title of the article and value is details, of the articles which need to be published.
+
+    """
+    current_paths = {os.path.realpath(path): path for path in article_paths}
+    for removed_path in article_index.keys() - current_paths.keys():
+        logger.info(f"Article at {removed_path} has been removed.")
+        del article_index[removed_path]
+
+    dependants = set()
+    for changed_path in changed_paths:
+        dependants.update(dependencies.get(changed_path, ()))
+
+    affected_paths = [path for path in current_paths if path in changed_paths or path in dependants]
+    articles = get_local_articles([current_paths[path] for path in affected_paths])
+
+    updated_articles = {}
+    for title, article in articles.items():
+        source = os.path.realpath(article["source"])
+        previous_article = article_index.get(source)
+        article_index[source] = article
+        if previous_article and previous_article["checksum"] == article["checksum"] and source not in dependants:
+            logger.debug(f"Article {title} has not changed.")
+            continue
+
+        updated_articles[title] = article
+
+    return updated_articles
+
+
+def save_metrics(metrics, accounts, report=None, prometheus_textfile=None):
+    """Saves the metrics collected during the run, called when the CLI exits (even if it failed).
+
+    Args:
+        metrics (Metrics): The metrics collected during the run.
+        accounts (list): The `Account`s we published to, used to find how long we waited for their rate limits,
+            how many requests were retried and how long we waited to retry them.
+        report (str): Where to save the JSON report, if None it's not saved.
+        prometheus_textfile (str): Where to save the metrics in the Prometheus text format, if None it's not saved.
+
+    """
+    metrics.rate_limit_sleep = sum(account.rate_limiter.time_slept for account in accounts)
+    metrics.retry_sleep = sum(account.retry_policy.time_slept for account in accounts)
+    metrics.retries = sum(account.retry_policy.retries for account in accounts)
+    try:
+        if report:
+            metrics.write_report(report)
+            logger.info(f"Saved report of the run at {report}.")
+        if prometheus_textfile:
+            metrics.write_prometheus(prometheus_textfile)
+    except OSError as error:
+        logger.error(f"Failed to save the metrics of the run, {error}.")
+
+
+def publish_articles(
+    articles_to_upload,
+    devto_articles,
+    http_client,
+    image_uploader=None,
+    workers=4,
+    remote_articles=None,
+    known_articles=None,
+):
+    """Uploads the articles to dev.to using a pool of workers, the HTTP client's rate limiter makes sure we
+    don't publish articles faster than dev.to allows. If an article fails to upload the error is logged and
+    we carry on uploading the other articles.
+
+    If `remote_articles` is set the articles on dev.to are matched as they are fetched, so articles which already
+    exist start uploading while the next pages are fetched. We stop fetching articles once every article has been
+    matched. Articles which don't exist on dev.to are only created once all of the articles have been fetched.
+
+    Articles in `known_articles` (i.e. we know their id from a previous run) are updated directly using their id,
+    if they no longer exist on dev.to we fall back to matching them with the articles on dev.to.
+
+    Args:
+        articles_to_upload (dict): key is the title of the article and value is details.
+        devto_articles (dict): Where the key is the article title and values are the `RemoteArticle` on dev.to,
+            the articles in `remote_articles` are added to it.
+        http_client (HTTPClient): Used to make HTTP requests to dev.to API.
+        image_uploader (ImageUploader): Used to upload local images to Imgur, if None images will not be uploaded.
+        workers (int): Number of articles to upload at the same time.
+        remote_articles (iterator): The articles on dev.to as they are fetched (see `HTTPClient.iter_articles`), if
+            None `devto_articles` has all of the articles on dev.to.
+        known_articles (dict): Where the key is the article title and values are the `RemoteArticle` we published
+            the article as, see `get_known_articles`.
+
+    Yields:
+        tuple: The title and the dev.to id of each article that was uploaded successfully, as they finish.
+
+    """
+    import concurrent.futures
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+
+        def submit(article_title, devto_article):
+            logger.info(f"Uploading Article with title {article_title}.")
+            article_data = articles_to_upload[article_title]
+            future = executor.submit(upload_article, article_data, devto_article, http_client, image_uploader)
+            futures[future] = article_title
+
+        known_articles = known_articles or {}
+        titles_to_match = []
+        for article_title in articles_to_upload:
+            devto_article = known_articles.get(article_title) or devto_articles.get(article_title)
+            if devto_article:
+                submit(article_title, devto_article)
+            else:
+                titles_to_match.append(article_title)
+
+        failed = False
+        if remote_articles is not None:
+            titles_to_match, failed = match_remote_articles(titles_to_match, devto_articles, remote_articles, submit)
+
+        if not failed:
+            for article_title in titles_to_match:
+                submit(article_title, None)
+
+        not_found_titles = []
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except exceptions.HTTPNotFoundException as error:
+                if futures[future] not in known_articles:
+                    log_upload_error(error)
+                    continue
+
+                logger.warning(f"Article {futures[future]} no longer exists on dev.to, looking it up by title.")
+                not_found_titles.append(futures[future])
+            except (exceptions.HTTPException, exceptions.ImageUploadException, OSError) as error:
+                log_upload_error(error)
+
+    if failed:
         sys.exit(1)
-    elif folder:
-        for path in Path(folder).rglob("*.md"):
-            ignore = should_file_be_ignored(ignore_folders, path)
 
-            if not ignore:
-                article_paths.append(path)
+    if not_found_titles:
+        for article_title in not_found_titles:
+            devto_articles.pop(article_title, None)
+
+        articles_not_found = {title: articles_to_upload[title] for title in not_found_titles}
+        yield from publish_articles(
+            articles_not_found, devto_articles, http_client, image_uploader, workers, http_client.iter_articles()
+        )
+
+
+def get_known_articles(articles, publish_manifest):
+    """Gets the dev.to id of the articles we have published before, so they can be updated directly. The id is
+    taken from the `devto_id` in the frontmatter, else from the publish manifest (using the path of the article and
+    then its title). This means an article which has been renamed is still updated, rather than created again.
+
+    Args:
+        articles (dict): key is the title of the article and value is details.
+        publish_manifest (Manifest): The local manifest of the articles we have published.
+
+    Returns:
+        dict: Where the key is the article title and values are the `RemoteArticle` we last published, for each
+        article whose id we know.
+
+    """
+    known_articles = {}
+    for title, article in articles.items():
+        entry = publish_manifest.get(article.get("source", article["path"])) or publish_manifest.get_by_title(title)
+        article_id = article.get("devto_id") or (entry and entry["article_id"])
+        if not article_id:
+            continue
+
+        checksum = entry["checksum"] if entry and entry["article_id"] == article_id else ""
+        known_articles[title] = RemoteArticle(id=article_id, title=title, checksum=checksum)
+
+    return known_articles
+
+
+def match_remote_articles(titles_to_match, devto_articles, remote_articles, submit):
+    """Matches the articles on dev.to (using their title) as they are fetched, each article is uploaded as soon as
+    it's matched. If we fail to get the articles, we cannot tell which articles need to be created.
+
+    Args:
+        titles_to_match (list): The titles of the articles which haven't been matched yet.
+        devto_articles (dict): Where the key is the article title and values are the `RemoteArticle` on dev.to, the
+            fetched articles are added to it.
+        remote_articles (iterator): The articles on dev.to as they are fetched.
+        submit (callable): Starts uploading an article, given its title and `RemoteArticle`.
+
+    Returns:
+        tuple: The titles which weren't matched (i.e. need to be created) and True if we failed to get the articles.
+
+    """
+    unmatched_titles = set(titles_to_match)
+    try:
+        for remote_article in remote_articles if unmatched_titles else ():
+            devto_articles[remote_article.title] = remote_article
+            if remote_article.title in unmatched_titles:
+                unmatched_titles.remove(remote_article.title)
+                submit(remote_article.title, remote_article)
+
+            if not unmatched_titles:
+                logger.debug("Found all the articles on dev.to, not fetching any more articles.")
+                break
+    except exceptions.HTTPException as error:
+        logger.error(f"Failed to get articles on dev.to, {error}.")
+        return [title for title in titles_to_match if title in unmatched_titles], True
+    finally:
+        close = getattr(remote_articles, "close", None)
+        if close:
+            close()
+
+    return [title for title in titles_to_match if title in unmatched_titles], False
+
+
+def log_upload_error(error):
+    """Logs why an article failed to upload.
+
+    Args:
+        error (Exception): The exception raised while uploading the article.
+
+    """
+    if isinstance(error, exceptions.HTTPException):
+        logger.error(f"Failed to upload, {error}.")
+    elif isinstance(error, exceptions.ImageUploadException):
+        logger.error(f"Failed to upload images, {error}.")
+    elif isinstance(error, FileNotFoundError):
+        logger.error(f"Failed to upload file, file doesn't exist, {error}.")
     else:
-        article_paths = [file]
-    return article_paths
+        logger.error(f"Failed to upload file, cannot open file, {error}.")
 
 
-def should_file_be_ignored(ignore_folders, path):
-    """Checks if file should be ignored or not, based on what list of files/folders
-    the user has passed as input. If the ignore folder name is in the
-    path of the article (markdown file) we will ignore it.
+def resume_from_journal(journal, publish_manifest, image_cache):
+    """Adds the articles and images uploaded by the last run (which we are resuming) to the publish manifest and
+    image cache, so they are not uploaded again.
 
     Args:
-        ignore_folders (tuple): A list of folders to ignore markdown files in.
-        path (str): Path to markdown file.
+        journal (Journal): The journal of the last run.
+        publish_manifest (Manifest): The local manifest of the articles we have published.
+        image_cache (ImageCache): The cache of images uploaded to imgur.
+
+    """
+    for entry in journal.articles.values():
+        publish_manifest.record(
+            path=entry["path"], title=entry["title"], article_id=entry["article_id"], checksum=entry["checksum"]
+        )
+    for digest, link in journal.images.items():
+        image_cache.record(digest, link)
+
+
+def update_image_cache(image_cache, prune_days, invalidate_images):
+    """Removes images from the image cache, so they will be uploaded again the next time they are used.
+
+    Args:
+        image_cache (ImageCache): The cache of images uploaded to imgur.
+        prune_days (int): Remove images which haven't been used in this many days, if None nothing is pruned.
+        invalidate_images (tuple): Paths of the images to remove from the cache.
+
+    """
+    for image_path in invalidate_images:
+        if image_cache.invalidate(hash_file(image_path)):
+            logger.info(f"Removed image at {image_path} from the image cache.")
+
+    if prune_days is not None:
+        removed = image_cache.prune(prune_days)
+        logger.info(f"Removed {removed} images from the image cache.")
+
+
+def get_devto_articles(http_client):
+    """Gets all the articles on dev.to, if we fail to get the articles we exit because we cannot tell which articles
+    need to be created and which need to be updated.
+
+    Args:
+        http_client (HTTPClient): Used to make HTTP requests to dev.to API.
 
     Returns:
-        bool: True if we should ignore the file and it will not be uploaded.
+        dict: Where the key is the article title and values are the info about the article.
 
     """
-    ignore = False
-    for path_to_ignore in ignore_folders:
-        article_dirname = f"{os.path.dirname(path)}/"
-        if path_to_ignore in article_dirname:
-            ignore = True
-            break
+    try:
+        devto_articles = http_client.get_articles()
+    except exceptions.HTTPException as error:
+        logger.error(f"Failed to get articles on dev.to, {error}.")
+        sys.exit(1)
 
-    return ignore
+    return devto_articles
 
 
-def get_local_articles(article_paths, site):
-    """Gets all the local markdown files that we will attempt to upload to dev.to.
+def get_changed_articles(articles, publish_manifest):
+    """Removes any articles which have been published before with the same checksum, i.e. the content
+    has not changed since we last published them.
+
+    Args:
+        articles (dict): key is the title of the article and value is details.
+        publish_manifest (Manifest): The local manifest of the articles we have published.
+
+    Returns:
+        dict: key is the title of the article and value is details, only including articles which have changed.
+
+    """
+    changed_articles = {}
+    for title, article in articles.items():
+        source = article.get("source", article["path"])
+        if publish_manifest.is_unchanged(source, article.get("checksum")):
+            logger.debug(f"Article {title} has not changed since it was last published.")
+            continue
+
+        changed_articles[title] = article
+
+    return changed_articles
+
+
+def get_article_paths(file, folder, ignore_folders, exclude_patterns=()):
+    """Gets all the paths to the local markdown article. Either file or folder must be set. If the file is in the
+    ignore path or matches an exclude pattern it will not be uploaded, see `walk_articles`.
+
+    Args:
+        file (str): Path to file.
+        folder (str): Path to folder.
+        ignore_folders (tuple): A list of folders to ignore markdown files in.
+        exclude_patterns (tuple): gitignore-style patterns of folders and files to ignore, relative to `folder`.
+
+    Returns:
+        iterable: The paths to the markdown files, paths in a folder are found lazily.
+
+    """
+    if not file and not folder:
+        logger.error("File and folder cannot be both be empty.")
+        sys.exit(1)
+    elif folder:
+        return walk_articles(folder, ignore_folders, exclude_patterns)
+    return [file]
+
+
+def get_local_articles(article_paths, jobs=1, metrics=None, profiler=None):
+    """Gets all the local markdown files that we will attempt to upload to dev.to. If an article can't be
+    read (i.e. invalid frontmatter) the error is logged and the article is skipped.
 
     Args:
         article_paths (list): List of paths for local articles to upload to dev.to.
-        site (str): The site to use to replace local links with.
+        jobs (int): Number of processes to use to read and transform the articles, if 1 no processes are started.
+        metrics (Metrics): Records the articles which couldn't be read, if None nothing is recorded.
+        profiler (Profiler): Records how long each step took to read each article, if None (or disabled) the
+            steps are not timed.
 
     Returns:
-        dict: key is the title of the article and value is details.
+        dict: key is the title of the article and value is details, in the same order as `article_paths`.
 
     """
     logger.info("Getting local articles.")
+    code_file_cache.reset_counts()
+    article_paths = list(article_paths)
+    profiled = profiler is not None and profiler.enabled
+    read = read_profiled_article_data if profiled else read_article_data
+    if jobs > 1:
+        import concurrent.futures
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(read, article_path) for article_path in article_paths]
+            articles = [future.result() for future in futures]
+    else:
+        articles = [read(article_path) for article_path in article_paths]
+
+    if profiled:
+        for article_path, (_, timings) in zip(article_paths, articles):
+            profiler.record_article(article_path, timings)
+        articles = [article for article, _ in articles]
+
     articles_data = {}
-    for article_path in article_paths:
-        article = get_article_data(article_path, site)
+    for article_path, article in zip(article_paths, articles):
+        if isinstance(article, get_article_errors()):
+            logger.error(f"Failed to read article at {article_path}, {article}.")
+            if metrics:
+                metrics.record_article(article_path, "invalid", error=article)
+            continue
+
         title = article["title"]
+        if title in articles_data:
+            logger.warning(
+                f"Articles at {articles_data[title]['source']} and {article_path} have the same title, only the "
+                f"article at {article_path} will be published."
+            )
         articles_data[title] = article
         articles_data[title]["path"] = os.path.dirname(article_path)
+        articles_data[title]["source"] = str(article_path)
 
+    # With more than one job each process has its own cache, so the counts in this process mean nothing.
+    if jobs == 1 and (code_file_cache.hits or code_file_cache.misses):
+        logger.info(
+            f"Imported code files cache, {code_file_cache.hits} hits and {code_file_cache.misses} misses "
+            f"({code_file_cache.size} bytes cached)."
+        )
     return articles_data
 
 
-def get_article_data(path, site):
+def read_article_data(path, timings=None):
+    """Gets the article data (see `get_article_data`), returning the error instead of raising it if the
+    article can't be read.
+
+    Args:
+        path (str): Path of the article file to upload.
+        timings (dict): If set, how long each step took to read the article is added to it.
+
+    Returns:
+        frontmatter.post: The article data, or the exception raised while reading it.
+
+    """
+    try:
+        return get_article_data(path, timings)
+    except get_article_errors() as error:
+        return error
+
+
+def get_article_errors():
+    """Gets the exceptions raised when an article can't be read, i.e. it has invalid frontmatter. PyYAML is only
+    imported once we need to read articles, so `--help` starts quickly.
+
+    Returns:
+        tuple: The exception classes.
+
+    """
+    import yaml
+
+    return (KeyError, TypeError, ValueError, OSError, yaml.YAMLError)
+
+
+def read_profiled_article_data(path):
+    """Gets the article data (see `read_article_data`) and how long each step took to read it, i.e. parsing the
+    frontmatter and each transform.
+
+    Args:
+        path (str): Path of the article file to upload.
+
+    Returns:
+        tuple: The article data (or the exception raised while reading it) and a dict where the key is the name of
+        the step and the value is how long it took in seconds.
+
+    """
+    timings = {}
+    article = read_article_data(path, timings)
+    return article, timings
+
+
+def get_article_data(path, timings=None):
     """Gets the article data, which includes all the fields in the frontmatter as keys/values in a dict.
     We then generate a checksum with the contents of the article (excluding the fronmatter).
 
@@ -213,30 +1113,30 @@ def get_article_data(path, site):
 
     Args:
         path (str): Path of the article file to upload.
-        site (str): The site to use to replace local links with.
+        timings (dict): If set, how long each step took to read the article is added to it.
 
     Returns:
         frontmatter.post: key are items in the frontmatter and the contents of the article.
 
     """
-    article = frontmatter.load(path)
+    import frontmatter
+
+    with time_step(timings, "parse_frontmatter"):
+        article = frontmatter.load(path)
     article["path"] = str(path)
-    article = clean_article_data(article, site, path)
-    article_content = frontmatter.dumps(article)
-    checksum = hashlib.md5(article_content.encode("utf-8")).hexdigest()
+    article = clean_article_data(article, path, timings)
+    with time_step(timings, "checksum"):
+        article_content = frontmatter.dumps(article)
+        checksum = hashlib.md5(article_content.encode("utf-8")).hexdigest()
     article["checksum"] = checksum
     return article
 
 
-def clean_article_data(article, site, path):
-    content = article.content
-    content = remove_new_lines_in_paragraph(content)
-    content = replace_local_links(content, site)
-    content = replace_youtube_links(content)
-    content = replace_code_meta(content, path)
-    content = replace_admonitions(content)
+def clean_article_data(article, path, timings=None):
+    content = transform_content(article.content, path, timings=timings)
 
-    article["tags"] = convert_tags(article["tags"])
+    with time_step(timings, "convert_tags"):
+        article["tags"] = convert_tags(article["tags"])
     article["content"] = content
     return article
 
@@ -393,7 +1293,7 @@ def replace_code_meta(content, path):
     code_blocks_in_article = re.findall(code_block_in_markdown, content)
 
     for code_block in code_blocks_in_article:
-        start_code_block = regex.sub("(?<=```[a-z]*):title=.+ ", " ", code_block)
+        start_code_block = CODE_TITLE_IN_MARKDOWN.sub(r"\1 ", code_block)
         if start_code_block.startswith("```") and "file=" in start_code_block:
             source_code_path = start_code_block.split("\n")[0].split(" ")[1].replace("file=", "")
             absolute_source_code_path = os.path.join(os.path.dirname(path), source_code_path)
@@ -401,12 +1301,11 @@ def replace_code_meta(content, path):
             logger.debug(f"Importing code block from, {absolute_source_code_path}.")
 
             try:
-                with open(absolute_source_code_path) as code_file:
-                    code_contents = code_file.read()
-                    new_code_block = f"{start_code_block}\n{code_contents}\n```"
-                    content = content.replace(code_block, new_code_block)
+                code_contents = code_file_cache.read(absolute_source_code_path)
+                new_code_block = f"{start_code_block}\n{code_contents}\n```"
+                content = content.replace(code_block, new_code_block)
             except FileNotFoundError:
-                logger.warn(f"File not found at {absolute_source_code_path}")
+                logger.warning(f"File not found at {absolute_source_code_path}")
 
     return content
 
@@ -449,7 +1348,7 @@ def replace_admonitions(content):
     return content
 
 
-def upload_article(article, devto_article, http_client):
+def upload_article(article, devto_article, http_client, image_uploader=None):
     """Uploads the article to dev.to. If imgur client id is set,
     it will also auto-upload your images to imgur and change the image links
     in the markdown. As the API doesn't allow you upload images yet.
@@ -462,121 +1361,159 @@ def upload_article(article, devto_article, http_client):
 
     Args:
         article (frontmatter.Post): The article you want to upload.
-        devto_article (dict): The existing dev.to article (matched using title), if none exists will be an empty dict ({}).
-        http_client (HTTPClient): Used to make HTTP requests to dev.to API and also Imgur.
+        devto_article (RemoteArticle): The existing dev.to article (matched using title), None if it doesn't exist.
+        http_client (HTTPClient): Used to make HTTP requests to dev.to API.
+        image_uploader (ImageUploader): Used to upload local images to Imgur, if None images will not be uploaded.
+
+    Returns:
+        int: The id of the article on dev.to.
 
     """
 
     if devto_article:
         logger.info("Article already exists on dev.to.")
         checksum_matched = check_if_article_requires_update(
-            devto_content=devto_article["content"], local_checksum=article["checksum"]
+            devto_checksum=devto_article.checksum, local_checksum=article["checksum"]
         )
 
         if not checksum_matched:
-            if http_client.imgur_client_id:
-                article["content"] = upload_local_images(article, http_client)
+            if image_uploader:
+                article["content"] = upload_local_images(article, image_uploader)
 
             logger.info("Checksum does not match, article needs to be updated on dev.to.")
-            article_id = devto_article["id"]
-            response = http_client.update_article(article_id, article)
+            response = http_client.update_article(devto_article.id, article)
             logger.info(f"Updating article on dev.to, at {response['url']}")
 
+        article_id = devto_article.id
     else:
-        if http_client.imgur_client_id:
-            article["content"] = upload_local_images(article, http_client)
+        if image_uploader:
+            article["content"] = upload_local_images(article, image_uploader)
 
         response = http_client.create_article(article)
         logger.info(f"Creating article on dev.to, at {response['url']}")
+        article_id = response.get("id")
+
+    return article_id
 
 
-def check_if_article_requires_update(devto_content, local_checksum):
-    """Gets the checksum for the dev.to article and compares it with the local checksum
-    to see if we need to update the article.
+def check_if_article_requires_update(devto_checksum, local_checksum):
+    """Compares the checksum of the dev.to article with the local checksum to see if we need to update the article.
 
     Args:
-        devto_article (frontmatter): The existing dev.to article (match using title), if none exists will be an empty dict ({}).
+        devto_checksum (str): The checksum of the existing dev.to article, see `RemoteArticle`.
         local_checksum (str): The checksum on the local article we want to upload.
 
-
     Returns:
         bool: True if the checksum matched else false.
 
     """
-    devto_file = io.StringIO(devto_content)
-    devto_data = frontmatter.load(devto_file)
-    try:
-        devto_checksum = devto_data["checksum"]
-    except KeyError:
+    if not devto_checksum:
         logger.warning(
             "Checksum doesn't exist on article, this likely means article wasn't originally uploaded with this tool."
         )
-        devto_checksum = ""
 
     return devto_checksum == local_checksum
 
 
-def upload_local_images(article_data, http_client):
+def upload_local_images(article_data, image_uploader):
     """Will upload all local images to imgur (and cover image). Then update the references
     within the markdown. If the cover image is a local file will also upload the cover image
     and update that as well.
 
     Args:
         article_data (frontmatter): Article data.
-        http_client (HTTPClient): Used to make HTTP requests to Imgur.
+        image_uploader (ImageUploader): Used to upload images to Imgur.
 
     Returns:
-        bool: True if the checksum matched else false.
+        str: The content with the local images replaced with links on Imgur.
 
     """
     logger.info("Uploading images to Imgur.")
-    content = upload_image_tags(article_data, http_client)
-    content = upload_cover_image(article_data, http_client)
+    article_data["content"] = upload_image_tags(article_data, image_uploader)
+    content = upload_cover_image(article_data, image_uploader)
     return content
 
 
-def upload_image_tags(article_data, http_client):
-    """Finds all the image tags (with local paths) in the markdown file and uploads them to Imgur. It then replaces
-    them with new paths on imgur.
+def upload_image_tags(article_data, image_uploader):
+    """Finds all the image tags (with local paths) in the markdown file and uploads them to Imgur. All of the images
+    are uploaded at the same time, then once they have all been uploaded we replace them with new paths on imgur.
 
     Args:
         article_data (frontmatter): Article data.
-        http_client (HTTPClient): Used to make HTTP requests to Imgur.
+        image_uploader (ImageUploader): Used to upload images to Imgur.
 
     Returns:
-        bool: True if the checksum matched else false.
+        str: The content with the local images replaced with links on Imgur.
+
+    """
+    content = article_data["content"]
+    image_paths = get_local_image_paths(article_data)
+    if not image_paths:
+        return content
+
+    uploaded_images = image_uploader.upload_images(list(image_paths.values()))
+    links = {local_path: uploaded_images[image_path] for local_path, image_path in image_paths.items()}
+    return replace_image_links(content, links)
+
+
+def get_local_image_paths(article_data):
+    """Finds all the image tags in the markdown file which point to local images.
+
+    Args:
+        article_data (frontmatter): Article data.
+
+    Returns:
+        dict: Where the key is the path of the image in the markdown and the value is the path to the image file.
 
     """
     content, article_path = article_data["content"], article_data["path"]
-    images_in_markdown = re.compile(r"(?:!\[(.*?)\]\((.*?)\))")
-    images_in_article = re.findall(images_in_markdown, content)
+    image_paths = {}
+    for token in tokenize(content):
+        if token.kind != IMAGE:
+            continue
 
-    for image_markdown in images_in_article:
-        description, local_path = image_markdown
+        _, local_path = token.groups
         image_path = os.path.join(article_path, local_path)
-        logger.debug(f"Uploading image at {image_path}.")
-        if not os.path.isfile(image_path):
-            continue
+        if os.path.isfile(image_path):
+            image_paths[local_path] = image_path
 
-        link = http_client.upload_image(image_path)
-        old_image_markdown = f"![{description}]({local_path})"
-        new_image_markdown = f"![{description}]({link})"
-        logger.debug(f"Updating path of image in article from {image_path} to {link}.")
-        content = content.replace(old_image_markdown, new_image_markdown)
+    return image_paths
 
-    return content
 
+def replace_image_links(content, links):
+    """Replaces the paths of images in the markdown with their new links, in a single pass over the content.
+
+    Args:
+        content (str): Article data.
+        links (dict): Where the key is the path of the image in the markdown and the value is the new link.
+
+    Returns:
+        str: The content with the image paths replaced.
 
-def upload_cover_image(article_data, http_client):
+    """
+
+    def replace_image(token):
+        if token.kind != IMAGE or token.groups[1] not in links:
+            return token.text
+
+        description, local_path = token.groups
+        link = links[local_path]
+        logger.debug(f"Updating path of image in article from {local_path} to {link}.")
+        return f"![{description}]({link})"
+
+    return "".join(replace_image(token) for token in tokenize(content))
+
+
+def upload_cover_image(article_data, image_uploader):
     """Uploads the cover image if it's a local file in the frontmatter to Imgur. It then replaces the local path
     with new uploaded path.
 
     Args:
         article_data (frontmatter): Article data.
-        http_client (HTTPClient): Used to make HTTP requests to Imgur.
+        image_uploader (ImageUploader): Used to upload images to Imgur.
 
     Returns:
-        bool: True if the checksum matched else false.
+        str: The content with the local cover image replaced with the link on Imgur.
 
     """
     content, cover_image, article_path = article_data["content"], article_data["cover_image"], article_data["path"]
@@ -584,17 +1521,19 @@ def upload_cover_image(article_data, http_client):
 
     if os.path.isfile(cover_path):
         logger.debug("Updating article cover image.")
-        logger.debug(f"Uploading image at {cover_path}.")
-        link = http_client.upload_image(cover_path)
+        link = image_uploader.upload_images([cover_path])[cover_path]
         logger.debug(f"Updating path of cover image in article from {cover_path} to {link}.")
         content = content.replace(f"cover_image: {cover_image}", f"cover_image: {link}")
     return content
 
 
 def save_article(output, article):
+    import frontmatter
+
     try:
         article.content = article.metadata["content"]
         del article.metadata["content"]
+        article.metadata.pop("source", None)
     except KeyError as e:
         logger.error(f"Missing content in article metadata {e}")
         raise KeyError
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+r"""A cache of the code files imported by code blocks (`gatsby-remark-import-code`). Articles in a series often import
+the same files, so each file is only read once per run. A cached file is read again if its modification time or size
+changes. The cache is bounded by the total size of the files in it, when it's full the least recently used files are
+removed.
+
+Example:
+    ::
+
+        $ code_cache = CodeFileCache(max_bytes=32 * 1024 * 1024)
+        $ contents = code_cache.read("articles/a/main.py")
+        $ code_cache.hits, code_cache.misses
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import collections
+import os
+import threading
+
+
+class CodeFileCache:
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._files = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def read(self, path):
+        """Reads a code file, using the cached contents if the file hasn't changed since we last read it.
+
+        Args:
+            path (str): Path to the code file.
+
+        Raises:
+            FileNotFoundError: If the code file doesn't exist.
+
+        Returns:
+            str: The contents of the code file.
+
+        """
+        resolved_path = os.path.realpath(path)
+        stat = os.stat(resolved_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._files.get(resolved_path)
+            if cached and cached[0] == version:
+                self._files.move_to_end(resolved_path)
+                self.hits += 1
+                return cached[1]
+
+        with open(resolved_path) as code_file:
+            contents = code_file.read()
+
+        with self._lock:
+            self.misses += 1
+            self._add(resolved_path, version, contents)
+        return contents
+
+    def reset_counts(self):
+        """Resets the hit and miss counts, i.e. before each publish in watch mode. Cached files are kept."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def clear(self):
+        with self._lock:
+            self._files.clear()
+            self.size = 0
+
+    def _add(self, resolved_path, version, contents):
+        """Adds a file to the cache, removing the least recently used files if the cache is full. Files bigger
+        than the whole cache are not cached."""
+        old = self._files.pop(resolved_path, None)
+        if old:
+            self.size -= old[0][1]
+
+        file_size = version[1]
+        if file_size > self.max_bytes:
+            return
+
+        self._files[resolved_path] = (version, contents)
+        self.size += file_size
+        while self.size > self.max_bytes:
+            _, (evicted_version, _) = self._files.popitem(last=False)
+            self.size -= evicted_version[1]
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+r"""A fake dev.to and Imgur API, which runs in-process, so publishing (lots of) articles can be tested without
+using the real APIs. It implements the endpoints used by the `HTTPClient`:
+
+    - `GET /api/articles/me/all`: Gets the articles, a page at a time
+    - `POST /api/articles`: Creates an article
+    - `PUT /api/articles/{id}`: Updates an article
+    - `POST /3/upload`: Uploads an image
+
+Like dev.to, the title of an article is taken from the front matter of its `body_markdown`, otherwise from its
+`title`, and an article can't be created without a title. Only `rate_limit` articles can be created or updated every
+`rate_period` seconds, any other requests get a 429 response with a `Retry-After` header. Every response can be
+delayed by `latency` seconds, and a proportion of the requests (`error_rate`) can fail with a 503 response.
+
+Example:
+    ::
+
+        $ with FakeServer(latency=0.05, error_rate=0.01) as server:
+        $     http_client = HTTPClient(devto_api_key="AKEY", devto_url=server.devto_url, imgur_url=server.url)
+
+    Or as a standalone server:
+
+    ::
+
+        $ python -m markdown_to_devto.fake_server --port 8000 --latency 0.05
+        $ markdown_to_devto --devto-url http://localhost:8000/api --imgur-url http://localhost:8000 ...
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import argparse
+import collections
+import io
+import json
+import math
+import random
+import re
+import socketserver
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+
+import frontmatter
+import yaml
+
+ARTICLE_URL = re.compile(r"^/api/articles/(?P<article_id>\d+)$")
+
+
+class ThreadingHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    """Handles each request in a new thread, like `http.server.ThreadingHTTPServer` (which needs Python 3.7)."""
+
+    daemon_threads = True
+
+
+class FakeServer:
+    def __init__(
+        self, host="127.0.0.1", port=0, latency=0, rate_limit=10, rate_period=30, error_rate=0, seed=None
+    ):
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_period = rate_period
+        self.error_rate = error_rate
+        self.articles = {}
+        self.images = 0
+        self.requests = collections.Counter()
+        self.rate_limited = 0
+        self.errors = 0
+        self._published_at = collections.deque()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._create_handler())
+        self._thread = None
+
+    @property
+    def url(self):
+        """str: The base URL of the server, i.e. the Imgur API."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def devto_url(self):
+        """str: The base URL of the dev.to API."""
+        return f"{self.url}/api"
+
+    def start(self):
+        """Starts the server in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the server."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def handle(self, method, path, headers, body):
+        """Handles a request to the fake API.
+
+        Args:
+            method (str): The HTTP method of the request i.e. "GET".
+            path (str): The path (and query string) of the request.
+            headers (dict): The headers of the request.
+            body (bytes): The body of the request.
+
+        Returns:
+            tuple: The status code, the JSON data and the headers of the response.
+
+        """
+        url = urllib.parse.urlparse(path)
+        endpoint = f"{method} {ARTICLE_URL.sub('/api/articles/{id}', url.path)}"
+        with self._lock:
+            self.requests[endpoint] += 1
+            failed = self.error_rate and self._random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if failed:
+            return 503, {"error": "Service Unavailable", "status": 503}, {}
+        elif url.path == "/3/upload" and method == "POST":
+            return self._upload_image()
+        elif not url.path.startswith("/api/"):
+            return 404, {"error": "Not Found", "status": 404}, {}
+        elif headers.get("api-key") is None:
+            return 401, {"error": "unauthorized", "status": 401}, {}
+        elif url.path == "/api/articles/me/all" and method == "GET":
+            return self._get_articles(urllib.parse.parse_qs(url.query))
+        elif url.path == "/api/articles" and method == "POST":
+            return self._publish(None, body)
+        elif ARTICLE_URL.match(url.path) and method == "PUT":
+            return self._publish(int(ARTICLE_URL.match(url.path).group("article_id")), body)
+        return 404, {"error": "Not Found", "status": 404}, {}
+
+    def _get_articles(self, query):
+        page = int(query.get("page", ["1"])[0])
+        per_page = int(query.get("per_page", ["30"])[0])
+        with self._lock:
+            articles = sorted(self.articles.values(), key=lambda article: article["id"], reverse=True)
+        return 200, articles[(page - 1) * per_page : page * per_page], {}
+
+    def _publish(self, article_id, body):
+        """Creates (or updates if `article_id` is set) an article, unless we are being rate limited."""
+        try:
+            article_data = json.loads(body)["article"]
+            body_markdown = article_data["body_markdown"]
+        except (KeyError, TypeError, ValueError):
+            return 422, {"error": "param is missing or the value is empty: article", "status": 422}, {}
+
+        try:
+            title = frontmatter.load(io.StringIO(body_markdown)).get("title") or article_data.get("title")
+        except yaml.YAMLError:
+            return 422, {"error": "Front matter is not valid YAML", "status": 422}, {}
+
+        with self._lock:
+            title = title or self.articles.get(article_id, {}).get("title")
+            if not title:
+                return 422, {"error": "Title can't be blank", "status": 422}, {}
+
+            now = time.monotonic()
+            while self._published_at and now - self._published_at[0] >= self.rate_period:
+                self._published_at.popleft()
+
+            if len(self._published_at) >= self.rate_limit:
+                self.rate_limited += 1
+                retry_after = math.ceil(self.rate_period - (now - self._published_at[0]))
+                headers = {"Retry-After": str(retry_after)}
+                return 429, {"error": "Rate limit reached, try again later", "status": 429}, headers
+
+            if article_id is not None and article_id not in self.articles:
+                return 404, {"error": "Not Found", "status": 404}, {}
+
+            self._published_at.append(now)
+            status_code = 200 if article_id else 201
+            article_id = article_id or len(self.articles) + 1
+            timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            article = self.articles.setdefault(article_id, {"id": article_id, "published_at": timestamp})
+            article.update({"title": title, "body_markdown": body_markdown, "edited_at": timestamp})
+
+        return status_code, {"id": article_id, "url": f"{self.url}/articles/{article_id}"}, {}
+
+    def _upload_image(self):
+        with self._lock:
+            self.images += 1
+            image_id = self.images
+        return 200, {"data": {"link": f"{self.url}/images/{image_id}.png"}, "success": True, "status": 200}, {}
+
+    def _create_handler(self):
+        fake_server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Send the headers and body of each response together.
+            wbufsize = -1
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                self._respond()
+
+            def do_POST(self):
+                self._respond()
+
+            def do_PUT(self):
+                self._respond()
+
+            def log_message(self, format, *args):  # noqa: A002
+                pass
+
+            def _respond(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                status_code, data, headers = fake_server.handle(self.command, self.path, self.headers, body)
+                response = json.dumps(data).encode("utf-8")
+                self.send_response(status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(response)
+
+        return RequestHandler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="A fake dev.to and Imgur API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0, help="Seconds to wait before responding.")
+    parser.add_argument("--rate-limit", type=int, default=10, help="Articles which can be published per period.")
+    parser.add_argument("--rate-period", type=float, default=30, help="The rate limit period in seconds.")
+    parser.add_argument("--error-rate", type=float, default=0, help="Proportion of requests which fail with a 503.")
+    parser.add_argument("--seed", type=int)
+    arguments = parser.parse_args()
+
+    server = FakeServer(
+        host=arguments.host,
+        port=arguments.port,
+        latency=arguments.latency,
+        rate_limit=arguments.rate_limit,
+        rate_period=arguments.rate_period,
+        error_rate=arguments.error_rate,
+        seed=arguments.seed,
+    )
+    print(f"Serving the fake dev.to API at {server.devto_url} and the fake Imgur API at {server.url}.")
+    server.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
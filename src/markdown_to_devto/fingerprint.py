@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+r"""Finds the articles which have changed since they were last published, without reading them. Each article's
+fingerprint (its size, modification time and a BLAKE2 hash of its contents) is stored in the `Manifest` along with the
+size and modification time of the files it depends on (imported code files and images) and the settings (i.e. `site`)
+it was transformed with.
+
+If the size and modification time of an article haven't changed it hasn't changed. Else we hash the file (in a pool
+of threads), so files which were saved without any changes are still skipped. Only the articles which have changed
+need to be parsed and transformed.
+
+Example:
+    ::
+
+        $ changed_paths, fingerprints = get_changed_paths(article_paths, manifest, get_settings(site=None))
+        $ record_fingerprint(manifest, changed_paths[0], fingerprints[str(changed_paths[0])])
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import collections
+import json
+import logging
+import os
+
+from .transform import get_dependencies
+from .utils.hashing import hash_files
+
+logger = logging.getLogger(__name__)
+
+Fingerprint = collections.namedtuple("Fingerprint", ["size", "mtime_ns", "digest", "settings"])
+
+
+def get_settings(site):
+    """Gets the settings which change how articles are transformed, if they change every article has changed.
+
+    Args:
+        site (str): The site to use to replace local links with.
+
+    Returns:
+        str: The settings as JSON.
+
+    """
+    return json.dumps({"site": site}, sort_keys=True)
+
+
+def get_changed_paths(article_paths, publish_manifest, settings, force=False, workers=None):
+    """Finds the articles which have changed since they were last published, using their fingerprints.
+
+    Args:
+        article_paths (iterable): The paths to the local articles.
+        publish_manifest (Manifest): The local manifest of the articles we have published.
+        settings (str): The current settings, see `get_settings`.
+        force (bool): If True every article has changed, but their fingerprints are still returned.
+        workers (int): Number of threads to use to hash the articles.
+
+    Returns:
+        tuple: The paths to the articles which have changed (in the same order as `article_paths`) and a dict
+        where the key is the path and the value is the `Fingerprint` of every article.
+
+    """
+    article_paths = list(article_paths)
+    entries, stats, paths_to_hash = {}, {}, []
+    fingerprints = {}
+    for article_path in article_paths:
+        path = str(article_path)
+        stats[path] = stat_file(path)
+        entry = None if force else get_published_fingerprint(publish_manifest, path, settings)
+        if entry and stats[path] == (entry["size"], entry["mtime_ns"]):
+            fingerprints[path] = Fingerprint(*stats[path], entry["digest"], settings)
+            continue
+
+        entries[path] = entry
+        paths_to_hash.append(path)
+
+    unchanged_paths = set(fingerprints)
+    digests = hash_files(paths_to_hash, workers)
+    for path in paths_to_hash:
+        fingerprints[path] = Fingerprint(*stats[path], digests.get(path), settings)
+        entry = entries[path]
+        if entry and digests.get(path) == entry["digest"]:
+            publish_manifest.update_file_stat(path, *stats[path])
+            unchanged_paths.add(path)
+
+    changed_paths = [article_path for article_path in article_paths if str(article_path) not in unchanged_paths]
+    return changed_paths, fingerprints
+
+
+def get_published_fingerprint(publish_manifest, path, settings):
+    """Gets the fingerprint of an article from when it was last published, if it was published with the same
+    settings and none of the files it depends on have changed.
+
+    Args:
+        publish_manifest (Manifest): The local manifest of the articles we have published.
+        path (str): Path to the local markdown file.
+        settings (str): The current settings, see `get_settings`.
+
+    Returns:
+        dict: The fingerprint (see `Manifest.get_file`), None if the article needs to be read again.
+
+    """
+    entry = publish_manifest.get_file(path)
+    if not entry or entry["settings"] != settings or not publish_manifest.get(path):
+        return None
+
+    for dependency_path, size, mtime_ns in entry["dependencies"]:
+        if stat_file(dependency_path) != (size, mtime_ns):
+            logger.debug(f"File {dependency_path} used by article at {path} has changed.")
+            return None
+
+    return entry
+
+
+def record_fingerprint(publish_manifest, path, fingerprint):
+    """Records the fingerprint of an article, should be called after the article has been published (or we found
+    it doesn't need to be).
+
+    Args:
+        publish_manifest (Manifest): The local manifest of the articles we have published.
+        path (str): Path to the local markdown file.
+        fingerprint (Fingerprint): The fingerprint of the article, from before it was read.
+
+    """
+    if not fingerprint or not fingerprint.digest:
+        return
+
+    dependencies = [(dependency, *stat_file(dependency)) for dependency in get_article_dependencies(path)]
+    publish_manifest.record_file(
+        str(path), fingerprint.size, fingerprint.mtime_ns, fingerprint.digest, fingerprint.settings, dependencies
+    )
+
+
+def get_article_dependencies(path):
+    """Gets the (real) paths of the code files and images (including the cover image) used by an article.
+
+    Args:
+        path (str): Path to the markdown file.
+
+    Returns:
+        list: The paths of the code files and images, empty if the article can't be read.
+
+    """
+    import frontmatter
+    import yaml
+
+    try:
+        article = frontmatter.load(path)
+    except (OSError, ValueError, yaml.YAMLError):
+        return []
+
+    dependencies = get_dependencies(article.content, path)
+    if article.get("cover_image"):
+        dependencies.append(os.path.join(os.path.dirname(path), str(article["cover_image"])))
+    return [os.path.realpath(dependency) for dependency in dependencies]
+
+
+def stat_file(path):
+    """Gets the size and modification time of a file.
+
+    Args:
+        path (str): Path to the file.
+
+    Returns:
+        tuple: The size and modification time (in nanoseconds), both None if the file doesn't exist.
+
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None, None
+
+    return stat.st_size, stat.st_mtime_ns
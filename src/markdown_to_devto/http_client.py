@@ -11,32 +11,68 @@ Example:
     http://google.github.io/styleguide/pyguide.html
 
 """
+import json
+import logging
 import os
+import time
 
-import requests
-
+from .multipart import MultipartEncoder
+from .remote import RemoteArticle
+from .remote import add_checksum
+from .retry import RetryPolicy
+from .transport import RequestsTransport
 from .utils import exceptions
 
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = ["get", "put", "delete"]
+DEVTO_URL = "https://dev.to/api"
+IMGUR_URL = "https://api.imgur.com"
+
 
 class HTTPClient:
-    def __init__(self, devto_api_key=None, imgur_client_id=None):
+    def __init__(
+        self,
+        devto_api_key=None,
+        imgur_client_id=None,
+        rate_limiter=None,
+        transport=None,
+        pool_size=10,
+        retry_policy=None,
+        devto_url=DEVTO_URL,
+        imgur_url=IMGUR_URL,
+        metrics=None,
+    ):
         self.devto_api_key = devto_api_key
+        self.devto_url = devto_url.rstrip("/")
+        self.imgur_url = imgur_url.rstrip("/")
         self.imgur_client_id = imgur_client_id
+        self.rate_limiter = rate_limiter
+        self.transport = transport or RequestsTransport(pool_size=pool_size)
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        self.metrics = metrics
 
     def get_articles(self):
-        """Gets all the articles published on dev.to under your account.
-        The API uses pagination and only returns 30 articles at a time. So
-        we keep querying the API and incrementing the page number until the number
-        of articles is less than 30.
+        """Gets all the articles published on dev.to under your account, see `iter_articles`.
 
         Returns:
-            dict: Where the key is the article title and values are the info about the article.
+            dict: Where the key is the article title and values are the `RemoteArticle`, without its markdown.
 
         """
-        page = 1
-        articles_data = {}
+        return {article.title: article for article in self.iter_articles()}
 
-        url = "https://dev.to/api/articles/me/all"
+    def iter_articles(self):
+        """Gets the articles published on dev.to under your account, a page at a time.
+        The API uses pagination, so we keep querying the API and incrementing the page number until we
+        get an empty page. The next page is only requested once all of the articles in the current page have
+        been used, so you can stop early.
+
+        Yields:
+            RemoteArticle: Each article on dev.to, without its markdown.
+
+        """
+        page = 1
+        url = f"{self.devto_url}/articles/me/all"
         while True:
             current_articles = self._make_http_request(
                 method="get", url=url, params={"page": page, "per_page": 200}, headers={"api-key": self.devto_api_key}
@@ -46,10 +82,7 @@ class HTTPClient:
 
             page += 1
             for article in current_articles:
-                title, uid, content = (article["title"], article["id"], article["body_markdown"])
-                articles_data[title] = {"id": uid, "content": content}
-
-        return articles_data
+                yield RemoteArticle.from_api(article)
 
     def update_article(self, article_id, article_data):
         """Update an already existing article on dev.to.
@@ -59,9 +92,11 @@ class HTTPClient:
             article_data (dict): The "new" article data we are updating on dev.to, such as content.
 
         """
-        data = {"article": {"body_markdown": article_data["content"]}}
-        url = f"https://dev.to/api/articles/{article_id}"
+        body_markdown = add_checksum(article_data["content"], article_data.get("checksum"))
+        data = {"article": {"title": article_data.get("title"), "body_markdown": body_markdown}}
+        url = f"{self.devto_url}/articles/{article_id}"
         headers = {"api-key": self.devto_api_key}
+        self._wait_for_rate_limit()
         response = self._make_http_request(method="put", url=url, json=data, headers=headers)
         return response
 
@@ -72,14 +107,17 @@ class HTTPClient:
             article_data (dict): The article data we are creating on dev.to, such as content.
 
         """
-        data = {"article": {"body_markdown": article_data["content"]}}
-        url = "https://dev.to/api/articles"
+        body_markdown = add_checksum(article_data["content"], article_data.get("checksum"))
+        data = {"article": {"title": article_data.get("title"), "body_markdown": body_markdown}}
+        url = f"{self.devto_url}/articles"
         headers = {"api-key": self.devto_api_key}
+        self._wait_for_rate_limit()
         response = self._make_http_request(method="post", url=url, json=data, headers=headers)
         return response
 
     def upload_image(self, local_path):
-        """Uploads an image to Imgur (as an anonymouse image).
+        """Uploads an image to Imgur (as an anonymouse image). The image is streamed from disk (see
+        `MultipartEncoder`) and closed as soon as the upload has finished.
 
         Args:
             local_path (str): The path to the image you want to upload..
@@ -88,41 +126,120 @@ class HTTPClient:
             str: URL on imgur where the image was uploaded.
 
         """
-        url = "https://api.imgur.com/3/upload"
-        headers = {"Authorization": f"Client-ID {self.imgur_client_id}"}
+        url = f"{self.imgur_url}/3/upload"
         image_path = os.path.join(os.getcwd(), local_path)
-        response = self._make_http_request(
-            method="post", url=url, headers=headers, files={"image": open(image_path, "rb")}
-        )
+        with open(image_path, "rb") as image:
+            body = MultipartEncoder(files={"image": (os.path.basename(image_path), image)})
+            headers = {
+                "Authorization": f"Client-ID {self.imgur_client_id}",
+                "Content-Type": body.content_type,
+                "Content-Length": str(len(body)),
+            }
+            response = self._make_http_request(method="post", url=url, headers=headers, data=body)
         link = response["data"]["link"]
         return link
 
-    def _make_http_request(self, method, url, **kwargs):
+    def close(self):
+        """Closes the connection pools used by the transport."""
+        self.transport.close()
+
+    def _wait_for_rate_limit(self):
+        """Blocks until the rate limiter allows us to publish another article, dev.to only allows
+        us to publish 10 articles every 30 seconds."""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+    def _make_http_request(self, method, url, idempotent=None, **kwargs):
         """Make a HTTP request to dev.to, for example to.
 
             - To get articles
             - To update article
             - To create an article
 
+        If the request fails and it's safe to send again (see `RetryPolicy`) it will be retried.
+
         Args:
             method (str): The HTTP method/verb to use i.e. "post", "get".
             url (str): The URL/endpoint to send the HTTP request to.
+            idempotent (bool): If the request is safe to send more than once, defaults to True for GET/PUT/DELETE.
             **kwargs: Extra parameters to use with "requests" such as `query` or `json`.
 
         Raises:
             HTTPConnextionException: When there are connection issues or the request times out.
 
         """
-        http_method = getattr(requests, method)
-        try:
-            response = http_method(url, timeout=30, **kwargs)
-        except (requests.ConnectTimeout, requests.ConnectionError) as e:
-            raise exceptions.HTTPConnectionException(msg=e)
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            self._rewind_files(kwargs.get("files"))
+            start = time.perf_counter()
+            try:
+                response = self.transport.request(method, url, timeout=30, **kwargs)
+            except exceptions.HTTPConnectionException:
+                self._record_request(method, url, None, start, kwargs)
+                if not self.retry_policy.should_retry(attempt, idempotent):
+                    raise
+
+                retry_after = None
+            else:
+                self._record_request(method, url, response, start, kwargs)
+                if not self.retry_policy.should_retry(attempt, idempotent, status_code=response.status_code):
+                    break
+
+                retry_after = response.headers.get("Retry-After")
+
+            delay = self.retry_policy.wait(attempt, retry_after)
+            logger.warning(f"Retried {method.upper()} request to {url} after waiting {delay:.1f} seconds.")
+            attempt += 1
 
         data = response.json()
         self._handle_response(status_code=response.status_code, response_json=data)
         return data
 
+    def _record_request(self, method, url, response, start, request_kwargs):
+        """Records the latency and size of a request (and its response) in the metrics, if we are collecting them.
+
+        Args:
+            method (str): The HTTP method/verb used i.e. "post", "get".
+            url (str): The URL/endpoint the HTTP request was sent to.
+            response (requests.Response): The HTTP response, None if we failed to connect.
+            start (float): When the request was sent, from `time.perf_counter`.
+            request_kwargs (dict): The parameters the request was sent with i.e. `json` or `files`.
+
+        """
+        if not self.metrics:
+            return
+
+        seconds = time.perf_counter() - start
+        bytes_sent = 0
+        if request_kwargs.get("json") is not None:
+            bytes_sent = len(json.dumps(request_kwargs["json"]).encode("utf-8"))
+        elif isinstance(request_kwargs.get("data"), MultipartEncoder):
+            bytes_sent = len(request_kwargs["data"])
+        for file_ in (request_kwargs.get("files") or {}).values():
+            bytes_sent += get_file_size(file_)
+
+        status_code = bytes_received = None
+        if response is not None:
+            status_code = response.status_code
+            content = getattr(response, "content", None)
+            bytes_received = len(content) if isinstance(content, bytes) else None
+
+        self.metrics.record_request(method, url, status_code, seconds, bytes_sent, bytes_received or 0)
+
+    @staticmethod
+    def _rewind_files(files):
+        """Moves back to the start of any files we are uploading, so they can be sent again if we retry a request.
+
+        Args:
+            files (dict): The files to upload, where the value is the file object.
+
+        """
+        for file_ in (files or {}).values():
+            file_.seek(0)
+
     @staticmethod
     def _handle_response(status_code, response_json):
         """Checks the HTTP response from the dev.to API and raises exceptions if the status code is
@@ -135,6 +252,7 @@ class HTTPClient:
         Raises:
             HTTPBadRequestException: If the API returns a "bad" HTTP response (400, 422).
             HTTPAuthRequestException: If the API returns an auth error HTTP response (401).
+            HTTPNotFoundException: If the article doesn't exist (404).
             HTTPServerException: If the API returns an server error HTTP response (5xx).
 
         """
@@ -142,5 +260,23 @@ class HTTPClient:
             raise exceptions.HTTPBadRequestException(msg=response_json)
         elif status_code == 401:
             raise exceptions.HTTPAuthException(msg=response_json)
+        elif status_code == 404:
+            raise exceptions.HTTPNotFoundException(msg=response_json)
         elif status_code not in [200, 201]:
             raise exceptions.HTTPServerException(msg=response_json)
+
+
+def get_file_size(file_):
+    """Gets the size of an open file, without reading it.
+
+    Args:
+        file_ (file): The file object.
+
+    Returns:
+        int: The size of the file in bytes, 0 if it can't be found.
+
+    """
+    try:
+        return os.fstat(file_.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        return 0
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+r"""A cache of the images we have uploaded to Imgur. The cache is keyed by the hash of the image contents, so an
+image is only ever uploaded once, even if it is used by many articles, renamed or the article it's in changes.
+
+The cache is stored in a SQLite database, if no path is given it will be kept in memory for the duration of the run.
+
+Example:
+    ::
+
+        $ image_cache = ImageCache(".devto_images.db")
+        $ image_cache.record(digest="abcdef", link="https://i.imgur.com/123456.png")
+        $ image_cache.prune(max_age_days=90)
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import sqlite3
+import threading
+import time
+
+
+class ImageCache:
+    def __init__(self, path=None):
+        self.path = path or ":memory:"
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS images "
+                "(digest TEXT PRIMARY KEY, link TEXT NOT NULL, uploaded_at REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+
+    def get(self, digest):
+        """Gets the link of an image we have already uploaded.
+
+        Args:
+            digest (str): The hash of the image contents.
+
+        Returns:
+            str: The link of the image on Imgur, None if the image hasn't been uploaded before.
+
+        """
+        with self._lock, self.connection:
+            row = self.connection.execute("SELECT link FROM images WHERE digest = ?", (digest,)).fetchone()
+            if row is None:
+                return None
+
+            self.connection.execute("UPDATE images SET last_used = ? WHERE digest = ?", (time.time(), digest))
+        return row[0]
+
+    def record(self, digest, link):
+        """Adds an uploaded image to the cache.
+
+        Args:
+            digest (str): The hash of the image contents.
+            link (str): The link of the image on Imgur.
+
+        """
+        now = time.time()
+        with self._lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO images (digest, link, uploaded_at, last_used) VALUES (?, ?, ?, ?)",
+                (digest, link, now, now),
+            )
+
+    def invalidate(self, digest):
+        """Removes an image from the cache, so it will be uploaded again the next time it is used.
+
+        Args:
+            digest (str): The hash of the image contents.
+
+        Returns:
+            bool: True if the image was in the cache.
+
+        """
+        with self._lock, self.connection:
+            cursor = self.connection.execute("DELETE FROM images WHERE digest = ?", (digest,))
+        return cursor.rowcount > 0
+
+    def prune(self, max_age_days):
+        """Removes all the images which haven't been used within `max_age_days` days.
+
+        Args:
+            max_age_days (int): Images not used within this many days are removed.
+
+        Returns:
+            int: The number of images removed from the cache.
+
+        """
+        oldest = time.time() - max_age_days * 24 * 60 * 60
+        with self._lock, self.connection:
+            cursor = self.connection.execute("DELETE FROM images WHERE last_used < ?", (oldest,))
+        return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
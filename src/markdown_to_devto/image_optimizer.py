@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+r"""Optimizes local images before they are uploaded to Imgur, using Pillow (`pip install markdown-to-devto[images]`).
+Images wider than `max_width` are resized and then recompressed, PNGs are optimized losslessly and JPEGs and WebPs are
+saved with the given `quality`. Images can also be converted to another format, i.e. large PNG screenshots to WebP.
+
+Images are optimized in a pool of processes, which is only started once the first image needs optimizing. As that
+happens in the threads uploading images, the processes are spawned rather than forked (on Python 3.7+). The optimized
+images are saved in the cache folder, named using the hash of the original image and the settings, so each image is
+only ever optimized once. Images which can't be optimized (i.e. animated GIFs) are marked as such in the cache folder,
+so they aren't sent to the pool again. If an image can't be optimized (or the optimized image isn't any smaller, or
+optimizing it failed) the original image is uploaded instead.
+
+Example:
+    ::
+
+        $ image_optimizer = ImageOptimizer(".devto_optimized_images", max_width=1000, image_format="webp")
+        $ image_path = image_optimizer.optimize("images/screenshot.png")
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+
+from .utils.hashing import hash_file
+
+logger = logging.getLogger(__name__)
+
+EXTENSIONS = {"PNG": ".png", "JPEG": ".jpg", "WEBP": ".webp"}
+
+
+class ImageOptimizer:
+    def __init__(self, cache_folder, max_width=None, image_format=None, quality=85, max_workers=None):
+        self.cache_folder = cache_folder
+        self.max_width = max_width
+        self.image_format = image_format.upper() if image_format else None
+        self.quality = quality
+        self.max_workers = max_workers
+        self.available = True
+        self._executor = None
+        self._lock = threading.Lock()
+        try:
+            from PIL import Image
+        except ImportError:
+            logger.warning("Pillow is not installed, images will be uploaded without being optimized.")
+            self.available = False
+            return
+
+        from concurrent.futures.process import BrokenProcessPool
+
+        # The image can't be read (or saved), it's too large, or a worker process died.
+        self._errors = (OSError, ValueError, Image.DecompressionBombError, BrokenProcessPool)
+        self._broken_pool_error = BrokenProcessPool
+
+    @property
+    def settings(self):
+        """dict: The settings used to optimize images, if they change images are optimized again."""
+        return {"max_width": self.max_width, "image_format": self.image_format, "quality": self.quality}
+
+    def optimize(self, image_path):
+        """Optimizes an image, unless it has already been optimized with the same settings.
+
+        Args:
+            image_path (str): The path of the local image.
+
+        Returns:
+            str: The path of the optimized image, or `image_path` if the image can't be (or doesn't need to be)
+            optimized.
+
+        """
+        if not self.available:
+            return image_path
+
+        try:
+            output_path = self._get_output_path(image_path)
+            skipped_path = f"{output_path}.skipped"
+            if os.path.isfile(skipped_path):
+                return image_path
+
+            if not os.path.isfile(output_path):
+                future = self._get_executor().submit(optimize_image, image_path, output_path, **self.settings)
+                if not future.result():
+                    logger.debug(f"Image at {image_path} can't be optimized, uploading the original image.")
+                    os.makedirs(self.cache_folder, exist_ok=True)
+                    open(skipped_path, "w").close()
+                    return image_path
+
+            if self.image_format is None and os.path.getsize(output_path) >= os.path.getsize(image_path):
+                logger.debug(f"Optimized image at {image_path} isn't any smaller, uploading the original image.")
+                return image_path
+        except self._errors as error:
+            logger.warning(f"Failed to optimize image at {image_path}, uploading the original image, {error}.")
+            if isinstance(error, self._broken_pool_error):
+                self.available = False
+            return image_path
+
+        logger.debug(f"Optimized image at {image_path}, saved at {output_path}.")
+        return output_path
+
+    def close(self):
+        with self._lock:
+            self.available = False
+            if self._executor:
+                self._executor.shutdown(wait=True)
+
+    def _get_executor(self):
+        """Gets the pool of processes used to optimize images, starting it the first time it's used."""
+        with self._lock:
+            if self._executor is None:
+                import concurrent.futures
+                import multiprocessing
+
+                # The pool is started from the threads uploading images, so the processes are not forked.
+                options = {"mp_context": multiprocessing.get_context("spawn")} if sys.version_info >= (3, 7) else {}
+                self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers, **options)
+            return self._executor
+
+    def _get_output_path(self, image_path):
+        """Gets where the optimized image is saved, using the hash of the image and of the settings."""
+        key = json.dumps({"digest": hash_file(image_path), **self.settings}, sort_keys=True)
+        name = hashlib.blake2b(key.encode("utf-8"), digest_size=20).hexdigest()
+        extension = EXTENSIONS.get(self.image_format) or os.path.splitext(image_path)[1].lower()
+        return os.path.join(self.cache_folder, f"{name}{extension}")
+
+
+def optimize_image(source_path, output_path, max_width=None, image_format=None, quality=85):
+    """Resizes and recompresses an image, run in a separate process.
+
+    Args:
+        source_path (str): The path of the image to optimize.
+        output_path (str): Where to save the optimized image.
+        max_width (int): Images wider than this are resized (keeping their aspect ratio), if None they aren't resized.
+        image_format (str): The format to save the image as i.e. "WEBP", if None the format isn't changed.
+        quality (int): The quality (1-100) to save JPEG and WebP images with.
+
+    Returns:
+        bool: True if the image was optimized, False if the image can't be optimized i.e. animated GIFs.
+
+    """
+    from PIL import Image
+
+    with Image.open(source_path) as image:
+        output_format = image_format or image.format
+        if output_format not in EXTENSIONS or getattr(image, "is_animated", False):
+            return False
+
+        if max_width and image.width > max_width:
+            height = max(1, round(image.height * max_width / image.width))
+            resampling = getattr(Image, "Resampling", Image)
+            image = image.resize((max_width, height), resampling.LANCZOS)
+
+        if output_format == "JPEG" and image.mode not in ["RGB", "L"]:
+            image = image.convert("RGB")
+        elif output_format == "WEBP" and image.mode not in ["RGB", "RGBA"]:
+            image = image.convert("RGBA" if "A" in image.mode or "transparency" in image.info else "RGB")
+
+        if output_format == "PNG":
+            options = {"optimize": True}
+        elif output_format == "JPEG":
+            options = {"quality": quality, "optimize": True, "progressive": True}
+        else:
+            options = {"quality": quality, "method": 6}
+
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        temporary_path = f"{output_path}.{os.getpid()}.tmp"
+        image.save(temporary_path, output_format, **options)
+
+    os.replace(temporary_path, output_path)
+    return True
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+r"""Uploads local images to Imgur using a bounded pool of threads. The same uploader is shared by every article, so
+images within an article and across articles are uploaded at the same time, but never more than `max_workers` at once.
+
+If the same image is used more than once (in one or many articles) it will only be uploaded once. If an image cache is
+given, images are looked up by the hash of their contents first, so images uploaded in previous runs are reused.
+Each image uploaded is also recorded in every journal given (one for each account), see `Journal`. If an image
+optimizer is given, images are resized and recompressed (see `ImageOptimizer`) before they are uploaded.
+
+Example:
+    ::
+
+        $ image_uploader = ImageUploader(http_client, max_workers=4)
+        $ links = image_uploader.upload_images(["images/a.png", "images/b.png"])
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import logging
+import os
+import threading
+
+from .utils import exceptions
+from .utils.hashing import hash_file
+
+logger = logging.getLogger(__name__)
+
+
+class ImageUploader:
+    def __init__(self, http_client, max_workers=4, image_cache=None, journals=(), image_optimizer=None):
+        self.http_client = http_client
+        self.max_workers = max_workers
+        self.image_cache = image_cache
+        self.journals = journals
+        self.image_optimizer = image_optimizer
+        import concurrent.futures
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        self._uploads = {}
+        self._lock = threading.Lock()
+
+    def upload_images(self, image_paths):
+        """Uploads images to Imgur, every image is uploaded even if some of the others fail.
+
+        Args:
+            image_paths (list): The paths of the local images to upload.
+
+        Raises:
+            ImageUploadException: If any of the images failed to upload, after all of them have been attempted.
+
+        Returns:
+            dict: Where the key is the local path of the image and the value is the link on Imgur.
+
+        """
+        futures = {image_path: self._submit(image_path) for image_path in image_paths}
+
+        links, failed_images = {}, {}
+        for image_path, future in futures.items():
+            try:
+                links[image_path] = future.result()
+            except (exceptions.HTTPException, OSError) as error:
+                logger.error(f"Failed to upload image at {image_path}, {error}.")
+                failed_images[image_path] = error
+
+        if failed_images:
+            raise exceptions.ImageUploadException(msg=failed_images)
+
+        return links
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def _submit(self, image_path):
+        """Submits an image to be uploaded, if the image is already being (or has been) uploaded we reuse that
+        upload. Failed uploads are not reused so they can be retried.
+
+        Args:
+            image_path (str): The path of the local image to upload.
+
+        Returns:
+            concurrent.futures.Future: Which will resolve to the link of the image on Imgur.
+
+        """
+        key = os.path.abspath(image_path)
+        with self._lock:
+            future = self._uploads.get(key)
+            if future is None or (future.done() and future.exception()):
+                future = self._executor.submit(self._upload_image, image_path)
+                self._uploads[key] = future
+
+        return future
+
+    def _upload_image(self, image_path):
+        """Uploads an image to Imgur, unless an image with the same contents is already in the image cache. Images are
+        cached using the hash of the local image (not the optimized image), so they can be removed from the cache
+        using their path.
+
+        Args:
+            image_path (str): The path of the local image to upload.
+
+        Returns:
+            str: The link of the image on Imgur.
+
+        """
+        if not self.image_cache:
+            return self._optimize_and_upload(image_path)
+
+        digest = hash_file(image_path)
+        link = self.image_cache.get(digest)
+        if link:
+            logger.debug(f"Image at {image_path} has already been uploaded to {link}.")
+            return link
+
+        link = self._optimize_and_upload(image_path)
+        self.image_cache.record(digest, link)
+        for journal in self.journals:
+            journal.record_image(digest, link)
+        return link
+
+    def _optimize_and_upload(self, image_path):
+        if self.image_optimizer:
+            image_path = self.image_optimizer.optimize(image_path)
+
+        logger.debug(f"Uploading image at {image_path}.")
+        return self.http_client.upload_image(image_path)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+r"""An append-only journal of the work completed during a run. Every article we publish and every image we upload is
+written to the journal (one JSON object per line) as soon as it completes, and flushed to disk. If the run dies part
+way through (i.e. a CI timeout) the next run can `resume` from the journal: the articles and images recorded in it
+are not uploaded again.
+
+The journal is only created once the first entry is written, and a run that finishes without any failures removes
+its journal, as there is nothing left to resume. The last line of a journal may have been partially written when the
+run died, lines which aren't valid JSON are ignored. If the journal can't be written (i.e. the folder is read-only)
+the run carries on without it.
+
+Example:
+    ::
+
+        $ journal = Journal(".devto_journal.jsonl", resume=True)
+        $ journal.record_article(path="articles/a.md", title="A", article_id=1234, checksum="abcdef")
+        $ journal.articles["articles/a.md"]["article_id"]
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+ARTICLE = "article"
+IMAGE = "image"
+
+
+class Journal:
+    def __init__(self, path=None, resume=False):
+        self.path = path
+        self.articles = {}
+        self.images = {}
+        self.resume = resume
+        self._lock = threading.Lock()
+        self._file = None
+        self._disabled = not path
+        if path and resume:
+            self._read()
+
+    def record_article(self, path, title, article_id, checksum):
+        """Records that an article has been published.
+
+        Args:
+            path (str): Path to the local markdown file.
+            title (str): The title of the article.
+            article_id (int): The id of the article on dev.to.
+            checksum (str): The checksum of the local article we published.
+
+        """
+        entry = {"path": str(path), "title": title, "article_id": article_id, "checksum": checksum}
+        self.articles[entry["path"]] = entry
+        self._append(ARTICLE, entry)
+
+    def record_image(self, digest, link):
+        """Records that an image has been uploaded.
+
+        Args:
+            digest (str): The hash of the image contents.
+            link (str): The link of the image on Imgur.
+
+        """
+        self.images[digest] = link
+        self._append(IMAGE, {"digest": digest, "link": link})
+
+    def close(self, remove=False):
+        """Closes the journal.
+
+        Args:
+            remove (bool): If True the journal is removed, i.e. because the run finished and there is nothing to
+                resume.
+
+        """
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+            if remove and self.path and os.path.isfile(self.path):
+                try:
+                    os.remove(self.path)
+                except OSError as error:
+                    logger.debug(f"Failed to remove journal at {self.path}, {error}.")
+
+    def _append(self, kind, entry):
+        """Appends an entry to the journal, it's flushed to disk before we carry on."""
+        with self._lock:
+            if not self._file and not self._open():
+                return
+
+            self._file.write(json.dumps({"type": kind, **entry}) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def _open(self):
+        """Opens the journal when the first entry is written, if it can't be opened the run carries on without it."""
+        if self._disabled:
+            return False
+
+        try:
+            self._file = open(self.path, "a" if self.resume else "w")
+            if self._file.tell() and not self._ends_with_new_line():
+                self._file.write("\n")
+        except OSError as error:
+            logger.debug(f"Failed to open journal at {self.path}, this run cannot be resumed, {error}.")
+            self._file = None
+            self._disabled = True
+        return self._file is not None
+
+    def _ends_with_new_line(self):
+        """Checks if the last line of the journal is complete, it won't be if the previous run died part way
+        through writing it."""
+        with open(self.path, "rb") as journal:
+            journal.seek(-1, os.SEEK_END)
+            return journal.read(1) == b"\n"
+
+    def _read(self):
+        """Reads the entries written by the previous run."""
+        try:
+            with open(self.path) as journal:
+                lines = journal.readlines()
+        except FileNotFoundError:
+            logger.info(f"No journal found at {self.path}, nothing to resume.")
+            return
+        except OSError as error:
+            logger.error(f"Failed to read journal at {self.path}, nothing to resume, {error}.")
+            return
+
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                kind = entry.pop("type")
+                if kind == ARTICLE:
+                    self.articles[entry["path"]] = entry
+                elif kind == IMAGE:
+                    self.images[entry["digest"]] = entry["link"]
+            except (AttributeError, KeyError, TypeError, ValueError):
+                logger.debug(f"Ignoring invalid entry in journal {self.path}, {line!r}.")
+
+        logger.info(
+            f"Resuming from journal {self.path}, {len(self.articles)} articles and {len(self.images)} images "
+            "have already been uploaded."
+        )
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+r"""A local manifest of the articles we have published to dev.to. It maps the path of the source markdown file (and its
+title) to the dev.to article id and the checksum we last published. This means if none of the local checksums have
+changed we don't need to make any HTTP requests at all.
+
+It also stores a fingerprint of each source file (its size, modification time and hash) and of the files it depends
+on, so files which haven't changed since they were published don't need to be read at all, see `fingerprint`.
+
+The manifest is stored in a SQLite database, if no path is given it will be kept in memory for the duration of the run.
+The manifest isn't thread safe, but it can be handed to another thread, i.e. the thread publishing to its account.
+
+Example:
+    ::
+
+        $ manifest = Manifest(".devto_manifest.db")
+        $ manifest.record(path="articles/a.md", title="A", article_id=1234, checksum="abcdef")
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import json
+import sqlite3
+
+
+class Manifest:
+    def __init__(self, path=None):
+        self.path = path or ":memory:"
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS articles "
+            "(path TEXT PRIMARY KEY, title TEXT NOT NULL, article_id INTEGER, checksum TEXT)"
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS files "
+            "(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest TEXT, settings TEXT, dependencies TEXT)"
+        )
+        self.connection.commit()
+
+    def get(self, path):
+        """Gets the manifest entry for a local article.
+
+        Args:
+            path (str): Path to the local markdown file.
+
+        Returns:
+            dict: With keys `path`, `title`, `article_id` and `checksum`, None if the article isn't in the manifest.
+
+        """
+        row = self.connection.execute(
+            "SELECT path, title, article_id, checksum FROM articles WHERE path = ?", (str(path),)
+        ).fetchone()
+        return self._to_entry(row)
+
+    def get_by_title(self, title):
+        """Gets the manifest entry for an article using its title.
+
+        Args:
+            title (str): The title of the article.
+
+        Returns:
+            dict: With keys `path`, `title`, `article_id` and `checksum`, None if the article isn't in the manifest.
+
+        """
+        row = self.connection.execute(
+            "SELECT path, title, article_id, checksum FROM articles WHERE title = ?", (title,)
+        ).fetchone()
+        return self._to_entry(row)
+
+    def is_unchanged(self, path, checksum):
+        """Checks if the local article has the same checksum as the one we last published.
+
+        Args:
+            path (str): Path to the local markdown file.
+            checksum (str): The checksum of the local article.
+
+        Returns:
+            bool: True if the article has been published before with the same checksum.
+
+        """
+        entry = self.get(path)
+        return bool(entry) and entry["checksum"] == checksum
+
+    def record(self, path, title, article_id, checksum):
+        """Adds (or updates) an article in the manifest, should be called after we have successfully
+        published an article. The fingerprint of the article is removed, see `record_file`.
+
+        Args:
+            path (str): Path to the local markdown file.
+            title (str): The title of the article.
+            article_id (int): The id of the article on dev.to.
+            checksum (str): The checksum of the article we published.
+
+        """
+        with self.connection:
+            self.connection.execute("DELETE FROM articles WHERE title = ? AND path != ?", (title, str(path)))
+            self.connection.execute("DELETE FROM files WHERE path = ?", (str(path),))
+            self.connection.execute(
+                "INSERT OR REPLACE INTO articles (path, title, article_id, checksum) VALUES (?, ?, ?, ?)",
+                (str(path), title, article_id, checksum),
+            )
+
+    def rebuild(self, devto_articles, local_articles):
+        """Rebuilds the manifest from the articles currently on dev.to. Any existing entries are removed first, so
+        articles only stay in the manifest if they exist on dev.to. If an article on dev.to doesn't have a checksum
+        (i.e. it was published before checksums were added to the articles we upload), but it's the article we
+        published, the checksum we published is kept.
+
+        Args:
+            devto_articles (dict): Where the key is the article title and values are the `RemoteArticle`.
+            local_articles (dict): Where the key is the article title and values are the article data.
+
+        """
+        entries = {}
+        for title, article in local_articles.items():
+            devto_article = devto_articles.get(title)
+            if not devto_article:
+                continue
+
+            checksum = devto_article.checksum
+            entry = self.get(article["source"])
+            if not checksum and entry and str(entry["article_id"]) == str(devto_article.id):
+                checksum = entry["checksum"]
+            entries[str(article["source"])] = (title, devto_article.id, checksum)
+
+        with self.connection:
+            self.connection.execute("DELETE FROM articles")
+            self.connection.execute("DELETE FROM files")
+            for path, (title, article_id, checksum) in entries.items():
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO articles (path, title, article_id, checksum) VALUES (?, ?, ?, ?)",
+                    (path, title, article_id, checksum),
+                )
+
+    def get_file(self, path):
+        """Gets the fingerprint of a local article, from when it was last published.
+
+        Args:
+            path (str): Path to the local markdown file.
+
+        Returns:
+            dict: With keys `size`, `mtime_ns`, `digest`, `settings` and `dependencies` (a list of path, size and
+            mtime_ns), None if the article doesn't have a fingerprint.
+
+        """
+        row = self.connection.execute(
+            "SELECT size, mtime_ns, digest, settings, dependencies FROM files WHERE path = ?", (str(path),)
+        ).fetchone()
+        if row is None:
+            return None
+
+        size, mtime_ns, digest, settings, dependencies = row
+        return {
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "digest": digest,
+            "settings": settings,
+            "dependencies": [tuple(dependency) for dependency in json.loads(dependencies)],
+        }
+
+    def record_file(self, path, size, mtime_ns, digest, settings, dependencies):
+        """Adds (or updates) the fingerprint of a local article.
+
+        Args:
+            path (str): Path to the local markdown file.
+            size (int): The size of the file in bytes.
+            mtime_ns (int): The modification time of the file.
+            digest (str): The hash of the contents of the file.
+            settings (str): The settings the article was transformed with.
+            dependencies (list): The path, size and mtime_ns of each file the article depends on.
+
+        """
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, digest, settings, dependencies) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (str(path), size, mtime_ns, digest, settings, json.dumps(dependencies)),
+            )
+
+    def update_file_stat(self, path, size, mtime_ns):
+        """Updates the size and modification time of a local article, i.e. when it was saved without changes."""
+        with self.connection:
+            self.connection.execute(
+                "UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?", (size, mtime_ns, str(path))
+            )
+
+    def close(self):
+        self.connection.close()
+
+    @staticmethod
+    def _to_entry(row):
+        if row is None:
+            return None
+
+        path, title, article_id, checksum = row
+        return {"path": path, "title": title, "article_id": article_id, "checksum": checksum}
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+r"""Collects metrics about a run, so we can tell where the time went. It records:
+
+    - How long each phase of the run took (i.e. scanning for articles, reading them and publishing them)
+    - The number of requests, their latency (as a histogram) and the bytes sent and received, for each endpoint
+    - How long we slept waiting for the rate limiter (and before retrying requests)
+    - What happened to each article i.e. published, unchanged or failed
+
+The metrics can be saved as a JSON report, or as a Prometheus textfile (for the node exporter's textfile collector).
+
+Example:
+    ::
+
+        $ metrics = Metrics()
+        $ with metrics.phase("scan"):
+        $     paths = list(get_article_paths(None, "articles/", []))
+        $ metrics.write_report("report.json")
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import collections
+import contextlib
+import json
+import os
+import re
+import threading
+import time
+import urllib.parse
+
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+ID_IN_PATH = re.compile(r"/\d+$")
+
+
+class Metrics:
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.phases = collections.OrderedDict()
+        self.endpoints = collections.OrderedDict()
+        self.articles = collections.OrderedDict()
+        self.rate_limit_sleep = 0
+        self.retry_sleep = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Times a phase of the run, if the same phase is timed more than once the times are added together.
+
+        Args:
+            name (str): The name of the phase.
+
+        """
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.add_phase_time(name, self.clock() - start)
+
+    def add_phase_time(self, name, seconds):
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0) + seconds
+
+    def record_request(self, method, url, status_code, seconds, bytes_sent=0, bytes_received=0):
+        """Records a HTTP request (each retry is recorded as a separate request).
+
+        Args:
+            method (str): The HTTP method/verb used i.e. "post", "get".
+            url (str): The URL of the request, ids in the path are replaced with `{id}`.
+            status_code (int): The HTTP response status code, None if we failed to connect.
+            seconds (float): How long the request took.
+            bytes_sent (int): The size of the request body.
+            bytes_received (int): The size of the response body.
+
+        """
+        endpoint = get_endpoint(method, url)
+        with self._lock:
+            stats = self.endpoints.get(endpoint)
+            if stats is None:
+                stats = {
+                    "requests": 0,
+                    "status_codes": {},
+                    "latency_seconds": 0,
+                    "latency_buckets": [0] * len(LATENCY_BUCKETS),
+                    "bytes_sent": 0,
+                    "bytes_received": 0,
+                }
+                self.endpoints[endpoint] = stats
+
+            status = str(status_code) if status_code else "error"
+            stats["requests"] += 1
+            stats["status_codes"][status] = stats["status_codes"].get(status, 0) + 1
+            stats["latency_seconds"] += seconds
+            stats["bytes_sent"] += bytes_sent
+            stats["bytes_received"] += bytes_received
+            for index, bucket in enumerate(LATENCY_BUCKETS):
+                if seconds <= bucket:
+                    stats["latency_buckets"][index] += 1
+
+    def record_article(self, path, outcome, title=None, error=None, account=None):
+        """Records what happened to an article.
+
+        Args:
+            path (str): Path to the local markdown file.
+            outcome (str): What happened to the article i.e. "published", "unchanged", "failed" or "invalid".
+            title (str): The title of the article, if we know it.
+            error (Exception): Why the article failed, if it did.
+            account (str): The name of the account the article was published to, when publishing to more than one
+                account.
+
+        """
+        key = f"{account}:{path}" if account else str(path)
+        entry = {"title": title, "outcome": outcome, "error": str(error) if error else None}
+        if account:
+            entry["account"] = account
+        with self._lock:
+            self.articles[key] = entry
+
+    def to_dict(self):
+        """Gets all of the metrics.
+
+        Returns:
+            dict: The metrics, which can be serialised as JSON.
+
+        """
+        with self._lock:
+            outcomes = collections.Counter(article["outcome"] for article in self.articles.values())
+            return {
+                "phases": dict(self.phases),
+                "endpoints": json.loads(json.dumps(self.endpoints)),
+                "latency_buckets": LATENCY_BUCKETS,
+                "bytes_sent": sum(stats["bytes_sent"] for stats in self.endpoints.values()),
+                "bytes_received": sum(stats["bytes_received"] for stats in self.endpoints.values()),
+                "rate_limit_sleep_seconds": self.rate_limit_sleep,
+                "retry_sleep_seconds": self.retry_sleep,
+                "retries": self.retries,
+                "outcomes": dict(outcomes),
+                "articles": json.loads(json.dumps(self.articles)),
+            }
+
+    def write_report(self, path):
+        """Saves the metrics as a JSON report.
+
+        Args:
+            path (str): Where to save the report.
+
+        """
+        write_atomically(path, json.dumps(self.to_dict(), indent=2))
+
+    def write_prometheus(self, path):
+        """Saves the metrics in the Prometheus text format. The file is replaced atomically, so the node exporter
+        never reads a partially written file.
+
+        Args:
+            path (str): Where to save the metrics, should end in `.prom`.
+
+        """
+        report = self.to_dict()
+        lines = [
+            "# HELP markdown_to_devto_phase_seconds Time spent in each phase of the run.",
+            "# TYPE markdown_to_devto_phase_seconds gauge",
+        ]
+        for name, seconds in report["phases"].items():
+            lines.append(f'markdown_to_devto_phase_seconds{{phase="{name}"}} {seconds}')
+
+        lines += [
+            "# HELP markdown_to_devto_request_duration_seconds Latency of the HTTP requests to each endpoint.",
+            "# TYPE markdown_to_devto_request_duration_seconds histogram",
+        ]
+        for endpoint, stats in report["endpoints"].items():
+            label = f'endpoint="{endpoint}"'
+            for bucket, count in zip(LATENCY_BUCKETS, stats["latency_buckets"]):
+                lines.append(f'markdown_to_devto_request_duration_seconds_bucket{{{label},le="{bucket}"}} {count}')
+            lines.append(f'markdown_to_devto_request_duration_seconds_bucket{{{label},le="+Inf"}} {stats["requests"]}')
+            lines.append(f"markdown_to_devto_request_duration_seconds_sum{{{label}}} {stats['latency_seconds']}")
+            lines.append(f"markdown_to_devto_request_duration_seconds_count{{{label}}} {stats['requests']}")
+
+        lines += [
+            "# HELP markdown_to_devto_requests_total HTTP requests to each endpoint, by status code.",
+            "# TYPE markdown_to_devto_requests_total counter",
+        ]
+        for endpoint, stats in report["endpoints"].items():
+            for status, count in stats["status_codes"].items():
+                lines.append(f'markdown_to_devto_requests_total{{endpoint="{endpoint}",status="{status}"}} {count}')
+
+        for direction in ["sent", "received"]:
+            lines += [
+                f"# HELP markdown_to_devto_bytes_{direction}_total Bytes {direction} in HTTP bodies, by endpoint.",
+                f"# TYPE markdown_to_devto_bytes_{direction}_total counter",
+            ]
+            for endpoint, stats in report["endpoints"].items():
+                value = stats[f"bytes_{direction}"]
+                lines.append(f'markdown_to_devto_bytes_{direction}_total{{endpoint="{endpoint}"}} {value}')
+
+        lines += [
+            "# HELP markdown_to_devto_sleep_seconds Time spent sleeping, waiting for the rate limit or to retry.",
+            "# TYPE markdown_to_devto_sleep_seconds gauge",
+            f'markdown_to_devto_sleep_seconds{{reason="rate_limit"}} {report["rate_limit_sleep_seconds"]}',
+            f'markdown_to_devto_sleep_seconds{{reason="retry"}} {report["retry_sleep_seconds"]}',
+            "# HELP markdown_to_devto_articles Articles by what happened to them.",
+            "# TYPE markdown_to_devto_articles gauge",
+        ]
+        for outcome, count in report["outcomes"].items():
+            lines.append(f'markdown_to_devto_articles{{outcome="{outcome}"}} {count}')
+
+        write_atomically(path, "\n".join(lines) + "\n")
+
+
+def get_endpoint(method, url):
+    """Gets the name of an endpoint, with any ids in the path replaced i.e. "PUT dev.to/api/articles/{id}".
+
+    Args:
+        method (str): The HTTP method/verb used i.e. "post", "get".
+        url (str): The URL of the request.
+
+    Returns:
+        str: The name of the endpoint.
+
+    """
+    parsed_url = urllib.parse.urlparse(url)
+    path = ID_IN_PATH.sub("/{id}", parsed_url.path)
+    return f"{method.upper()} {parsed_url.netloc}{path}"
+
+
+def write_atomically(path, contents):
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w") as output:
+        output.write(contents)
+    os.replace(temporary_path, path)
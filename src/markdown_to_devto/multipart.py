@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+r"""A streaming `multipart/form-data` encoder, used to upload images. Rather than building the whole body in memory
+(like `requests` does with `files=`), the body is generated as it's sent, reading each file from disk `chunk_size`
+bytes at a time. So only one chunk per upload is ever held in memory, however large the file (i.e. GIFs or videos).
+
+The length of the body is known up front (using the size of each file), so it's sent with a `Content-Length` header
+rather than using chunked transfer encoding. The encoder can be iterated over more than once, each time the files are
+read from the start, so requests using it can be retried.
+
+The encoder doesn't open or close any files, the caller should close them (i.e. using `with`) once the request has
+been sent.
+
+Example:
+    ::
+
+        $ with open("images/a.gif", "rb") as image:
+        $     body = MultipartEncoder(files={"image": ("a.gif", image)})
+        $     requests.post(url, data=body, headers={"Content-Type": body.content_type})
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import mimetypes
+import os
+import uuid
+
+CHUNK_SIZE = 64 * 1024
+
+
+class MultipartEncoder:
+    def __init__(self, fields=None, files=None, boundary=None, chunk_size=CHUNK_SIZE):
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self._parts = []
+        for name, value in (fields or {}).items():
+            self._parts.append((self._get_header(name), str(value).encode("utf-8"), None))
+
+        for name, (filename, file_) in (files or {}).items():
+            content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            start = file_.tell()
+            self._parts.append((self._get_header(name, filename, content_type), file_, start))
+
+    @property
+    def content_type(self):
+        """str: The value of the `Content-Type` header to send the body with."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self):
+        length = len(self._get_footer())
+        for header, body, start in self._parts:
+            body_length = len(body) if start is None else os.fstat(body.fileno()).st_size - start
+            length += len(header) + body_length + 2
+        return length
+
+    def __iter__(self):
+        for header, body, start in self._parts:
+            yield header
+            if start is None:
+                yield body
+            else:
+                body.seek(start)
+                for chunk in iter(lambda: body.read(self.chunk_size), b""):
+                    yield chunk
+            yield b"\r\n"
+        yield self._get_footer()
+
+    def _get_header(self, name, filename=None, content_type=None):
+        """Gets the boundary and headers which start each part of the body."""
+        disposition = f'form-data; name="{quote(name)}"'
+        if filename is not None:
+            disposition += f'; filename="{quote(filename)}"'
+
+        header = f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        if content_type:
+            header += f"Content-Type: {content_type}\r\n"
+        return f"{header}\r\n".encode("utf-8")
+
+    def _get_footer(self):
+        return f"--{self.boundary}--\r\n".encode("utf-8")
+
+
+def quote(value):
+    """Escapes the characters which can't be used in a quoted header parameter, as browsers do.
+
+    Args:
+        value (str): The name of a field or file.
+
+    Returns:
+        str: The escaped name.
+
+    """
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
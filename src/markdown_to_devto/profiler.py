@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+r"""Profiles a run, so slow articles (and slow transforms) can be found without changing the code. When enabled the
+profiler saves the following files in its output folder:
+
+    - `profile.pstats`: The cProfile stats of the main thread, i.e. for `python -m pstats` or `snakeviz`
+    - `profile.collapsed`: Stacks sampled from every thread, in the collapsed format used by `flamegraph.pl`
+      and speedscope
+    - `profile.json`: The peak memory (from tracemalloc) of each phase, and how long each step took to read and
+      transform each article
+
+If no output folder is given the profiler is disabled, and does nothing.
+
+Example:
+    ::
+
+        $ profiler = Profiler("profile/")
+        $ profiler.start()
+        $ with profiler.phase("read"):
+        $     articles = get_local_articles(paths, profiler=profiler)
+        $ profiler.stop()
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import collections
+import contextlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_INTERVAL = 0.005
+
+
+class Profiler:
+    def __init__(self, output_folder=None, sample_interval=SAMPLE_INTERVAL):
+        self.output_folder = output_folder
+        self.sample_interval = sample_interval
+        self.memory_peaks = collections.OrderedDict()
+        self.article_timings = collections.OrderedDict()
+        self.samples = collections.Counter()
+        self._profile = None
+        self._sampler = None
+        self._stopped = threading.Event()
+
+    @property
+    def enabled(self):
+        """bool: True if the run is being profiled."""
+        return bool(self.output_folder)
+
+    def start(self):
+        """Starts profiling the main thread and sampling the stacks of every thread."""
+        if not self.enabled:
+            return
+
+        import cProfile
+        import tracemalloc
+
+        tracemalloc.start()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        self._sampler = threading.Thread(target=self._sample, name="profiler", daemon=True)
+        self._sampler.start()
+
+    def stop(self):
+        """Stops profiling and saves the results in the output folder."""
+        if not self.enabled or not self._profile:
+            return
+
+        import tracemalloc
+
+        self._profile.disable()
+        self._stopped.set()
+        self._sampler.join()
+        tracemalloc.stop()
+        self.save()
+        self._profile = None
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Records the peak memory allocated during a phase of the run.
+
+        Args:
+            name (str): The name of the phase.
+
+        """
+        if not self._profile:
+            yield
+            return
+
+        import tracemalloc
+
+        current = tracemalloc.get_traced_memory()[0]
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            phase_peak = tracemalloc.get_traced_memory()[1]
+            self.memory_peaks[name] = max(self.memory_peaks.get(name, 0), phase_peak - current)
+
+    def record_article(self, path, timings):
+        """Records how long each step took to read and transform an article.
+
+        Args:
+            path (str): Path to the local markdown file.
+            timings (dict): Where the key is the name of the step and the value is how long it took in seconds,
+                see `time_step`.
+
+        """
+        self.article_timings[str(path)] = dict(timings)
+
+    def save(self):
+        """Saves the profile, sampled stacks and timings in the output folder."""
+        os.makedirs(self.output_folder, exist_ok=True)
+        self._profile.dump_stats(os.path.join(self.output_folder, "profile.pstats"))
+        with open(os.path.join(self.output_folder, "profile.collapsed"), "w") as collapsed:
+            for stack, count in self.samples.most_common():
+                collapsed.write(f"{stack} {count}\n")
+
+        report = {"memory_peaks": self.memory_peaks, "articles": self.article_timings}
+        with open(os.path.join(self.output_folder, "profile.json"), "w") as profile_json:
+            json.dump(report, profile_json, indent=2)
+
+        for path, timings in self.get_slowest_articles():
+            step = max(timings, key=timings.get)
+            logger.info(
+                f"Article at {path} took {sum(timings.values()):.3f} seconds to read, "
+                f"the slowest step was {step} ({timings[step]:.3f} seconds)."
+            )
+        logger.info(f"Saved profile of the run in {self.output_folder}.")
+
+    def get_slowest_articles(self, count=5):
+        """Gets the articles which took the longest to read and transform.
+
+        Args:
+            count (int): How many articles to get.
+
+        Returns:
+            list: Tuples of the path of the article and its timings, slowest first.
+
+        """
+        articles = [(path, timings) for path, timings in self.article_timings.items() if timings]
+        articles.sort(key=lambda article: sum(article[1].values()), reverse=True)
+        return articles[:count]
+
+    def _sample(self):
+        """Samples the stack of every thread (but this one) until the profiler is stopped."""
+        sampler_id = threading.get_ident()
+        while not self._stopped.wait(self.sample_interval):
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == sampler_id:
+                    continue
+
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(thread_names.get(thread_id, "thread"))
+                self.samples[";".join(reversed(stack))] += 1
+
+
+@contextlib.contextmanager
+def time_step(timings, name):
+    """Times a step, if the same step is timed more than once (i.e. for each code block) the times are added together.
+
+    Args:
+        timings (dict): Where the time is recorded, if None the step is not timed.
+        name (str): The name of the step.
+
+    """
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0) + time.perf_counter() - start
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+r"""A thread-safe token bucket, used to make sure we don't send more requests than the dev.to API allows. The dev.to
+API only lets us publish 10 articles every 30 seconds.
+
+The bucket starts with `capacity` tokens, each request takes a token and a token is only put back into the bucket
+`period` seconds after it was taken. So we can use the whole budget straight away but never send more than `capacity`
+requests in any `period` long window.
+
+The same bucket can be shared by threads (`acquire`) and coroutines (`acquire_async`).
+
+Example:
+    ::
+
+        $ rate_limiter = TokenBucket(capacity=10, period=30)
+        $ rate_limiter.acquire()
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import collections
+import threading
+import time
+
+
+class TokenBucket:
+    def __init__(self, capacity=10, period=30, clock=time.monotonic, sleep=time.sleep):
+        self.capacity = capacity
+        self.period = period
+        self.clock = clock
+        self.sleep = sleep
+        self.time_slept = 0
+        self._spent = collections.deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Takes a token from the bucket, if the bucket is empty we block until a token is put back."""
+        while True:
+            wait = self._reserve()
+            if wait <= 0:
+                break
+
+            self.sleep(wait)
+            with self._lock:
+                self.time_slept += wait
+
+    async def acquire_async(self):
+        """Takes a token from the bucket, if the bucket is empty we wait (without blocking the event loop) until a
+        token is put back."""
+        import asyncio
+
+        while True:
+            wait = self._reserve()
+            if wait <= 0:
+                break
+
+            await asyncio.sleep(wait)
+            with self._lock:
+                self.time_slept += wait
+
+    def _reserve(self):
+        """Tries to take a token from the bucket without blocking.
+
+        Returns:
+            float: 0 if we took a token, else how long to wait (in seconds) until a token will be put back.
+
+        """
+        with self._lock:
+            now = self.clock()
+            while self._spent and self._spent[0] + self.period <= now:
+                self._spent.popleft()
+
+            if len(self._spent) < self.capacity:
+                self._spent.append(now)
+                return 0
+
+            return self._spent[0] + self.period - now
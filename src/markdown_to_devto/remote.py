@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+r"""A compact record of an article on dev.to. We only need to know the id of each article (to update it) and its
+checksum (to tell if it has changed), so the markdown of the article is dropped as soon as we receive it. The checksum
+is found by scanning the frontmatter of the markdown, rather than parsing the YAML.
+
+The frontmatter of a local article isn't sent to dev.to, so the checksum is added to the end of the markdown we upload
+as an HTML comment (see `add_checksum`), which isn't shown on dev.to.
+
+Example:
+    ::
+
+        $ article = RemoteArticle.from_api({"id": 1, "title": "A", "body_markdown": "---\nchecksum: abc\n---\n"})
+        $ article.checksum
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+
+CHECKSUM_COMMENT = "<!-- checksum: "
+
+
+class RemoteArticle:
+    __slots__ = ("id", "title", "published_at", "edited_at", "checksum")
+
+    def __init__(self, id, title, published_at=None, edited_at=None, checksum=""):  # noqa: A002
+        self.id = id
+        self.title = title
+        self.published_at = published_at
+        self.edited_at = edited_at
+        self.checksum = checksum
+
+    @classmethod
+    def from_api(cls, article):
+        """Creates a record from an article returned by the dev.to API.
+
+        Args:
+            article (dict): The article returned by the dev.to API.
+
+        Returns:
+            RemoteArticle: The record of the article, without its markdown.
+
+        """
+        return cls(
+            id=article["id"],
+            title=article["title"],
+            published_at=article.get("published_at"),
+            edited_at=article.get("edited_at"),
+            checksum=get_checksum(article.get("body_markdown") or ""),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, RemoteArticle):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    def __repr__(self):
+        return f"RemoteArticle(id={self.id!r}, title={self.title!r}, checksum={self.checksum!r})"
+
+
+def add_checksum(markdown, checksum):
+    """Adds the checksum to the end of the markdown of an article, as an HTML comment, so it can be found using
+    `get_checksum` once the article has been uploaded.
+
+    Args:
+        markdown (str): The markdown of the article.
+        checksum (str): The checksum of the article, if None the markdown isn't changed.
+
+    Returns:
+        str: The markdown with the checksum added.
+
+    """
+    if not checksum:
+        return markdown
+
+    return f"{markdown}\n\n{CHECKSUM_COMMENT}{checksum} -->\n"
+
+
+def get_checksum(markdown):
+    """Gets the checksum of an article, by scanning the top level keys of the frontmatter. If the frontmatter doesn't
+    have a checksum, the checksum added to the end of the article is used, see `add_checksum`.
+
+    Args:
+        markdown (str): The markdown of the article.
+
+    Returns:
+        str: The checksum of the article, an empty string if the article doesn't have one.
+
+    """
+    end = markdown.find("\n---", 3) if markdown.startswith("---") else -1
+    if end != -1:
+        for line in markdown[3:end].splitlines():
+            key, separator, value = line.partition(":")
+            if separator and key.rstrip() == "checksum":
+                return value.split(" #", 1)[0].strip().strip("'\"")
+
+    start = markdown.rfind(CHECKSUM_COMMENT)
+    if start == -1:
+        return ""
+
+    start += len(CHECKSUM_COMMENT)
+    end = markdown.find("-->", start)
+    return markdown[start:end].strip() if end != -1 else ""
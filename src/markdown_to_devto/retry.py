@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+r"""The policy used by the `HTTPClient` to decide if (and when) a failed HTTP request should be retried. Requests are
+retried with exponential backoff and jitter, if the API tells us how long to wait with a `Retry-After` header (i.e.
+when we are rate limited) we wait for that long instead.
+
+Only requests which are safe to send again are retried. Idempotent requests (such as GETs) are retried when the
+request fails to connect, is rate limited (429) or there is a server error (5xx). Other requests (such as creating an
+article) are only retried when they are rate limited, because then we know the request wasn't processed.
+
+Example:
+    ::
+
+        $ retry_policy = RetryPolicy(max_retries=3)
+        $ http_client = HTTPClient(devto_api_key=12345678, retry_policy=retry_policy)
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import datetime
+import random
+import threading
+import time
+
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+
+class RetryPolicy:
+    def __init__(self, max_retries=3, backoff_factor=1, max_backoff=60, sleep=None):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.sleep = sleep or time.sleep
+        self.retries = 0
+        self.time_slept = 0
+        self._lock = threading.Lock()
+
+    def should_retry(self, attempt, idempotent, status_code=None):
+        """Checks if a failed request should be retried.
+
+        Args:
+            attempt (int): How many times the request has already been retried.
+            idempotent (bool): If the request is safe to send more than once.
+            status_code (int): The HTTP response status code, None if we failed to connect.
+
+        Returns:
+            bool: True if we should retry the request.
+
+        """
+        if attempt >= self.max_retries:
+            return False
+        elif status_code == 429:
+            return True
+
+        return idempotent and (status_code is None or status_code in RETRY_STATUS_CODES)
+
+    def get_delay(self, attempt, retry_after=None):
+        """Works out how long to wait before retrying a request.
+
+        Args:
+            attempt (int): How many times the request has already been retried.
+            retry_after (str): The value of the `Retry-After` header, if the response had one.
+
+        Returns:
+            float: How long to wait (in seconds) before retrying the request.
+
+        """
+        retry_after_seconds = parse_retry_after(retry_after)
+        if retry_after_seconds is not None:
+            return retry_after_seconds
+
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** attempt)
+        return random.uniform(backoff / 2, backoff)
+
+    def wait(self, attempt, retry_after=None):
+        """Waits before retrying a request, and counts the retry.
+
+        Args:
+            attempt (int): How many times the request has already been retried.
+            retry_after (str): The value of the `Retry-After` header, if the response had one.
+
+        Returns:
+            float: How long we waited (in seconds).
+
+        """
+        delay = self.get_delay(attempt, retry_after)
+        self.count_retry(delay)
+        self.sleep(delay)
+        return delay
+
+    def count_retry(self, delay=0):
+        with self._lock:
+            self.retries += 1
+            self.time_slept += delay
+
+
+def parse_retry_after(retry_after):
+    """Parses the `Retry-After` header, which can either be a number of seconds or a HTTP date.
+
+    Args:
+        retry_after (str): The value of the `Retry-After` header.
+
+    Returns:
+        float: How long to wait (in seconds), None if the header is missing or invalid.
+
+    """
+    if not isinstance(retry_after, str):
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    import email.utils
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+
+    now = datetime.datetime.now(tz=retry_at.tzinfo)
+    return max(0.0, (retry_at - now).total_seconds())
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+r"""A single-pass transform engine for articles. Rather than running each transform over the whole article (and then
+calling `content.replace` for every match), the article is split into paragraphs once and then tokenized once into
+blocks: fences (code blocks), admonitions, images and the text in between. Each block is rewritten as we go and the
+article is joined back together once at the end, so transforming an article takes linear time.
+
+The output is the same as running `remove_new_lines_in_paragraph`, `replace_code_meta` and `replace_admonitions`
+one after another. Imported code files are read through a `CodeFileCache`, so a file imported by many articles is only
+read once.
+
+Example:
+    ::
+
+        $ content = transform_content(article.content, path="articles/a.md")
+        $ images = [token.groups for token in tokenize(content) if token.kind == IMAGE]
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import collections
+import logging
+import os
+import re
+
+from .code_cache import CodeFileCache
+from .profiler import time_step
+
+logger = logging.getLogger(__name__)
+
+TEXT = "text"
+FENCE = "fence"
+ADMONITION = "admonition"
+IMAGE = "image"
+
+PARAGRAPH_SKIP_CHARS = ["```", "---", "-", "*", "![", ":::"]
+BLOCKS_IN_MARKDOWN = re.compile(
+    r"(?P<fence>```[a-z=.:\/ ]*\n[\s\S]*?\n```)"
+    r"|(?P<admonition>:::[\s\S]*?\n:::)"
+    r"|(?P<image>!\[(?P<description>.*?)\]\((?P<image_path>.*?)\))"
+)
+CODE_BLOCKS_IN_MARKDOWN = re.compile(r"```[a-z=.:\/ ]*\n[\s\S]*?\n```")
+CODE_TITLE_IN_MARKDOWN = re.compile(r"(```[a-z]*):title=.+ ")
+
+Token = collections.namedtuple("Token", ["kind", "text", "groups"])
+TRANSFORM_STEPS = {TEXT: "text", FENCE: "import_code_block", ADMONITION: "admonition_to_quote", IMAGE: "text"}
+
+code_file_cache = CodeFileCache()
+
+
+def transform_content(content, path, code_cache=None, timings=None):
+    """Transforms the content of an article so it can be published on dev.to, see `transform_token` for
+    the changes we make.
+
+    Args:
+        content (str): Article data.
+        path (str): The path to the markdown file.
+        code_cache (CodeFileCache): Used to read imported code files, defaults to the cache shared by the whole run.
+        timings (dict): If set, how long each step took is added to it (see `time_step`), i.e. `tokenize` and
+            `import_code_block`.
+
+    Returns:
+        str: The transformed content.
+
+    """
+    if timings is None:
+        content = join_paragraph_lines(content)
+        return "".join(transform_token(token, path, code_cache) for token in tokenize(content))
+
+    with time_step(timings, "join_paragraph_lines"):
+        content = join_paragraph_lines(content)
+    with time_step(timings, "tokenize"):
+        tokens = list(tokenize(content))
+
+    blocks = []
+    for token in tokens:
+        with time_step(timings, TRANSFORM_STEPS[token.kind]):
+            blocks.append(transform_token(token, path, code_cache))
+    return "".join(blocks)
+
+
+def tokenize(content):
+    """Splits the content into blocks, in a single pass over the content.
+
+    Args:
+        content (str): Article data.
+
+    Yields:
+        Token: Where `kind` is one of `TEXT`, `FENCE`, `ADMONITION` or `IMAGE`, `text` is the markdown of the block
+        and for images `groups` is a tuple of the description and path of the image.
+
+    """
+    position = 0
+    for match in BLOCKS_IN_MARKDOWN.finditer(content):
+        if match.start() > position:
+            yield Token(TEXT, content[position : match.start()], None)
+
+        if match.group(FENCE) is not None:
+            yield Token(FENCE, match.group(0), None)
+        elif match.group(ADMONITION) is not None:
+            yield Token(ADMONITION, match.group(0), None)
+        else:
+            yield Token(IMAGE, match.group(0), (match.group("description"), match.group("image_path")))
+        position = match.end()
+
+    if position < len(content):
+        yield Token(TEXT, content[position:], None)
+
+
+def transform_token(token, path, code_cache=None):
+    """Rewrites a single block, code blocks which import code are replaced with the code
+    (see `import_code_block`) and admonitions are replaced with quotes (see `admonition_to_quote`).
+
+    Args:
+        token (Token): The block to rewrite.
+        path (str): The path to the markdown file.
+        code_cache (CodeFileCache): Used to read imported code files, defaults to the cache shared by the whole run.
+
+    Returns:
+        str: The new markdown for the block.
+
+    """
+    if token.kind == FENCE:
+        return import_code_block(token.text, path, code_cache)
+    elif token.kind == ADMONITION:
+        return admonition_to_quote(token.text, path, code_cache)
+    return token.text
+
+
+def join_paragraph_lines(content):
+    """Removes new lines from paragraphs, but not from elements like code blocks or lists. The
+    same as `remove_new_lines_in_paragraph`.
+
+    Args:
+        content (str): Article data.
+
+    Returns:
+        str: The content with new lines removed from paragraphs.
+
+    """
+    endswith_char = ""
+    paragraphs = content.split("\n\n")
+    for index, paragraph in enumerate(paragraphs):
+        startswith_char = next((char for char in PARAGRAPH_SKIP_CHARS if paragraph.startswith(char)), "")
+
+        if startswith_char or endswith_char:
+            if startswith_char:
+                endswith_char = startswith_char
+
+            if paragraph.endswith(endswith_char):
+                endswith_char = ""
+            continue
+
+        paragraphs[index] = paragraph.replace("\n", " ")
+
+    return "\n\n".join(paragraphs)
+
+
+def import_code_block(code_block, path, code_cache=None):
+    """Replaces a code block which uses `gatsby-remark-import-code` with the code it imports. The same as
+    `replace_code_meta` but for a single code block.
+
+    Args:
+        code_block (str): The markdown of the code block.
+        path (str): The path to the markdown file.
+        code_cache (CodeFileCache): Used to read imported code files, defaults to the cache shared by the whole run.
+
+    Returns:
+        str: The code block with the imported code, or the original code block if it doesn't import any code.
+
+    """
+    imported_code = get_imported_code(code_block, path)
+    if not imported_code:
+        return code_block
+
+    start_code_block, absolute_source_code_path = imported_code
+    logger.debug(f"Importing code block from, {absolute_source_code_path}.")
+
+    try:
+        code_contents = (code_cache or code_file_cache).read(absolute_source_code_path)
+    except FileNotFoundError:
+        logger.warning(f"File not found at {absolute_source_code_path}")
+        return code_block
+
+    return f"{start_code_block}\n{code_contents}\n```"
+
+
+def get_imported_code(code_block, path):
+    """Gets the code file imported by a code block which uses `gatsby-remark-import-code`.
+
+    Args:
+        code_block (str): The markdown of the code block.
+        path (str): The path to the markdown file.
+
+    Returns:
+        tuple: The start of the code block (i.e. ```python) and the path to the code file, None if the code block
+        doesn't import any code.
+
+    """
+    start_code_block = CODE_TITLE_IN_MARKDOWN.sub(r"\1 ", code_block)
+    if "file=" not in start_code_block:
+        return None
+
+    meta = start_code_block.split("\n", 1)[0].split(" ")
+    if len(meta) < 2:
+        return None
+
+    source_code_path = meta[1].replace("file=", "")
+    return meta[0], os.path.join(os.path.dirname(path), source_code_path)
+
+
+def get_dependencies(content, path):
+    """Gets the paths of all the local files an article depends on, the code files it imports and the images
+    it references. The files don't have to exist.
+
+    Args:
+        content (str): Article data.
+        path (str): The path to the markdown file.
+
+    Returns:
+        list: The paths to the code files and images.
+
+    """
+    dependencies = []
+    for token in tokenize(join_paragraph_lines(content)):
+        if token.kind == IMAGE and "://" not in token.groups[1]:
+            dependencies.append(os.path.join(os.path.dirname(path), token.groups[1]))
+            continue
+
+        code_blocks = []
+        if token.kind == FENCE:
+            code_blocks = [token.text]
+        elif token.kind == ADMONITION:
+            code_blocks = CODE_BLOCKS_IN_MARKDOWN.findall(token.text)
+
+        for code_block in code_blocks:
+            imported_code = get_imported_code(code_block, path)
+            if imported_code:
+                dependencies.append(imported_code[1])
+
+    return dependencies
+
+
+def admonition_to_quote(admonition, path, code_cache=None):
+    """Replaces an admonition with a quote block. The same as `replace_admonitions` but for a single admonition,
+    any code blocks within the admonition are imported first.
+
+    Args:
+        admonition (str): The markdown of the admonition.
+        path (str): The path to the markdown file.
+        code_cache (CodeFileCache): Used to read imported code files, defaults to the cache shared by the whole run.
+
+    Returns:
+        str: The admonition as a `>` quote.
+
+    """
+    admonition = CODE_BLOCKS_IN_MARKDOWN.sub(
+        lambda match: import_code_block(match.group(0), path, code_cache), admonition
+    )
+    admonition_content = admonition.split("\n")[1:-1]
+    return f"> {' '.join(admonition_content)}"
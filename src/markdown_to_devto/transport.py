@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+r"""Transports used by the `HTTPClient` to actually send HTTP requests. A transport keeps long-lived connection pools
+(one per host) so we don't pay for a new TCP and TLS handshake on every request.
+
+Any object with a `request(method, url, **kwargs)` method, which returns a response with `status_code`, `headers`
+and `json()`, and a `close()` method can be used as a transport.
+
+Example:
+    ::
+
+        $ transport = RequestsTransport(pool_size=10)
+        $ http_client = HTTPClient(devto_api_key=12345678, transport=transport)
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+from .utils import exceptions
+
+
+class RequestsTransport:
+    def __init__(self, pool_size=10):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.requests = requests
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        self.session.headers["Accept-Encoding"] = "gzip, deflate"
+        adapter = HTTPAdapter(pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(self, method, url, **kwargs):
+        """Sends a HTTP request using a pooled, keep-alive session. Responses are gzip decoded by requests.
+
+        Args:
+            method (str): The HTTP method/verb to use i.e. "post", "get".
+            url (str): The URL/endpoint to send the HTTP request to.
+            **kwargs: Extra parameters to use with "requests" such as `query` or `json`.
+
+        Raises:
+            HTTPConnectionException: When there are connection issues or the request times out.
+
+        Returns:
+            requests.Response: The HTTP response.
+
+        """
+        http_method = getattr(self.session, method)
+        try:
+            response = http_method(url, **kwargs)
+        except (self.requests.ConnectTimeout, self.requests.ConnectionError) as e:
+            raise exceptions.HTTPConnectionException(msg=e)
+
+        return response
+
+    def close(self):
+        self.session.close()
+
+
+class HTTPXTransport:
+    def __init__(self, pool_size=10, http2=True):
+        import httpx
+
+        self.httpx = httpx
+        self.pool_size = pool_size
+        limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        self.client = httpx.Client(http2=http2, limits=limits)
+
+    def request(self, method, url, **kwargs):
+        """Sends a HTTP request using httpx, which can use HTTP/2 (requires `httpx[http2]`).
+
+        Args:
+            method (str): The HTTP method/verb to use i.e. "post", "get".
+            url (str): The URL/endpoint to send the HTTP request to.
+            **kwargs: Extra parameters to use with "httpx" such as `params` or `json`, a streamed body (i.e.
+                `MultipartEncoder`) can be passed as `data` like with "requests".
+
+        Raises:
+            HTTPConnectionException: When there are connection issues or the request times out.
+
+        Returns:
+            httpx.Response: The HTTP response.
+
+        """
+        if kwargs.get("data") is not None and not isinstance(kwargs["data"], dict):
+            kwargs["content"] = kwargs.pop("data")
+
+        try:
+            response = self.client.request(method.upper(), url, **kwargs)
+        except (self.httpx.TimeoutException, self.httpx.TransportError) as e:
+            raise exceptions.HTTPConnectionException(msg=e)
+
+        return response
+
+    def close(self):
+        self.client.close()
@@ -14,6 +14,12 @@ class HTTPBadRequestException(HTTPException):
         super().__init__(msg)
 
 
+class HTTPNotFoundException(HTTPException):
+    def __init__(self, msg):
+        self.msg = msg
+        super().__init__(msg)
+
+
 class HTTPServerException(HTTPException):
     def __init__(self, msg):
         self.msg = msg
@@ -24,3 +30,9 @@ class HTTPConnectionException(HTTPException):
     def __init__(self, msg):
         self.msg = msg
         super().__init__(msg)
+
+
+class ImageUploadException(Exception):
+    def __init__(self, msg):
+        self.msg = msg
+        super().__init__(msg)
@@ -0,0 +1,48 @@
+import hashlib
+
+
+def hash_file(path, chunk_size=1024 * 1024):
+    """Hashes the contents of a file (using BLAKE2), reading it in chunks so large files are never fully loaded
+    into memory.
+
+    Args:
+        path (str): Path to the file to hash.
+        chunk_size (int): How many bytes to read at a time.
+
+    Returns:
+        str: The hex digest of the file contents.
+
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as file_:
+        for chunk in iter(lambda: file_.read(chunk_size), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def hash_files(paths, workers=None):
+    """Hashes the contents of many files using a pool of threads, `hashlib` releases the GIL while hashing so
+    the files are hashed in parallel.
+
+    Args:
+        paths (list): The paths of the files to hash.
+        workers (int): Number of threads to use, if None uses the `ThreadPoolExecutor` default.
+
+    Returns:
+        dict: Where the key is the path and the value is the hex digest of the file contents, files which can't be
+        read are not included.
+
+    """
+    import concurrent.futures
+
+    digests = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(hash_file, path): path for path in paths}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                digests[futures[future]] = future.result()
+            except OSError:
+                continue
+
+    return digests
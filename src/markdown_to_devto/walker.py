@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+r"""Finds the markdown articles in a folder. Ignored folders are pruned before we descend into them, so large folders
+like `node_modules` or `.git` are never walked. Paths are yielded lazily as they are found.
+
+Folders and files can be ignored using gitignore-style patterns, either passed in or read from a `.devtoignore` file
+in the root of the folder. For example:
+
+::
+
+    # Ignore these folders anywhere in the tree
+    node_modules/
+    .history/
+    # Ignore drafts, except for this one
+    drafts/*.md
+    !drafts/ready.md
+
+Example:
+    ::
+
+        $ paths = list(walk_articles("articles/", ignore_patterns=["node_modules/"]))
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import os
+import re
+from pathlib import Path
+
+IGNORE_FILE_NAME = ".devtoignore"
+
+
+class IgnorePattern:
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.negated = pattern.startswith("!")
+        pattern = pattern[1:] if self.negated else pattern
+        self.directory_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        prefix = "" if anchored or pattern.startswith("**/") else "(?:.*/)?"
+        self.regex = re.compile(f"{prefix}{translate_pattern(pattern)}")
+
+    def matches(self, relative_path, is_dir):
+        """Checks if a path matches the pattern.
+
+        Args:
+            relative_path (str): The path relative to the root folder, using `/` as the separator.
+            is_dir (bool): If the path is a folder.
+
+        Returns:
+            bool: True if the path matches.
+
+        """
+        if self.directory_only and not is_dir:
+            return False
+
+        return self.regex.fullmatch(relative_path) is not None
+
+
+class IgnoreRules:
+    def __init__(self, patterns=()):
+        self.patterns = [IgnorePattern(pattern) for pattern in patterns]
+
+    def is_ignored(self, relative_path, is_dir):
+        """Checks if a path should be ignored, like gitignore the last pattern that matches the path wins.
+
+        Args:
+            relative_path (str): The path relative to the root folder, using `/` as the separator.
+            is_dir (bool): If the path is a folder.
+
+        Returns:
+            bool: True if the path should be ignored.
+
+        """
+        ignored = False
+        for pattern in self.patterns:
+            if pattern.negated == ignored and pattern.matches(relative_path, is_dir):
+                ignored = not pattern.negated
+
+        return ignored
+
+
+def translate_pattern(pattern):
+    """Translates a gitignore-style glob into a regex, `*` and `?` never match `/` but `**` matches any number of
+    folders.
+
+    Args:
+        pattern (str): The glob to translate.
+
+    Returns:
+        str: The regex.
+
+    """
+    regex = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            regex.append("(?:.*/)?")
+            index += 3
+            continue
+        elif pattern.startswith("**", index):
+            regex.append(".*")
+            index += 2
+            continue
+        elif char == "*":
+            regex.append("[^/]*")
+        elif char == "?":
+            regex.append("[^/]")
+        elif char == "[" and "]" in pattern[index + 1 :]:
+            end = pattern.index("]", index + 1)
+            char_class = pattern[index + 1 : end].replace("\\", "\\\\")
+            if char_class.startswith("!"):
+                char_class = f"^{char_class[1:]}"
+            regex.append(f"[{char_class}]")
+            index = end
+        else:
+            regex.append(re.escape(char))
+        index += 1
+
+    return "".join(regex)
+
+
+def read_ignore_file(folder):
+    """Reads the ignore patterns from the `.devtoignore` file in a folder, blank lines and comments are skipped.
+
+    Args:
+        folder (str): The folder which may contain a `.devtoignore` file.
+
+    Returns:
+        list: The ignore patterns, empty if there is no `.devtoignore` file.
+
+    """
+    ignore_file = os.path.join(folder, IGNORE_FILE_NAME)
+    if not os.path.isfile(ignore_file):
+        return []
+
+    with open(ignore_file) as ignore_patterns:
+        lines = [line.rstrip("\n").strip() for line in ignore_patterns]
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def should_folder_be_ignored(ignore_folders, folder):
+    """Checks if a folder should be ignored, if the ignore folder name is in the path of the folder.
+
+    Args:
+        ignore_folders (tuple): A list of folders to ignore markdown files in.
+        folder (str): Path to the folder.
+
+    Returns:
+        bool: True if we should ignore the folder and none of the files in it will be uploaded.
+
+    """
+    folder = f"{folder.rstrip('/')}/"
+    return any(path_to_ignore in folder for path_to_ignore in ignore_folders)
+
+
+def walk_articles(folder, ignore_folders=(), ignore_patterns=()):
+    """Walks a folder (using `os.scandir`) and yields the paths of all the markdown files. Ignored folders are
+    never descended into.
+
+    Args:
+        folder (str): Path to folder.
+        ignore_folders (tuple): A list of folders to ignore markdown files in, matched anywhere in the path.
+        ignore_patterns (tuple): gitignore-style patterns, relative to `folder`, of folders and files to ignore.
+
+    Yields:
+        pathlib.Path: The path of each markdown file, in sorted order.
+
+    """
+    rules = IgnoreRules(list(ignore_patterns) + read_ignore_file(folder))
+    if should_folder_be_ignored(ignore_folders, folder):
+        return
+
+    folders = [(folder, "")]
+    while folders:
+        current_folder, relative_folder = folders.pop()
+        try:
+            with os.scandir(current_folder) as scanner:
+                entries = sorted(scanner, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        sub_folders = []
+        for entry in entries:
+            relative_path = f"{relative_folder}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                ignored = rules.is_ignored(relative_path, is_dir=True)
+                if not ignored and not should_folder_be_ignored(ignore_folders, entry.path):
+                    sub_folders.append((entry.path, f"{relative_path}/"))
+            elif entry.name.endswith(".md") and not rules.is_ignored(relative_path, is_dir=False):
+                yield Path(entry.path)
+
+        folders.extend(reversed(sub_folders))
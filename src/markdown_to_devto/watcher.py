@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+r"""Watches the articles (and the code files and images they use) for changes, so they can be published again
+when they are saved. If `watchdog` is installed (`pip install markdown-to-devto[watch]`) we are notified of changes
+by the OS (i.e. inotify on Linux), else we poll the files for changes.
+
+When polling, the folders are walked like when the articles are first found (see `walk_articles`), so ignored
+folders like `node_modules` are never walked.
+
+Editors often write a file several times when it's saved, so changes are debounced. Once a file changes we wait
+until no more changes have happened for `debounce` seconds, then return all of the changes at once.
+
+Example:
+    ::
+
+        $ file_watcher = FileWatcher(debounce=1)
+        $ file_watcher.watch(folders=["articles/"], files=["code/main.py"])
+        $ changed_paths = file_watcher.get_changes()
+
+.. _Google Python Style Guide:
+    http://google.github.io/styleguide/pyguide.html
+
+"""
+import logging
+import os
+import queue
+import threading
+
+from .walker import walk_articles
+
+logger = logging.getLogger(__name__)
+
+
+class FileWatcher:
+    def __init__(self, debounce=1, poll_interval=1, polling=None, ignore_folders=(), ignore_patterns=()):
+        if polling is None:
+            try:
+                import watchdog.observers  # noqa: F401
+            except ImportError:
+                logger.debug("watchdog is not installed, polling for changes.")
+                polling = True
+
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.polling = bool(polling)
+        self.ignore_folders = ignore_folders
+        self.ignore_patterns = ignore_patterns
+        self.folders = frozenset()
+        self.files = frozenset()
+        self._changes = queue.Queue()
+        self._stop = threading.Event()
+        self._observer = None
+        self._poller = None
+
+    def watch(self, folders=(), files=()):
+        """Sets the folders and files to watch, folders are watched recursively.
+
+        Args:
+            folders (list): The paths of the folders to watch.
+            files (list): The paths of the files to watch, they don't have to exist yet.
+
+        """
+        folders = frozenset(os.path.realpath(folder) for folder in folders)
+        files = frozenset(os.path.realpath(file) for file in files)
+        if (folders, files) == (self.folders, self.files):
+            return
+
+        self.folders, self.files = folders, files
+        if self.polling:
+            self._start_polling()
+        else:
+            self._schedule_observer()
+
+    def get_changes(self, timeout=None):
+        """Waits until files have changed, then waits until no more changes have happened for `debounce` seconds.
+
+        Args:
+            timeout (float): How long to wait for the first change, if None wait forever.
+
+        Returns:
+            set: The (real) paths of the files which have changed, created or removed. Empty if nothing changed
+            before the timeout.
+
+        """
+        try:
+            changes = {self._changes.get(timeout=timeout)}
+        except queue.Empty:
+            return set()
+
+        while True:
+            try:
+                changes.add(self._changes.get(timeout=self.debounce))
+            except queue.Empty:
+                break
+
+        return {os.path.realpath(path) for path in changes}
+
+    def close(self):
+        """Stops watching for changes."""
+        self._stop.set()
+        if self._observer:
+            self._observer.stop()
+            self._observer.join()
+        if self._poller:
+            self._poller.join()
+
+    def dispatch(self, event):
+        """Called by the `watchdog` observer when a file changes."""
+        if event.is_directory:
+            return
+
+        self._changes.put(event.src_path)
+        if getattr(event, "dest_path", None):
+            self._changes.put(event.dest_path)
+
+    def _schedule_observer(self):
+        """Watches the folders and the folders containing the files using `watchdog`."""
+        from watchdog.observers import Observer
+
+        if self._observer is None:
+            self._observer = Observer()
+            self._observer.daemon = True
+            self._observer.start()
+
+        self._observer.unschedule_all()
+        for folder in self.folders:
+            self._observer.schedule(self, folder, recursive=True)
+
+        file_folders = {os.path.dirname(file) for file in self.files}
+        for file_folder in file_folders:
+            in_folders = any(file_folder.startswith(os.path.join(folder, "")) for folder in self.folders)
+            if os.path.isdir(file_folder) and file_folder not in self.folders and not in_folders:
+                self._observer.schedule(self, file_folder, recursive=False)
+
+    def _start_polling(self):
+        if self._poller is None:
+            self._poller = threading.Thread(target=self._poll, daemon=True)
+            self._poller.start()
+
+    def _poll(self):
+        """Checks for changes every `poll_interval` seconds, by comparing the modification time and size of the
+        files (and the markdown files in the folders) with the last time we checked."""
+        files, snapshot = self._snapshot()
+        while not self._stop.wait(self.poll_interval):
+            new_files, new_snapshot = self._snapshot()
+            for path in snapshot.keys() | new_snapshot.keys():
+                # Files which have only just started (or stopped) being watched haven't changed.
+                watched = (path in files) == (path in new_files)
+                if watched and snapshot.get(path) != new_snapshot.get(path):
+                    self._changes.put(path)
+            files, snapshot = new_files, new_snapshot
+
+    def _snapshot(self):
+        """Gets the modification time and size of all the files being watched.
+
+        Returns:
+            tuple: The files being watched and a dict where the key is the path and value is the modification
+            time and size, for every file which exists.
+
+        """
+        folders, files = self.folders, self.files
+        paths = set(files)
+        for folder in folders:
+            paths.update(str(path) for path in walk_articles(folder, self.ignore_folders, self.ignore_patterns))
+
+        snapshot = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+
+        return files, snapshot
@@ -0,0 +1,15 @@
+import os
+
+import pytest
+
+from .corpus import generate_corpus
+
+
+@pytest.fixture(scope="session")
+def corpus(tmp_path_factory):
+    """The paths to a synthetic corpus of articles, the size can be changed using the `BENCHMARK_ARTICLES` and
+    `BENCHMARK_PARAGRAPHS` environment variables."""
+    folder = tmp_path_factory.mktemp("corpus")
+    articles = int(os.environ.get("BENCHMARK_ARTICLES", 200))
+    paragraphs = int(os.environ.get("BENCHMARK_PARAGRAPHS", 20))
+    return generate_corpus(str(folder), articles=articles, paragraphs=paragraphs)
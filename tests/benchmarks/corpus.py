@@ -0,0 +1,93 @@
+"""Generates a synthetic corpus of articles for the benchmarks, with paragraphs, lists, code fences, admonitions,
+images and code blocks which import code files (`gatsby-remark-import-code`).
+
+Example:
+    ::
+
+        $ python tests/benchmarks/corpus.py /tmp/corpus --articles 1000 --paragraphs 50
+
+"""
+import argparse
+import os
+import random
+
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore et dolore "
+    "magna aliqua typescript python gitlab docker kubernetes android react native babel webpack"
+).split()
+PNG = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89"
+    b"\x00\x00\x00\rIDATx\x9cc\xf8\x0f\x00\x00\x01\x01\x00\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82"
+)
+
+
+def generate_corpus(folder, articles=200, paragraphs=20, code_files=10, images=5, seed=0):
+    """Writes a corpus of articles (and the code files and images they use) to a folder.
+
+    Args:
+        folder (str): Where to write the corpus.
+        articles (int): Number of articles to write.
+        paragraphs (int): Number of blocks (paragraphs, lists, code fences, admonitions and images) in each article.
+        code_files (int): Number of code files, shared by all of the articles.
+        images (int): Number of images, shared by all of the articles.
+        seed (int): Seed for the random number generator, the same seed always writes the same corpus.
+
+    Returns:
+        list: The paths to the articles.
+
+    """
+    rand = random.Random(seed)
+    os.makedirs(os.path.join(folder, "code"), exist_ok=True)
+    os.makedirs(os.path.join(folder, "images"), exist_ok=True)
+    for index in range(code_files):
+        with open(os.path.join(folder, "code", f"main_{index}.py"), "w") as code_file:
+            code_file.write("\n".join(f"print({line})" for line in range(rand.randint(5, 50))))
+    for index in range(images):
+        with open(os.path.join(folder, "images", f"image_{index}.png"), "wb") as image:
+            image.write(PNG)
+
+    article_paths = []
+    for index in range(articles):
+        article_path = os.path.join(folder, f"article_{index}.md")
+        with open(article_path, "w") as article:
+            article.write(generate_article(rand, f"Article {index}", paragraphs, code_files, images))
+        article_paths.append(article_path)
+
+    return article_paths
+
+
+def generate_article(rand, title, paragraphs, code_files, images):
+    blocks = []
+    for _ in range(paragraphs):
+        kind = rand.choices(["paragraph", "list", "fence", "import", "admonition", "image"], [8, 2, 2, 2, 1, 1])[0]
+        if kind == "paragraph":
+            lines = [sentence(rand) for _ in range(rand.randint(2, 6))]
+            blocks.append("\n".join(lines))
+        elif kind == "list":
+            blocks.append("\n".join(f"- {sentence(rand)}" for _ in range(rand.randint(2, 5))))
+        elif kind == "fence":
+            blocks.append(f"```python\nprint('{sentence(rand)}')\n```")
+        elif kind == "import":
+            code_file = rand.randrange(code_files)
+            blocks.append(f"```python:title=main.py file=./code/main_{code_file}.py\n\n```")
+        elif kind == "admonition":
+            blocks.append(f":::note\n{sentence(rand)}\n:::")
+        else:
+            blocks.append(f"![{sentence(rand)}](images/image_{rand.randrange(images)}.png)")
+
+    frontmatter = f"---\ntitle: {title}\ntags: [python, benchmark]\ncover_image: images/image_0.png\n---\n\n"
+    return frontmatter + "\n\n".join(blocks) + "\n"
+
+
+def sentence(rand):
+    return " ".join(rand.choice(WORDS) for _ in range(rand.randint(5, 15))).capitalize() + "."
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic corpus of articles.")
+    parser.add_argument("folder")
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--paragraphs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+    generate_corpus(arguments.folder, arguments.articles, arguments.paragraphs, seed=arguments.seed)
@@ -0,0 +1,134 @@
+import os
+
+import frontmatter
+import pytest
+
+from markdown_to_devto.cli import clean_article_data
+from markdown_to_devto.cli import get_local_articles
+from markdown_to_devto.cli import publish_articles
+from markdown_to_devto.cli import remove_new_lines_in_paragraph
+from markdown_to_devto.cli import replace_admonitions
+from markdown_to_devto.cli import replace_code_meta
+from markdown_to_devto.fake_server import FakeServer
+from markdown_to_devto.http_client import HTTPClient
+from markdown_to_devto.image_uploader import ImageUploader
+from markdown_to_devto.transform import join_paragraph_lines
+from markdown_to_devto.transform import transform_content
+
+from .test_startup import get_import_times
+
+pytest.importorskip("pytest_benchmark")
+
+
+class FakeResponse:
+    def __init__(self, status_code, data):
+        self.status_code = status_code
+        self.data = data
+        self.headers = {}
+
+    def json(self):
+        return self.data
+
+
+class FakeTransport:
+    """A fake dev.to (and Imgur) API, which responds straight away without making any requests."""
+
+    def request(self, method, url, **kwargs):
+        if url.endswith("/articles/me/all"):
+            return FakeResponse(200, [])
+        elif url.endswith("/upload"):
+            return FakeResponse(200, {"data": {"link": "https://i.imgur.com/a.png"}})
+        return FakeResponse(201, {"id": 1, "url": "https://dev.to/a"})
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def article(corpus):
+    article = frontmatter.load(corpus[0])
+    article["path"] = corpus[0]
+    return article
+
+
+def test_transform_content(benchmark, article):
+    benchmark(transform_content, article.content, article["path"])
+
+
+def test_join_paragraph_lines(benchmark, article):
+    benchmark(join_paragraph_lines, article.content)
+
+
+def test_remove_new_lines_in_paragraph(benchmark, article):
+    benchmark(remove_new_lines_in_paragraph, article.content)
+
+
+def test_replace_code_meta(benchmark, article):
+    benchmark(replace_code_meta, article.content, article["path"])
+
+
+def test_replace_admonitions(benchmark, article):
+    benchmark(replace_admonitions, article.content)
+
+
+def test_clean_article_data(benchmark, corpus):
+    def clean_article():
+        article = frontmatter.load(corpus[0])
+        return clean_article_data(article, corpus[0])
+
+    benchmark(clean_article)
+
+
+def test_get_local_articles(benchmark, corpus):
+    articles = benchmark.pedantic(get_local_articles, args=(corpus,), rounds=3)
+    assert len(articles) == len(corpus)
+
+
+def test_publish_articles(benchmark, corpus):
+    def publish():
+        articles = get_local_articles(corpus)
+        http_client = HTTPClient(devto_api_key="AKEY", imgur_client_id="client-id", transport=FakeTransport())
+        image_uploader = ImageUploader(http_client)
+        published = dict(publish_articles(articles, {}, http_client, image_uploader, remote_articles=iter([])))
+        image_uploader.close()
+        return published
+
+    published = benchmark.pedantic(publish, rounds=3)
+    assert len(published) == len(corpus)
+
+
+def test_publish_articles_fake_server(benchmark, corpus):
+    """Publishes the articles over HTTP, to the fake dev.to API running in-process."""
+
+    def publish():
+        articles = get_local_articles(corpus)
+        with FakeServer(rate_limit=len(corpus) * 10) as server:
+            http_client = HTTPClient(
+                devto_api_key="AKEY", imgur_client_id="client-id", devto_url=server.devto_url, imgur_url=server.url
+            )
+            image_uploader = ImageUploader(http_client)
+            published = dict(publish_articles(articles, {}, http_client, image_uploader, remote_articles=iter([])))
+            image_uploader.close()
+            http_client.close()
+        return published
+
+    published = benchmark.pedantic(publish, rounds=3)
+    assert len(published) == len(corpus)
+
+
+def test_cli_import_time(request, benchmark):
+    """Times importing the CLI in a new interpreter, fails if the fastest import (using `python -X importtime`) takes
+    longer than `STARTUP_BUDGET_MS` (100ms by default). The budget depends on the machine, so it's only checked when
+    running the benchmarks (with `--benchmark-only`), `test_startup.py` checks which modules are imported."""
+    if not request.config.getoption("benchmark_only"):
+        pytest.skip("The import time budget is only checked with --benchmark-only.")
+
+    budget = float(os.environ.get("STARTUP_BUDGET_MS", 100)) * 1000
+    import_times = []
+
+    def import_cli():
+        import_times.append(get_import_times("import markdown_to_devto.cli")["markdown_to_devto.cli"])
+
+    benchmark.pedantic(import_cli, rounds=3)
+    import_time = min(import_times)
+    assert import_time < budget, f"Importing the CLI took {import_time / 1000:.1f}ms, the budget is {budget / 1000}ms."
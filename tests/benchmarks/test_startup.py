@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+
+LAZY_MODULES = ["asyncio", "concurrent", "frontmatter", "regex", "requests", "yaml"]
+
+
+def get_import_times(statement):
+    """Imports the CLI in a new interpreter, using `python -X importtime`.
+
+    Returns:
+        dict: Where the key is the name of the module and the value is its cumulative import time in microseconds.
+
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], stderr=subprocess.PIPE, check=True, cwd=os.getcwd()
+    )
+    import_times = {}
+    for line in process.stderr.decode("utf-8").splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, module = line.split("|")
+        import_times[module.strip()] = int(cumulative)
+    return import_times
+
+
+def test_cli_imports_heavy_modules_lazily():
+    import_times = get_import_times("from markdown_to_devto.cli import cli")
+    assert not [module for module in import_times if module.split(".")[0] in LAZY_MODULES]
+
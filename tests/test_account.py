@@ -0,0 +1,15 @@
+from markdown_to_devto.account import get_account_name
+from markdown_to_devto.account import get_account_path
+
+
+def test_get_account_name():
+    name = get_account_name("AKEY")
+    assert name == get_account_name("AKEY") and name != get_account_name("BKEY")
+    assert len(name) == 8 and "AKEY" not in name
+
+
+def test_get_account_path():
+    assert get_account_path(".devto_manifest.db", None) == ".devto_manifest.db"
+    assert get_account_path(".devto_journal.jsonl", "1a2b3c4d") == ".devto_journal.1a2b3c4d.jsonl"
+    assert get_account_path("state/manifest", "1a2b3c4d") == "state/manifest.1a2b3c4d"
+    assert get_account_path(None, "1a2b3c4d") is None
@@ -0,0 +1,76 @@
+import asyncio
+import json
+
+import pytest
+
+from markdown_to_devto.async_http_client import AsyncHTTPClient
+from markdown_to_devto.async_publish import AsyncImageUploader
+from markdown_to_devto.async_publish import publish_articles_async
+from markdown_to_devto.cli import get_local_articles
+from markdown_to_devto.cli import publish_articles
+from markdown_to_devto.http_client import HTTPClient
+from markdown_to_devto.image_uploader import ImageUploader
+from markdown_to_devto.rate_limiter import TokenBucket
+from markdown_to_devto.retry import RetryPolicy
+from markdown_to_devto.transport import HTTPXTransport
+
+httpx = pytest.importorskip("httpx")
+
+ARTICLE_PATHS = ["tests/data/test.md", "tests/data/example.md", "tests/data/another.md"]
+
+
+def handle_request(request):
+    if request.url.path == "/api/articles/me/all":
+        if request.url.params["page"] == "1":
+            return httpx.Response(200, json=[{"id": 1, "title": "A Test Message", "body_markdown": ""}])
+        return httpx.Response(200, json=[])
+    elif request.url.path == "/3/upload":
+        return httpx.Response(200, json={"data": {"link": "https://i.imgur.com/a.png"}})
+    elif request.method == "PUT":
+        return httpx.Response(200, json={"url": "https://dev.to/a"})
+    elif json.loads(request.content)["article"]["body_markdown"].startswith("In this article, I will explain"):
+        return httpx.Response(502, json={"error": "Bad Gateway"})
+    return httpx.Response(201, json={"id": 2, "url": "https://dev.to/b"})
+
+
+def publish_sync():
+    transport = HTTPXTransport(http2=False)
+    transport.client = httpx.Client(transport=httpx.MockTransport(handle_request))
+    http_client = HTTPClient(devto_api_key="AKEY", imgur_client_id="client-id", transport=transport)
+    articles = get_local_articles(ARTICLE_PATHS)
+    image_uploader = ImageUploader(http_client)
+    published = dict(publish_articles(articles, http_client.get_articles(), http_client, image_uploader))
+    image_uploader.close()
+    return published, articles
+
+
+async def publish_async():
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handle_request))
+    http_client = AsyncHTTPClient(
+        devto_api_key="AKEY", imgur_client_id="client-id", rate_limiter=TokenBucket(), client=client
+    )
+    articles = get_local_articles(ARTICLE_PATHS)
+    devto_articles = await http_client.get_articles()
+    published = await publish_articles_async(articles, devto_articles, http_client, AsyncImageUploader(http_client))
+    await http_client.close()
+    return published, articles
+
+
+def test_publish_articles_async_matches_sync():
+    sync_published, sync_articles = publish_sync()
+    async_published, async_articles = asyncio.new_event_loop().run_until_complete(publish_async())
+
+    expected = {"A Test Message": 1, "Auto Publish React Native App to Android Play Store using GitLab CI": 2}
+    assert async_published == sync_published == expected
+    for title, article in sync_articles.items():
+        assert async_articles[title]["content"] == article["content"]
+
+
+def test_async_retry_policy():
+    responses = [httpx.Response(429, headers={"Retry-After": "0"}, json={}), httpx.Response(200, json=[])]
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: responses.pop(0)))
+    http_client = AsyncHTTPClient(devto_api_key="AKEY", client=client, retry_policy=RetryPolicy(max_retries=1))
+
+    articles = asyncio.new_event_loop().run_until_complete(http_client.get_articles())
+    assert articles == {}
+    assert http_client.retry_policy.retries == 1
@@ -1,11 +1,14 @@
 import filecmp
-import time
+import json
+import logging
 
+import frontmatter
 import pytest
 import requests
 
-from markdown_to_devto.cli import check_if_we_need_to_rate_limit
 from markdown_to_devto.cli import cli
+from markdown_to_devto.cli import copy_article
+from markdown_to_devto.cli import get_local_articles
 
 
 @pytest.mark.parametrize(
@@ -16,6 +19,7 @@ from markdown_to_devto.cli import cli
         (["--devto-api-key", "AKEY", "--imgur-id", "client-id", "-i", "src/"], 1),
         (["--devto-api-key", "AKEY", "--imgur-id", "client-id", "-m", "README.md"], 2),
         (["--devto-api-key", "AKEY", "--imgur-id", "client-id", "-f", "does_not_example"], 2),
+        (["--devto-api-key", "AKEY", "-f", "tests/data", "--resume"], 1),
     ],
 )
 def test_fail_args(runner, args, exit_code):
@@ -82,22 +86,22 @@ def test_success(mocker, runner, devto_articles, args):
     "args, output, expected_file",
     [
         (
-            ["-k", "AKEY", "-m", "tests/data/another.md", "-o", "tests/data/tmp/"],
-            "tests/data/tmp/Auto-Publish-React-Native-App-to-Android-Play-Store-using-GitLab-CI.md",
+            ["-k", "AKEY", "-m", "tests/data/another.md"],
+            "Auto-Publish-React-Native-App-to-Android-Play-Store-using-GitLab-CI.md",
             "tests/data/expected/another.md",
         ),
     ],
 )
-def test_output_file(mocker, runner, args, output, expected_file):
-    result = run_cli(mocker, runner, [""], args)
+def test_output_file(mocker, runner, tmp_path, args, output, expected_file):
+    result = run_cli(mocker, runner, [""], args + ["-o", f"{tmp_path}/"])
     assert result.exit_code == 0
-    assert filecmp.cmp(output, expected_file)
+    assert filecmp.cmp(tmp_path / output, expected_file)
 
 
 def test_dev_to_api_auth_failure_get_articles(mocker, runner):
     args = ["-k", "AKEY", "-f", "tests/data/", "-i", "tests/data/another_folder/"]
     get_mock = mocker.Mock(status_code=401)
-    mocker.patch("requests.get", return_value=get_mock)
+    mocker.patch("requests.Session.get", return_value=get_mock)
     result = runner.invoke(cli, args)
     assert result.exit_code == 1
 
@@ -106,7 +110,7 @@ def test_os_error_image_upload(mocker, runner):
     args = ["-k", "AKEY", "-m", "tests/data/another.md", "-i", "tests/data/another_folder/", "-a", "client-id"]
     get_mock = mocker.Mock(status_code=200)
     get_mock.json.side_effect = [[], []]
-    mocker.patch("requests.get", return_value=get_mock)
+    mocker.patch("requests.Session.get", return_value=get_mock)
     mocker.patch("builtins.open", side_effect=OSError)
 
     articles = "---\ncover_image: https://dev-to-uploads.s3.amazonaws.com/i/w00r4rpmfpjqb8wgygxu.jpg\nlicense: public-domain\ntags:\n- React Native\n- CI\n- GitLab\n- Automation\n- Android\ntitle: Auto Publish React Native App to Android Play Store using GitLab CI\n---\n\nIn this article, I will show you how can automate the publishing of your AAB/APK to the `Google Play Console`.\nWe will be using the [Gradle Play Publisher](https://github.com/Triple-T/gradle-play-publisher) (GPP) plugin to do\nautomate this process for us. Using this plugin we cannot only automate the publishing and release of our app,\nwe can also update the release notes, store listing (including photos) all from GitLab CI. \n\n**Note:** In this article I will assume that you are using Linux and React Native version >= 0.60.\n\n![c](c.jpg)\n![c](c.jpg)\n![c](c.jpg)\n\n---------------------------------------------------------------------------------------------------"
@@ -123,10 +127,10 @@ def test_dev_to_api_failure_upload_articles(mocker, runner, status_code):
     args = ["-k", "AKEY", "-m", "tests/data/example.md"]
     get_mock = mocker.Mock(status_code=200)
     get_mock.json.side_effect = [[], []]
-    mocker.patch("requests.get", return_value=get_mock)
+    mocker.patch("requests.Session.get", return_value=get_mock)
 
     post_mock = mocker.Mock(status_code=status_code)
-    mocker.patch("requests.post", return_value=post_mock)
+    mocker.patch("requests.Session.post", return_value=post_mock)
     result = runner.invoke(cli, args)
     assert result.exit_code == 0
 
@@ -134,24 +138,235 @@ def test_dev_to_api_failure_upload_articles(mocker, runner, status_code):
 @pytest.mark.parametrize("exception", [requests.ConnectionError, requests.ConnectTimeout])
 def test_dev_to_api_connection_failure_upload_articles(mocker, runner, exception):
     args = ["-k", "AKEY", "-m", "tests/data/example.md"]
-    mocker.patch("requests.get", side_effect=exception)
+    sleep_mock = mocker.patch("time.sleep")
+    get_mock = mocker.patch("requests.Session.get", side_effect=exception)
     result = runner.invoke(cli, args)
     assert result.exit_code == 1
+    assert get_mock.call_count == 4 and sleep_mock.call_count == 3
 
 
-@pytest.mark.parametrize("time_wait", [34.5, 40])
-def test_rate_limiting(time_wait):
-    articled_uploaded, start = check_if_we_need_to_rate_limit(10, time.time() - time_wait)
-    assert articled_uploaded == 0 and type(start) == float
+def test_manifest_skips_unchanged_articles(mocker, runner, tmp_path):
+    manifest = str(tmp_path / "manifest.db")
+    args = ["-k", "AKEY", "-m", "tests/data/example.md", "--manifest", manifest]
+    result = run_cli(mocker, runner, [[], []], args)
+    assert result.exit_code == 0
+
+    get_mock = mocker.patch("requests.Session.get")
+    post_mock = mocker.patch("requests.Session.post")
+    read_article_data = mocker.patch("markdown_to_devto.cli.read_article_data")
+    result = runner.invoke(cli, args)
+    assert result.exit_code == 0
+    assert not get_mock.called and not post_mock.called
+    assert not read_article_data.called
+
+
+def test_manifest_verify_remote(mocker, runner, tmp_path):
+    manifest = str(tmp_path / "manifest.db")
+    args = ["-k", "AKEY", "-m", "tests/data/example.md", "--manifest", manifest]
+    result = run_cli(mocker, runner, [[], []], args)
+    assert result.exit_code == 0
+
+    devto_articles = [
+        [
+            {
+                "id": "1",
+                "body_markdown": "---\nchecksum: abc\n---\n",
+                "title": "Better Imports with Typescript Aliases, Babel and TSPath",
+            }
+        ],
+        [],
+    ]
+    result = run_cli(mocker, runner, devto_articles, args + ["--verify-remote"])
+    assert result.exit_code == 0
+    assert requests.Session.put.called
+
+
+def test_manifest_verify_remote_keeps_checksum(mocker, runner, tmp_path):
+    manifest = str(tmp_path / "manifest.db")
+    args = ["-k", "AKEY", "-m", "tests/data/example.md", "--manifest", manifest]
+    result = run_cli(mocker, runner, [[], []], args)
+    assert result.exit_code == 0
+
+    title = "Better Imports with Typescript Aliases, Babel and TSPath"
+    devto_articles = [[{"id": 1234, "body_markdown": "", "title": title}], []]
+    result = run_cli(mocker, runner, devto_articles, args + ["--verify-remote"])
+    assert result.exit_code == 0
+    assert not requests.Session.put.called and not requests.Session.post.called
+
+    result = run_cli(mocker, runner, [], args)
+    assert result.exit_code == 0
+    assert not requests.Session.get.called and not requests.Session.put.called
+
+
+def test_manifest_same_title(mocker, runner, tmp_path):
+    for name in ["a.md", "b.md"]:
+        (tmp_path / name).write_text(open("tests/data/example.md").read())
+    (tmp_path / "b.md").write_text((tmp_path / "b.md").read_text() + "\nA new paragraph.\n")
+    args = ["-k", "AKEY", "-f", str(tmp_path), "--manifest", str(tmp_path / "manifest.db")]
+    result = run_cli(mocker, runner, [[], []], args)
+    assert result.exit_code == 0 and requests.Session.post.call_count == 1
+    published = requests.Session.post.call_args[1]["json"]["article"]["body_markdown"]
+    assert "A new paragraph." in published
+
+    for _ in range(2):
+        result = run_cli(mocker, runner, [[], []], args)
+        assert result.exit_code == 0
+        assert not requests.Session.post.called and not requests.Session.put.called
+
+
+def test_stops_fetching_articles_once_matched(mocker, runner):
+    devto_article = {"id": "1", "body_markdown": "", "title": "Better Imports with Typescript Aliases, Babel and TSPath"}
+    devto_articles = [[devto_article], [{"id": "2", "body_markdown": "", "title": "Another"}], []]
+    result = run_cli(mocker, runner, devto_articles, ["-k", "AKEY", "-m", "tests/data/example.md"])
+    assert result.exit_code == 0
+    assert requests.Session.get.call_count == 1
+    assert requests.Session.put.called and not requests.Session.post.called
+
+
+def test_updates_known_articles_by_id(mocker, runner, tmp_path):
+    article = tmp_path / "example.md"
+    article.write_text(open("tests/data/example.md").read())
+    args = ["-k", "AKEY", "-m", str(article), "--manifest", str(tmp_path / "manifest.db")]
+    result = run_cli(mocker, runner, [[], []], args)
+    assert result.exit_code == 0 and requests.Session.post.called
+
+    article.write_text(article.read_text().replace("Better Imports", "Even Better Imports"))
+    result = run_cli(mocker, runner, [], args)
+    assert result.exit_code == 0
+    assert not requests.Session.get.called and not requests.Session.post.called
+    assert requests.Session.put.call_args[0][0] == "https://dev.to/api/articles/1234"
+
+    article.write_text(article.read_text() + "\nA new paragraph.\n")
+    mock_requests(mocker, [[], []])
+    mocker.patch("requests.Session.put", return_value=mocker.Mock(status_code=404))
+    result = runner.invoke(cli, args)
+    assert result.exit_code == 0
+    assert requests.Session.get.called and requests.Session.post.called
+
+
+def test_report(mocker, runner, tmp_path):
+    report = tmp_path / "report.json"
+    args = ["-k", "AKEY", "-f", "tests/data", "-i", "tests/data/another_folder", "--report", str(report)]
+    args += ["--prometheus-textfile", str(tmp_path / "markdown_to_devto.prom")]
+    result = run_cli(mocker, runner, [[], []], args)
+    assert result.exit_code == 0
+
+    run_report = json.loads(report.read_text())
+    assert {"scan", "read", "publish"} <= run_report["phases"].keys()
+    assert run_report["endpoints"]["GET dev.to/api/articles/me/all"]["requests"] == 1
+    assert run_report["outcomes"]["published"] >= 1
+    assert (tmp_path / "markdown_to_devto.prom").exists()
+
+
+def test_profile(mocker, runner, tmp_path):
+    args = ["-k", "AKEY", "-f", "tests/data", "-i", "tests/data/another_folder", "--profile", str(tmp_path)]
+    result = run_cli(mocker, runner, [[], []], args)
+    assert result.exit_code == 0
+
+    profile = json.loads((tmp_path / "profile.json").read_text())
+    assert {"scan", "read", "publish"} <= profile["memory_peaks"].keys()
+    assert "parse_frontmatter" in profile["articles"]["tests/data/example.md"]
+    assert (tmp_path / "profile.pstats").exists() and (tmp_path / "profile.collapsed").exists()
+
+
+def test_resume_from_journal(mocker, runner, tmp_path):
+    journal = tmp_path / "journal.jsonl"
+    args = ["-k", "AKEY", "-f", "tests/data", "-i", "tests/data/another_folder", "--journal", str(journal)]
+    mocker.patch("requests.Session.get", side_effect=requests.ConnectionError)
+    mocker.patch("time.sleep")
+    result = runner.invoke(cli, args)
+    assert result.exit_code == 1
+
+    title = "Better Imports with Typescript Aliases, Babel and TSPath"
+    checksum = get_local_articles(["tests/data/example.md"])[title]["checksum"]
+    entry = {"type": "article", "path": "tests/data/example.md", "title": title, "article_id": 1, "checksum": checksum}
+    journal.write_text(json.dumps(entry) + "\n")
+
+    result = run_cli(mocker, runner, [[], []], args + ["--resume"])
+    assert result.exit_code == 0
+    bodies = [call[1]["json"]["article"]["body_markdown"] for call in requests.Session.post.call_args_list]
+    assert requests.Session.post.call_count == 2 and not requests.Session.put.called
+    assert all("Typescript Aliases" not in body for body in bodies)
+    assert not journal.exists()
+
+
+@pytest.mark.parametrize(
+    "args", [["--prune-image-cache", "30"], ["--invalidate-image", "tests/data/a.png", "--prune-image-cache", "0"]]
+)
+def test_image_cache_maintenance(mocker, runner, tmp_path, args):
+    get_mock = mocker.patch("requests.Session.get")
+    result = runner.invoke(cli, ["-k", "AKEY", "--image-cache", str(tmp_path / "images.db")] + args)
+    assert result.exit_code == 0
+    assert not get_mock.called
+
+
+def test_get_local_articles_jobs(tmp_path, caplog):
+    broken_article = tmp_path / "broken.md"
+    broken_article.write_text("---\ntitle: [\n---\n")
+    article_paths = ["tests/data/test.md", str(broken_article), "tests/data/another.md", "tests/data/example.md"]
+
+    with caplog.at_level(logging.INFO, logger="markdown_to_devto.cli"):
+        articles = get_local_articles(article_paths)
+        assert "Imported code files cache" in caplog.text
+        caplog.clear()
+        parallel_articles = get_local_articles(article_paths, jobs=2)
+        assert "Imported code files cache" not in caplog.text
+    assert list(parallel_articles) == list(articles) == [
+        "A Test Message",
+        "Auto Publish React Native App to Android Play Store using GitLab CI",
+        "Better Imports with Typescript Aliases, Babel and TSPath",
+    ]
+    for title, article in articles.items():
+        assert parallel_articles[title].metadata == article.metadata
+
+
+def test_multiple_accounts(mocker, runner, tmp_path):
+    args = ["-f", "tests/data", "-i", "tests/data/another_folder", "-a", "my-client-id"]
+    run_cli(mocker, runner, [[], []], ["-k", "AKEY"] + args)
+    single_account_posts = [call[0][0] for call in requests.Session.post.call_args_list]
+
+    manifest = tmp_path / "manifest.db"
+    result = run_cli(mocker, runner, [[], [], [], []], ["-k", "AKEY", "-k", "BKEY", "--manifest", str(manifest)] + args)
+    assert result.exit_code == 0
+
+    posts = requests.Session.post.call_args_list
+    image_uploads = [call for call in posts if "imgur" in call[0][0]]
+    assert image_uploads and len(image_uploads) == len([url for url in single_account_posts if "imgur" in url])
+    created = [call[1]["headers"]["api-key"] for call in posts if "imgur" not in call[0][0]]
+    assert sorted(created) == sorted(["AKEY", "BKEY"] * (len(single_account_posts) - len(image_uploads)))
+    assert manifest.exists() and len(list(tmp_path.glob("manifest.*.db"))) == 1
+
+
+def test_copy_article():
+    article = frontmatter.loads("---\ntitle: A Test\n---\n\n![c](c.jpg)")
+    article["content"] = article.content
+    article_copy = copy_article(article)
+    article_copy["content"] = "![c](https://i.imgur.com/c.jpg)"
+    assert article["content"] == "![c](c.jpg)" and article_copy.handler is article.handler
+
+
+def test_add_account_keeps_manifest(mocker, runner, tmp_path):
+    args = ["-m", "tests/data/example.md", "--manifest", str(tmp_path / "manifest.db")]
+    result = run_cli(mocker, runner, [[], []], ["-k", "AKEY"] + args)
+    assert result.exit_code == 0 and requests.Session.post.call_count == 1
+
+    result = run_cli(mocker, runner, [[], [], [], []], ["-k", "AKEY", "-k", "BKEY"] + args)
+    assert result.exit_code == 0
+    created = [call[1]["headers"]["api-key"] for call in requests.Session.post.call_args_list]
+    assert created == ["BKEY"] and not requests.Session.put.called
 
 
 def run_cli(mocker, runner, devto_articles, args):
+    mock_requests(mocker, devto_articles)
+    result = runner.invoke(cli, args)
+    return result
+
+
+def mock_requests(mocker, devto_articles):
     get_mock = mocker.Mock(status_code=200)
     get_mock.json.side_effect = devto_articles
-    mocker.patch("requests.get", return_value=get_mock)
+    mocker.patch("requests.Session.get", return_value=get_mock)
     create_mock = mocker.Mock(status_code=201)
-    mocker.patch("requests.post", return_value=create_mock)
-    create_mock.json.return_value = {"data": {"link": "https://imgur.com/123456"}, "url": "random_url.com"}
-    mocker.patch("requests.put", return_value=create_mock)
-    result = runner.invoke(cli, args)
-    return result
+    mocker.patch("requests.Session.post", return_value=create_mock)
+    create_mock.json.return_value = {"data": {"link": "https://imgur.com/123456"}, "url": "random_url.com", "id": 1234}
+    mocker.patch("requests.Session.put", return_value=create_mock)
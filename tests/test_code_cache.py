@@ -0,0 +1,62 @@
+import os
+
+from markdown_to_devto.cli import get_local_articles
+from markdown_to_devto.code_cache import CodeFileCache
+from markdown_to_devto.transform import code_file_cache
+from markdown_to_devto.transform import transform_content
+
+
+def test_code_file_cache_hits_and_invalidation(tmp_path):
+    code_file = tmp_path / "main.py"
+    code_file.write_text("import os")
+    code_cache = CodeFileCache()
+
+    assert code_cache.read(str(code_file)) == "import os"
+    assert code_cache.read(str(tmp_path / "." / "main.py")) == "import os"
+    assert (code_cache.hits, code_cache.misses) == (1, 1)
+
+    code_file.write_text("import sys\n")
+    os.utime(str(code_file), ns=(1, 1))
+    assert code_cache.read(str(code_file)) == "import sys\n"
+    assert (code_cache.hits, code_cache.misses) == (1, 2)
+
+
+def test_code_file_cache_reset_counts(tmp_path):
+    code_file = tmp_path / "main.py"
+    code_file.write_text("import os")
+    code_cache = CodeFileCache()
+    code_cache.read(str(code_file))
+
+    code_cache.reset_counts()
+    assert code_cache.read(str(code_file)) == "import os"
+    assert (code_cache.hits, code_cache.misses) == (1, 0)
+
+
+def test_code_file_cache_lru_eviction(tmp_path):
+    for name in "abc":
+        (tmp_path / f"{name}.py").write_text(name * 10)
+    code_cache = CodeFileCache(max_bytes=20)
+
+    code_cache.read(str(tmp_path / "a.py"))
+    code_cache.read(str(tmp_path / "b.py"))
+    code_cache.read(str(tmp_path / "a.py"))
+    code_cache.read(str(tmp_path / "c.py"))
+    assert code_cache.size == 20
+
+    code_cache.read(str(tmp_path / "a.py"))
+    code_cache.read(str(tmp_path / "b.py"))
+    assert (code_cache.hits, code_cache.misses) == (2, 4)
+
+
+def test_transform_content_reads_imported_code_once():
+    content = "```py:title=test.png file=./c.py\n\n```\n\n" * 10
+    code_cache = CodeFileCache()
+    transform_content(content, "tests/data/another.md", code_cache=code_cache)
+    assert (code_cache.hits, code_cache.misses) == (9, 1)
+
+
+def test_get_local_articles_counts_each_read():
+    get_local_articles(["tests/data/another.md"])
+    counts = (code_file_cache.hits, code_file_cache.misses)
+    get_local_articles(["tests/data/another.md"])
+    assert (code_file_cache.hits, code_file_cache.misses) == (sum(counts), 0)
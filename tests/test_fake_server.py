@@ -0,0 +1,72 @@
+import shutil
+import time
+
+from markdown_to_devto.cli import cli
+from markdown_to_devto.fake_server import FakeServer
+from markdown_to_devto.http_client import HTTPClient
+from markdown_to_devto.retry import RetryPolicy
+
+
+def test_publish_to_fake_server(runner, tmp_path):
+    for name in ["example.md", "test.md", "a.png", "b.jpg"]:
+        shutil.copy(f"tests/data/{name}", tmp_path)
+    args = ["-k", "AKEY", "-a", "client-id", "-f", str(tmp_path)]
+
+    with FakeServer() as server:
+        args += ["--devto-url", server.devto_url, "--imgur-url", server.url]
+        result = runner.invoke(cli, args + ["--manifest", str(tmp_path / "manifest.db")])
+        assert result.exit_code == 0
+        assert len(server.articles) == 2 and server.images == 1
+
+        article = tmp_path / "example.md"
+        article.write_text(article.read_text() + "\nA new paragraph.\n")
+        result = runner.invoke(cli, args + ["--manifest", str(tmp_path / "manifest.db")])
+        assert result.exit_code == 0
+        assert server.requests["PUT /api/articles/{id}"] == 1
+        assert server.requests["GET /api/articles/me/all"] == 1
+
+        # Without the manifest the articles are matched to the articles on dev.to by their title.
+        result = runner.invoke(cli, args + ["--verify-remote"])
+        assert result.exit_code == 0
+        assert len(server.articles) == 2 and server.requests["POST /api/articles"] == 2
+
+
+def test_verify_remote_fake_server(runner, tmp_path):
+    shutil.copy("tests/data/example.md", tmp_path)
+    args = ["-k", "AKEY", "-f", str(tmp_path)]
+
+    with FakeServer() as server:
+        args += ["--devto-url", server.devto_url]
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 0
+
+        # The checksum is uploaded with the article, so rebuilding the manifest doesn't update the article again.
+        args += ["--manifest", str(tmp_path / "manifest.db")]
+        result = runner.invoke(cli, args + ["--verify-remote"])
+        assert result.exit_code == 0
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 0
+        assert len(server.articles) == 1 and "PUT /api/articles/{id}" not in server.requests
+
+
+def test_fake_server_rate_limit(mocker):
+    sleep = mocker.Mock(side_effect=lambda seconds: time.sleep(0.1))
+    retry_policy = RetryPolicy(max_retries=5, sleep=sleep)
+    with FakeServer(rate_limit=2, rate_period=0.2) as server:
+        http_client = HTTPClient(devto_api_key="AKEY", devto_url=server.devto_url, retry_policy=retry_policy)
+        for index in range(3):
+            http_client.create_article({"content": f"---\ntitle: Article {index}\n---\n"})
+        articles = http_client.get_articles()
+
+    assert sorted(articles) == ["Article 0", "Article 1", "Article 2"]
+    assert server.rate_limited == sleep.call_count >= 1
+    sleep.assert_called_with(1.0)
+
+
+def test_fake_server_errors():
+    retry_policy = RetryPolicy(max_retries=10, backoff_factor=0, sleep=lambda seconds: None)
+    with FakeServer(error_rate=0.5, seed=1) as server:
+        http_client = HTTPClient(devto_api_key="AKEY", devto_url=server.devto_url, retry_policy=retry_policy)
+        assert http_client.get_articles() == {}
+
+    assert server.errors == retry_policy.retries >= 1
@@ -0,0 +1,62 @@
+import os
+
+from markdown_to_devto.fingerprint import get_changed_paths
+from markdown_to_devto.fingerprint import get_settings
+from markdown_to_devto.fingerprint import record_fingerprint
+from markdown_to_devto.manifest import Manifest
+
+ARTICLE = """---
+title: A
+tags: [python]
+cover_image: https://example.com/cover.png
+---
+
+```python file=./main.py
+
+```
+"""
+
+
+def publish(manifest, paths, settings):
+    changed_paths, fingerprints = get_changed_paths(paths, manifest, settings)
+    for path in changed_paths:
+        manifest.record(path=str(path), title=str(path), article_id=1, checksum="abc")
+        record_fingerprint(manifest, path, fingerprints[str(path)])
+    return changed_paths
+
+
+def test_get_changed_paths(tmp_path, mocker):
+    article, another_article = tmp_path / "a.md", tmp_path / "b.md"
+    article.write_text(ARTICLE)
+    another_article.write_text("---\ntitle: B\n---\n")
+    (tmp_path / "main.py").write_text("import os")
+    paths = [article, another_article]
+    manifest = Manifest()
+    settings = get_settings(site=None)
+
+    assert publish(manifest, paths, settings) == paths
+    hash_files = mocker.patch("markdown_to_devto.fingerprint.hash_files", wraps=lambda paths, workers: {})
+    assert publish(manifest, paths, settings) == []
+    assert hash_files.call_args[0][0] == []
+    mocker.stopall()
+
+    os.utime(str(article), ns=(1, 1))
+    assert publish(manifest, paths, settings) == []
+
+    (tmp_path / "main.py").write_text("import sys")
+    assert publish(manifest, paths, settings) == [article]
+
+    another_article.write_text("---\ntitle: C\n---\n")
+    assert publish(manifest, paths, settings) == [another_article]
+    assert publish(manifest, paths, get_settings(site="https://example.com")) == paths
+
+
+def test_get_changed_paths_force(tmp_path):
+    article = tmp_path / "a.md"
+    article.write_text(ARTICLE)
+    manifest = Manifest()
+    publish(manifest, [article], get_settings(site=None))
+
+    changed_paths, fingerprints = get_changed_paths([article], manifest, get_settings(site=None), force=True)
+    assert changed_paths == [article]
+    assert fingerprints[str(article)].digest == manifest.get_file(str(article))["digest"]
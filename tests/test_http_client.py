@@ -0,0 +1,84 @@
+import pytest
+
+from markdown_to_devto.http_client import HTTPClient
+from markdown_to_devto.remote import RemoteArticle
+from markdown_to_devto.retry import RetryPolicy
+from markdown_to_devto.retry import parse_retry_after
+from markdown_to_devto.transport import HTTPXTransport
+from markdown_to_devto.transport import RequestsTransport
+from markdown_to_devto.utils import exceptions
+
+
+def test_requests_transport_reuses_session(mocker):
+    transport = RequestsTransport(pool_size=8)
+    response = mocker.Mock(status_code=200)
+    response.json.side_effect = [[{"id": 1, "title": "A", "body_markdown": ""}], []]
+    get_mock = mocker.patch.object(transport.session, "get", return_value=response)
+
+    http_client = HTTPClient(devto_api_key="AKEY", transport=transport)
+    assert http_client.get_articles() == {"A": RemoteArticle(id=1, title="A")}
+    assert get_mock.call_count == 2
+    assert transport.session.headers["Accept-Encoding"] == "gzip, deflate"
+    assert transport.session.get_adapter("https://dev.to")._pool_maxsize == 8
+
+
+def test_httpx_transport():
+    httpx = pytest.importorskip("httpx")
+    transport = HTTPXTransport(http2=False)
+    transport.client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(201, json={"url": "a"}))
+    )
+
+    http_client = HTTPClient(devto_api_key="AKEY", transport=transport)
+    assert http_client.create_article({"content": "Hello"}) == {"url": "a"}
+
+
+@pytest.mark.parametrize(
+    "method, status_code, expected_calls", [("get", 502, 3), ("put", 503, 3), ("post", 502, 1), ("post", 429, 3)]
+)
+def test_retry_policy(mocker, method, status_code, expected_calls):
+    failure = mocker.Mock(status_code=status_code, headers={"Retry-After": "2"})
+    transport = mocker.Mock()
+    transport.request.return_value = failure
+    sleep_mock = mocker.Mock()
+
+    http_client = HTTPClient(transport=transport, retry_policy=RetryPolicy(max_retries=2, sleep=sleep_mock))
+    with pytest.raises(exceptions.HTTPException):
+        http_client._make_http_request(method=method, url="https://dev.to/api/articles")
+
+    assert transport.request.call_count == expected_calls
+    assert http_client.retry_policy.retries == expected_calls - 1
+    if status_code == 429:
+        sleep_mock.assert_called_with(2.0)
+
+
+@pytest.mark.parametrize("status_code, expected_calls", [(503, 1), (429, 3)])
+def test_upload_image_retries_only_when_rate_limited(mocker, status_code, expected_calls):
+    failure = mocker.Mock(status_code=status_code, headers={"Retry-After": "2"})
+    transport = mocker.Mock()
+    transport.request.return_value = failure
+
+    http_client = HTTPClient(transport=transport, retry_policy=RetryPolicy(max_retries=2, sleep=mocker.Mock()))
+    with pytest.raises(exceptions.HTTPException):
+        http_client.upload_image("tests/data/a.png")
+
+    assert transport.request.call_count == expected_calls
+
+
+def test_retry_policy_recovers(mocker):
+    transport = mocker.Mock()
+    transport.request.side_effect = [
+        exceptions.HTTPConnectionException(msg="Connection reset"),
+        mocker.Mock(status_code=200, json=mocker.Mock(return_value=[])),
+    ]
+    http_client = HTTPClient(transport=transport, retry_policy=RetryPolicy(sleep=mocker.Mock()))
+    assert http_client._make_http_request(method="get", url="https://dev.to/api/articles/me/all") == []
+    assert http_client.retry_policy.retries == 1
+
+
+@pytest.mark.parametrize(
+    "retry_after, expected",
+    [(None, None), ("5", 5.0), ("-1", 0.0), ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0), ("a", None)],
+)
+def test_parse_retry_after(retry_after, expected):
+    assert parse_retry_after(retry_after) == expected
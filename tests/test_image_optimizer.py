@@ -0,0 +1,111 @@
+import concurrent.futures
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from markdown_to_devto.image_cache import ImageCache
+from markdown_to_devto.image_optimizer import ImageOptimizer
+from markdown_to_devto.image_uploader import ImageUploader
+from markdown_to_devto.utils.hashing import hash_file
+
+Image = pytest.importorskip("PIL.Image")
+
+
+@pytest.fixture
+def screenshot(tmp_path):
+    path = str(tmp_path / "screenshot.png")
+    image = Image.new("RGB", (2000, 1000))
+    image.putdata([(x % 256, y % 256, (x * y) % 256) for y in range(1000) for x in range(2000)])
+    image.save(path)
+    return path
+
+
+def test_optimize_resizes_image(tmp_path, screenshot):
+    image_optimizer = ImageOptimizer(str(tmp_path / "cache"), max_width=500)
+    optimized_path = image_optimizer.optimize(screenshot)
+    image_optimizer.close()
+
+    assert optimized_path.endswith(".png") and optimized_path.startswith(str(tmp_path / "cache"))
+    with Image.open(optimized_path) as image:
+        assert image.size == (500, 250)
+
+
+def test_optimize_converts_image(mocker, tmp_path, screenshot):
+    image_optimizer = ImageOptimizer(str(tmp_path / "cache"), max_width=500, image_format="webp", quality=50)
+    optimized_path = image_optimizer.optimize(screenshot)
+    assert optimized_path.endswith(".webp") and os.path.getsize(optimized_path) < os.path.getsize(screenshot)
+
+    image_optimizer.quality = 60
+    assert image_optimizer.optimize(screenshot) != optimized_path
+
+    image_optimizer.quality = 50
+    optimize_image = mocker.patch("markdown_to_devto.image_optimizer.optimize_image")
+    assert image_optimizer.optimize(screenshot) == optimized_path
+    assert not optimize_image.called
+    image_optimizer.close()
+
+
+def test_optimize_skips_unsupported_image(mocker, tmp_path):
+    path = str(tmp_path / "image.gif")
+    Image.new("RGB", (100, 100)).save(path)
+    image_optimizer = ImageOptimizer(str(tmp_path / "cache"))
+    assert image_optimizer._executor is None
+    assert image_optimizer.optimize(path) == path
+
+    get_executor = mocker.patch.object(image_optimizer, "_get_executor")
+    assert image_optimizer.optimize(path) == path
+    assert not get_executor.called
+    image_optimizer.close()
+
+
+def test_optimize_invalid_image(tmp_path):
+    path = tmp_path / "not_an_image.png"
+    path.write_text("not an image")
+    image_optimizer = ImageOptimizer(str(tmp_path / "cache"))
+    assert image_optimizer.optimize(str(path)) == str(path)
+    image_optimizer.close()
+
+
+def test_optimize_failure_uploads_original(tmp_path, screenshot):
+    image_optimizer = ImageOptimizer(str(tmp_path / "cache"), max_width=500)
+    image_optimizer.close()
+    # The pool has been shut down, so the image isn't optimized.
+    assert image_optimizer.optimize(screenshot) == screenshot
+
+
+def test_optimize_broken_pool_uploads_original(mocker, tmp_path, screenshot):
+    image_optimizer = ImageOptimizer(str(tmp_path / "cache"), max_width=500)
+    future = concurrent.futures.Future()
+    future.set_exception(BrokenProcessPool())
+    mocker.patch.object(image_optimizer, "_get_executor").return_value.submit.return_value = future
+    assert image_optimizer.optimize(screenshot) == screenshot
+    assert not image_optimizer.available
+    image_optimizer.close()
+
+
+def test_upload_optimized_images(mocker, tmp_path, screenshot):
+    http_client = mocker.Mock()
+    http_client.upload_image.return_value = "https://imgur.com/123456"
+    image_optimizer = ImageOptimizer(str(tmp_path / "cache"), max_width=500)
+    image_uploader = ImageUploader(http_client, image_optimizer=image_optimizer)
+
+    links = image_uploader.upload_images([screenshot])
+    image_uploader.close()
+    image_optimizer.close()
+    assert links == {screenshot: "https://imgur.com/123456"}
+    assert http_client.upload_image.call_args[0][0].startswith(str(tmp_path / "cache"))
+
+
+def test_optimized_images_cached_by_source(mocker, tmp_path, screenshot):
+    http_client = mocker.Mock()
+    http_client.upload_image.return_value = "https://imgur.com/123456"
+    image_cache = ImageCache()
+    image_optimizer = ImageOptimizer(str(tmp_path / "cache"), max_width=500)
+    image_uploader = ImageUploader(http_client, image_cache=image_cache, image_optimizer=image_optimizer)
+
+    image_uploader.upload_images([screenshot])
+    image_uploader.close()
+    image_optimizer.close()
+    assert image_cache.get(hash_file(screenshot)) == "https://imgur.com/123456"
+    assert image_cache.invalidate(hash_file(screenshot))
@@ -0,0 +1,73 @@
+import pytest
+
+from markdown_to_devto.image_cache import ImageCache
+from markdown_to_devto.image_uploader import ImageUploader
+from markdown_to_devto.utils import exceptions
+from markdown_to_devto.utils.hashing import hash_file
+
+
+def upload_image(image_path):
+    if image_path.endswith("b.jpg"):
+        raise exceptions.HTTPServerException(msg="Bad Gateway")
+    return f"https://imgur.com/{image_path}"
+
+
+def test_upload_images(mocker):
+    http_client = mocker.Mock()
+    http_client.upload_image.side_effect = upload_image
+    image_uploader = ImageUploader(http_client, max_workers=2)
+
+    links = image_uploader.upload_images(["tests/data/a.png", "tests/data/c.jpg", "tests/data/a.png"])
+    image_uploader.close()
+    assert links == {
+        "tests/data/a.png": "https://imgur.com/tests/data/a.png",
+        "tests/data/c.jpg": "https://imgur.com/tests/data/c.jpg",
+    }
+    assert http_client.upload_image.call_count == 2
+
+
+def test_upload_images_failure_does_not_abort_others(mocker):
+    http_client = mocker.Mock()
+    http_client.upload_image.side_effect = upload_image
+    image_uploader = ImageUploader(http_client, max_workers=2)
+
+    with pytest.raises(exceptions.ImageUploadException) as error:
+        image_uploader.upload_images(["tests/data/a.png", "tests/data/b.jpg", "tests/data/c.jpg"])
+    image_uploader.close()
+    assert list(error.value.msg) == ["tests/data/b.jpg"]
+    assert http_client.upload_image.call_count == 3
+
+
+def test_upload_images_reuses_image_cache(mocker, tmp_path):
+    http_client = mocker.Mock()
+    http_client.upload_image.side_effect = upload_image
+    image_cache = ImageCache(str(tmp_path / "images.db"))
+    ImageUploader(http_client, image_cache=image_cache).upload_images(["tests/data/a.png"])
+
+    http_client.upload_image.reset_mock()
+    links = ImageUploader(http_client, image_cache=image_cache).upload_images(["tests/data/a.png"])
+    assert links == {"tests/data/a.png": "https://imgur.com/tests/data/a.png"}
+    assert not http_client.upload_image.called
+
+    image_cache.invalidate(hash_file("tests/data/a.png"))
+    ImageUploader(http_client, image_cache=image_cache).upload_images(["tests/data/a.png"])
+    assert http_client.upload_image.call_count == 1
+
+
+def test_upload_images_records_every_journal(mocker):
+    http_client = mocker.Mock()
+    http_client.upload_image.side_effect = upload_image
+    journals = [mocker.Mock(), mocker.Mock()]
+    ImageUploader(http_client, image_cache=ImageCache(), journals=journals).upload_images(["tests/data/a.png"])
+
+    digest = hash_file("tests/data/a.png")
+    for journal in journals:
+        journal.record_image.assert_called_once_with(digest, "https://imgur.com/tests/data/a.png")
+
+
+def test_image_cache_prune(tmp_path):
+    image_cache = ImageCache(str(tmp_path / "images.db"))
+    image_cache.record("abc", "https://imgur.com/abc")
+    assert image_cache.prune(max_age_days=1) == 0
+    assert image_cache.prune(max_age_days=-1) == 1
+    assert image_cache.get("abc") is None
@@ -0,0 +1,57 @@
+import json
+
+from markdown_to_devto.journal import Journal
+
+
+def test_journal_resume(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    journal = Journal(path)
+    journal.record_article(path="a.md", title="A", article_id=1, checksum="abc")
+    journal.record_image(digest="0a1b", link="https://i.imgur.com/1.png")
+    journal.close()
+    with open(path, "a") as journal_file:
+        journal_file.write('{"type": "article", "path": "b.m')
+
+    journal = Journal(path, resume=True)
+    assert journal.articles == {"a.md": {"path": "a.md", "title": "A", "article_id": 1, "checksum": "abc"}}
+    assert journal.images == {"0a1b": "https://i.imgur.com/1.png"}
+    journal.record_article(path="c.md", title="C", article_id=3, checksum="def")
+    journal.close()
+
+    with open(path) as journal_file:
+        lines = journal_file.read().splitlines()
+    assert json.loads(lines[-1])["path"] == "c.md"
+    assert set(Journal(path, resume=True).articles) == {"a.md", "c.md"}
+
+
+def test_journal_new_run(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = Journal(str(path))
+    journal.record_article(path="a.md", title="A", article_id=1, checksum="abc")
+    journal.close()
+
+    journal = Journal(str(path))
+    assert not journal.articles
+    journal.record_article(path="b.md", title="B", article_id=2, checksum="def")
+    assert [json.loads(line)["path"] for line in path.read_text().splitlines()] == ["b.md"]
+    journal.close(remove=True)
+    assert not path.exists()
+
+
+def test_journal_created_lazily(tmp_path):
+    folder = tmp_path / "journals"
+    folder.mkdir()
+    journal = Journal(str(folder / "journal.jsonl"))
+    journal.close(remove=True)
+    assert not list(folder.iterdir())
+
+    journal = Journal(str(folder / "missing" / "journal.jsonl"))
+    journal.record_article(path="a.md", title="A", article_id=1, checksum="abc")
+    journal.close(remove=True)
+    assert journal.articles and not list(folder.iterdir())
+
+
+def test_journal_missing(tmp_path):
+    journal = Journal(str(tmp_path / "journal.jsonl"), resume=True)
+    assert not journal.articles and not journal.images
+    journal.close()
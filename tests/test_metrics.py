@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from markdown_to_devto.metrics import Metrics
+from markdown_to_devto.metrics import get_endpoint
+
+
+@pytest.mark.parametrize(
+    "method, url, expected",
+    [
+        ("get", "https://dev.to/api/articles/me/all?page=2", "GET dev.to/api/articles/me/all"),
+        ("put", "https://dev.to/api/articles/1234", "PUT dev.to/api/articles/{id}"),
+        ("post", "https://api.imgur.com/3/upload", "POST api.imgur.com/3/upload"),
+    ],
+)
+def test_get_endpoint(method, url, expected):
+    assert get_endpoint(method, url) == expected
+
+
+def test_metrics_report(tmp_path):
+    times = iter([0, 1.5, 2, 2.5])
+    metrics = Metrics(clock=lambda: next(times))
+    with metrics.phase("read"):
+        pass
+    with metrics.phase("read"):
+        pass
+
+    metrics.record_request("put", "https://dev.to/api/articles/1", 200, 0.2, bytes_sent=10, bytes_received=5)
+    metrics.record_request("put", "https://dev.to/api/articles/2", 429, 3, bytes_sent=10)
+    metrics.record_request("put", "https://dev.to/api/articles/2", None, 40, bytes_sent=10)
+    metrics.record_article("a.md", "published", title="A")
+    metrics.record_article("b.md", "invalid", error=ValueError("bad frontmatter"))
+
+    metrics.write_report(str(tmp_path / "report.json"))
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert report["phases"] == {"read": 2}
+    endpoint = report["endpoints"]["PUT dev.to/api/articles/{id}"]
+    assert endpoint["requests"] == 3
+    assert endpoint["status_codes"] == {"200": 1, "429": 1, "error": 1}
+    assert endpoint["latency_buckets"] == [0, 0, 1, 1, 1, 1, 2, 2, 2]
+    assert report["bytes_sent"] == 30 and report["bytes_received"] == 5
+    assert report["outcomes"] == {"published": 1, "invalid": 1}
+    assert report["articles"]["b.md"]["error"] == "bad frontmatter"
+
+
+def test_metrics_prometheus(tmp_path):
+    metrics = Metrics()
+    metrics.add_phase_time("publish", 3)
+    metrics.record_request("post", "https://api.imgur.com/3/upload", 200, 0.3)
+    metrics.rate_limit_sleep = 1.5
+    metrics.record_article("a.md", "failed")
+
+    path = tmp_path / "markdown_to_devto.prom"
+    metrics.write_prometheus(str(path))
+    lines = path.read_text().splitlines()
+    assert 'markdown_to_devto_phase_seconds{phase="publish"} 3' in lines
+    endpoint = 'endpoint="POST api.imgur.com/3/upload"'
+    assert f'markdown_to_devto_request_duration_seconds_bucket{{{endpoint},le="0.25"}} 0' in lines
+    assert f'markdown_to_devto_request_duration_seconds_bucket{{{endpoint},le="0.5"}} 1' in lines
+    assert f'markdown_to_devto_request_duration_seconds_bucket{{{endpoint},le="+Inf"}} 1' in lines
+    assert f'markdown_to_devto_requests_total{{{endpoint},status="200"}} 1' in lines
+    assert 'markdown_to_devto_sleep_seconds{reason="rate_limit"} 1.5' in lines
+    assert 'markdown_to_devto_articles{outcome="failed"} 1' in lines
+    assert not (tmp_path / "markdown_to_devto.prom.tmp").exists()
+
+
+def test_metrics_accounts():
+    metrics = Metrics()
+    metrics.record_article("a.md", "published", account="1a2b3c4d")
+    metrics.record_article("a.md", "failed", account="5e6f7a8b")
+
+    report = metrics.to_dict()
+    assert report["outcomes"] == {"published": 1, "failed": 1}
+    assert report["articles"]["5e6f7a8b:a.md"]["account"] == "5e6f7a8b"
@@ -0,0 +1,48 @@
+from urllib3.filepost import encode_multipart_formdata
+
+from markdown_to_devto.fake_server import FakeServer
+from markdown_to_devto.http_client import HTTPClient
+from markdown_to_devto.multipart import MultipartEncoder
+
+
+def test_multipart_encoder_matches_urllib3():
+    with open("tests/data/a.png", "rb") as image:
+        data = image.read()
+        image.seek(0)
+        body = MultipartEncoder(fields={"type": "file"}, files={"image": ('a "1".png', image)}, boundary="xyz")
+        encoded = b"".join(body)
+
+        expected, content_type = encode_multipart_formdata(
+            {"type": "file", "image": ('a "1".png', data, "image/png")}, boundary="xyz"
+        )
+        assert encoded == expected and len(body) == len(expected)
+        assert body.content_type == content_type
+        assert b"".join(body) == encoded
+
+
+def test_multipart_encoder_streams_files(tmp_path):
+    path = tmp_path / "a.gif"
+    path.write_bytes(b"a" * 1000)
+    with open(str(path), "rb") as image:
+        body = MultipartEncoder(files={"image": ("a.gif", image)}, chunk_size=100)
+        chunks = list(body)
+        assert len(body) == sum(len(chunk) for chunk in chunks)
+
+    assert [len(chunk) for chunk in chunks[1:-2]] == [100] * 10
+
+
+def test_upload_image_closes_file(mocker):
+    images = []
+
+    def tracking_open(*args, **kwargs):
+        images.append(open(*args, **kwargs))
+        return images[-1]
+
+    mocker.patch("markdown_to_devto.http_client.open", side_effect=tracking_open, create=True)
+    with FakeServer() as server:
+        http_client = HTTPClient(imgur_client_id="client-id", imgur_url=server.url)
+        link = http_client.upload_image("tests/data/a.png")
+        http_client.close()
+
+    assert link == f"{server.url}/images/1.png"
+    assert len(images) == 1 and images[0].closed
@@ -0,0 +1,45 @@
+import json
+import pstats
+
+from markdown_to_devto.profiler import Profiler
+from markdown_to_devto.profiler import time_step
+
+
+def test_time_step():
+    timings = {}
+    for _ in range(2):
+        with time_step(timings, "tokenize"):
+            pass
+    with time_step(None, "tokenize"):
+        pass
+
+    assert list(timings) == ["tokenize"] and timings["tokenize"] >= 0
+
+
+def test_profiler(tmp_path):
+    profiler = Profiler(str(tmp_path / "profile"), sample_interval=0.001)
+    profiler.start()
+    with profiler.phase("read"):
+        data = [bytearray(1024 * 1024)]
+        sum(range(100000))
+    profiler.record_article("a.md", {"parse_frontmatter": 0.1, "import_code_block": 0.5})
+    profiler.record_article("b.md", {"parse_frontmatter": 0.2})
+    profiler.stop()
+
+    assert data and profiler.memory_peaks["read"] >= 1024 * 1024
+    assert [path for path, _ in profiler.get_slowest_articles()] == ["a.md", "b.md"]
+    assert pstats.Stats(str(tmp_path / "profile" / "profile.pstats")).total_calls > 0
+    report = json.loads((tmp_path / "profile" / "profile.json").read_text())
+    assert report["articles"]["a.md"]["import_code_block"] == 0.5
+    for line in (tmp_path / "profile" / "profile.collapsed").read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack.startswith("MainThread;") and int(count) > 0
+
+
+def test_profiler_disabled():
+    profiler = Profiler()
+    profiler.start()
+    with profiler.phase("read"):
+        pass
+    profiler.stop()
+    assert not profiler.enabled and not profiler.memory_peaks
@@ -0,0 +1,52 @@
+import threading
+
+import pytest
+
+from markdown_to_devto.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.mark.parametrize("requests, expected_time", [(10, 0), (11, 30), (20, 30), (21, 60)])
+def test_token_bucket_waits(requests, expected_time):
+    clock = FakeClock()
+    rate_limiter = TokenBucket(capacity=10, period=30, clock=clock, sleep=clock.sleep)
+    for _ in range(requests):
+        rate_limiter.acquire()
+
+    assert clock.now == expected_time
+    assert rate_limiter.time_slept == expected_time
+
+
+def test_token_bucket_never_bursts_past_limit():
+    clock = FakeClock()
+    rate_limiter = TokenBucket(capacity=10, period=30, clock=clock, sleep=clock.sleep)
+    acquired = []
+    for _ in range(35):
+        rate_limiter.acquire()
+        acquired.append(clock.now)
+        clock.now += 1
+
+    for start in acquired:
+        assert len([time for time in acquired if start <= time < start + 30]) <= 10
+
+
+def test_token_bucket_threads():
+    rate_limiter = TokenBucket(capacity=10, period=30)
+    threads = [threading.Thread(target=rate_limiter.acquire) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert rate_limiter.time_slept == 0
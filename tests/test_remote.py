@@ -0,0 +1,45 @@
+import io
+
+import frontmatter
+import pytest
+
+from markdown_to_devto.remote import RemoteArticle
+from markdown_to_devto.remote import add_checksum
+from markdown_to_devto.remote import get_checksum
+
+
+@pytest.mark.parametrize(
+    "markdown",
+    [
+        "",
+        "No frontmatter\nchecksum: abc\n",
+        "---\ntitle: A\nchecksum: 0a1b2c\n---\n\nchecksum: not this one",
+        "---\ntitle: A\nchecksum: '0a1b2c'\n---\n",
+        '---\nchecksum: "0a1b2c"  # comment\ntags: [a]\n---\n',
+        "---\ntitle: A\nseries:\n  checksum: nested\n---\n",
+        "---\ntitle: A\n---\n",
+    ],
+)
+def test_get_checksum(markdown):
+    expected = frontmatter.load(io.StringIO(markdown)).get("checksum", "")
+    assert get_checksum(markdown) == expected
+
+
+def test_add_checksum():
+    markdown = add_checksum("# A\n\nSome text.", "0a1b2c")
+    assert markdown.startswith("# A\n\nSome text.") and get_checksum(markdown) == "0a1b2c"
+    assert get_checksum(add_checksum("---\nchecksum: abc\n---\n", "0a1b2c")) == "abc"
+    assert add_checksum("# A", None) == "# A"
+
+
+def test_remote_article_from_api():
+    article = RemoteArticle.from_api(
+        {
+            "id": 1,
+            "title": "A",
+            "published_at": "2021-01-01T00:00:00Z",
+            "body_markdown": "---\nchecksum: abc\n---\n" + "a" * 1000,
+        }
+    )
+    assert article == RemoteArticle(id=1, title="A", published_at="2021-01-01T00:00:00Z", checksum="abc")
+    assert not hasattr(article, "__dict__")
@@ -0,0 +1,83 @@
+import time
+
+import frontmatter
+import pytest
+
+from markdown_to_devto.cli import remove_new_lines_in_paragraph
+from markdown_to_devto.cli import replace_admonitions
+from markdown_to_devto.cli import replace_code_meta
+from markdown_to_devto.cli import replace_local_links
+from markdown_to_devto.cli import replace_youtube_links
+from markdown_to_devto.transform import FENCE
+from markdown_to_devto.transform import IMAGE
+from markdown_to_devto.transform import tokenize
+from markdown_to_devto.transform import transform_content
+
+SECTION = """Some text which spans
+multiple lines, with an image ![c](c.jpg) in it.
+
+```py:title=test.png file=./c.py
+
+```
+
+- A list
+- of items
+
+:::caution Assumption
+This next section assumes that you use Gitlab to host your repos.
+It also assumes that for your Gatsby blog you use Gitlab CI to build/publish it.
+:::
+
+```js
+const a = 1;
+
+const b = 2;
+```
+
+`youtube: abcdef`
+
+[My Blog](/blog/storybooks-with-mdx/)
+
+---
+"""
+
+
+def legacy_transform(content, path):
+    content = remove_new_lines_in_paragraph(content)
+    content = replace_local_links(content, "https://haseebmajid.dev")
+    content = replace_youtube_links(content)
+    content = replace_code_meta(content, path)
+    return replace_admonitions(content)
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["tests/data/another.md", "tests/data/example.md", "tests/data/test.md", "tests/data/another_folder/another.md"],
+)
+def test_transform_content_matches_legacy_transforms(path):
+    content = frontmatter.load(path).content
+    assert transform_content(content, path) == legacy_transform(content, path)
+
+
+def test_transform_content_timings():
+    timings = {}
+    content = frontmatter.load("tests/data/another.md").content
+    assert transform_content(content, "tests/data/another.md", timings=timings) == transform_content(
+        content, "tests/data/another.md"
+    )
+    assert {"join_paragraph_lines", "tokenize", "import_code_block", "admonition_to_quote"} <= timings.keys()
+
+
+def test_transform_content_large_article():
+    content = SECTION * 500
+    start = time.perf_counter()
+    transformed = transform_content(content, "tests/data/example.md")
+    assert time.perf_counter() - start < 5
+    assert transformed == legacy_transform(content, "tests/data/example.md")
+
+
+def test_tokenize():
+    tokens = list(tokenize(SECTION))
+    assert "".join(token.text for token in tokens) == SECTION
+    assert [token.groups for token in tokens if token.kind == IMAGE] == [("c", "c.jpg")]
+    assert len([token for token in tokens if token.kind == FENCE]) == 2
@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from markdown_to_devto.walker import IgnoreRules
+from markdown_to_devto.walker import walk_articles
+
+
+def create_tree(root, paths):
+    for path in paths:
+        full_path = root / path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text("")
+
+
+@pytest.mark.parametrize(
+    "pattern, path, is_dir, expected",
+    [
+        ("node_modules/", "node_modules", True, True),
+        ("node_modules/", "a/b/node_modules", True, True),
+        ("node_modules/", "node_modules", False, False),
+        ("/drafts", "drafts", True, True),
+        ("/drafts", "a/drafts", True, False),
+        ("drafts/*.md", "drafts/a.md", False, True),
+        ("drafts/*.md", "drafts/b/a.md", False, False),
+        ("**/tmp", "a/b/tmp", True, True),
+        ("a/**/b.md", "a/x/y/b.md", False, True),
+        ("a/**/b.md", "a/b.md", False, True),
+        ("*.draft.md", "a/b.draft.md", False, True),
+        ("post-[0-9].md", "post-1.md", False, True),
+        ("post-[!0-9].md", "post-1.md", False, False),
+    ],
+)
+def test_ignore_rules(pattern, path, is_dir, expected):
+    assert IgnoreRules([pattern]).is_ignored(path, is_dir) == expected
+
+
+def test_ignore_rules_negation():
+    rules = IgnoreRules(["drafts/*.md", "!drafts/ready.md"])
+    assert rules.is_ignored("drafts/wip.md", is_dir=False)
+    assert not rules.is_ignored("drafts/ready.md", is_dir=False)
+
+
+def test_walk_articles(tmp_path):
+    create_tree(
+        tmp_path,
+        [
+            "a.md",
+            "b.txt",
+            "drafts/wip.md",
+            "drafts/ready.md",
+            "node_modules/pkg/README.md",
+            "series/part-1.md",
+            "series/.history/part-1.md",
+        ],
+    )
+    (tmp_path / ".devtoignore").write_text("# Comment\nnode_modules/\n\ndrafts/*.md\n!drafts/ready.md\n")
+
+    paths = walk_articles(str(tmp_path), ignore_folders=[".history"])
+    relative_paths = [os.path.relpath(path, tmp_path) for path in paths]
+    assert relative_paths == ["a.md", "drafts/ready.md", "series/part-1.md"]
+
+
+def test_walk_articles_prunes_ignored_folders(tmp_path, mocker):
+    create_tree(tmp_path, ["a.md", "node_modules/a/b/c.md"])
+    scandir = mocker.spy(os, "scandir")
+
+    assert list(walk_articles(str(tmp_path), ignore_patterns=["node_modules"])) == [tmp_path / "a.md"]
+    assert scandir.call_count == 1
@@ -0,0 +1,90 @@
+import os
+
+import pytest
+
+from markdown_to_devto.cli import get_article_paths
+from markdown_to_devto.cli import get_local_articles
+from markdown_to_devto.cli import watch_articles
+from markdown_to_devto.watcher import FileWatcher
+
+ARTICLE = """---
+title: {title}
+tags: [python]
+cover_image: cover.png
+---
+
+```python file=./{code_file}
+
+```
+"""
+
+
+class FakeWatcher:
+    def __init__(self, changes):
+        self.changes = changes
+        self.watched_files = []
+
+    def watch(self, folders=(), files=()):
+        self.watched_files = sorted(files)
+
+    def get_changes(self, timeout=None):
+        if not self.changes:
+            raise KeyboardInterrupt
+        return {os.path.realpath(path) for path in self.changes.pop(0)}
+
+
+def test_file_watcher_polling_debounces_changes(tmp_path):
+    article = tmp_path / "a.md"
+    article.write_text("a")
+    code_file = tmp_path / "code" / "main.py"
+    code_file.parent.mkdir()
+    code_file.write_text("import os")
+    file_watcher = FileWatcher(debounce=0.3, poll_interval=0.05, polling=True)
+    file_watcher.watch(folders=[str(tmp_path)], files=[str(code_file)])
+
+    try:
+        assert file_watcher.get_changes(timeout=0.2) == set()
+        article.write_text("ab")
+        code_file.write_text("import sys")
+        (tmp_path / "b.md").write_text("b")
+        changes = file_watcher.get_changes(timeout=5)
+    finally:
+        file_watcher.close()
+
+    expected_paths = [article, code_file, tmp_path / "b.md"]
+    assert changes == {os.path.realpath(path) for path in expected_paths}
+
+
+def test_file_watcher_polling_skips_ignored_folders(tmp_path):
+    for folder in ["drafts", "node_modules", "published"]:
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "a.md").write_text("a")
+    file_watcher = FileWatcher(polling=True, ignore_folders=("drafts/",), ignore_patterns=("node_modules/",))
+    file_watcher.folders = frozenset([os.path.realpath(tmp_path)])
+
+    _, snapshot = file_watcher._snapshot()
+    assert list(snapshot) == [os.path.join(os.path.realpath(tmp_path), "published", "a.md")]
+
+
+def test_watch_articles_publishes_affected_articles(tmp_path, mocker):
+    for name in "abc":
+        (tmp_path / f"{name}.py").write_text(name)
+    (tmp_path / "a.md").write_text(ARTICLE.format(title="A", code_file="a.py"))
+    (tmp_path / "b.md").write_text(ARTICLE.format(title="B", code_file="b.py"))
+    get_paths = lambda: get_article_paths(None, str(tmp_path), [])  # noqa: E731
+    local_articles = get_local_articles(get_paths())
+    publish = mocker.Mock()
+
+    (tmp_path / "b.py").write_text("bb")
+    (tmp_path / "c.md").write_text(ARTICLE.format(title="C", code_file="c.py"))
+    file_watcher = FakeWatcher(
+        [[tmp_path / "a.md"], [tmp_path / "b.py", tmp_path / "c.md"], [tmp_path / "cover.png"], [tmp_path / "b.md"]]
+    )
+    (tmp_path / "a.md").unlink()
+    with pytest.raises(KeyboardInterrupt):
+        watch_articles(file_watcher, get_paths, local_articles, publish, folders=[str(tmp_path)])
+
+    published = [sorted(call[0][0]) for call in publish.call_args_list]
+    assert published == [["B", "C"], ["B", "C"]]
+    assert os.path.realpath(tmp_path / "c.py") in file_watcher.watched_files
+    assert os.path.realpath(tmp_path / "a.py") not in file_watcher.watched_files